@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+bench_buffer.py - benchmark standard library batch resolution of buffers, compared with one TimeZoneSolar per point
+
+usage:
+    python benchmarks/bench_buffer.py
+"""
+
+import random
+from array import array
+import bench_utils
+from timezone_solar import TimeZoneSolar
+
+# number of points in each batch
+NUM_ROWS = 100_000
+
+
+def main():
+    """run buffer batch benchmarks"""
+    rng = random.Random(1)
+    lon = array("d", (rng.uniform(-180, 180) for _ in range(NUM_ROWS)))
+    lat = array("d", (rng.uniform(-90, 90) for _ in range(NUM_ROWS)))
+    index_out = array("H", bytes(2 * NUM_ROWS))
+    offset_out = array("h", bytes(2 * NUM_ROWS))
+
+    def loop():
+        for row in range(NUM_ROWS):
+            zone = TimeZoneSolar(longitude=lon[row], latitude=lat[row])
+            index_out[row] = zone.zone_index
+            offset_out[row] = zone.offset_min
+
+    bench_utils.report("TimeZoneSolar per point", bench_utils.throughput(loop, ops_per_call=NUM_ROWS))
+    bench_utils.report(
+        "resolve_buffer() lon+lat",
+        bench_utils.throughput(
+            lambda: TimeZoneSolar.resolve_buffer(lon, lat, index_out=index_out, offset_out=offset_out),
+            ops_per_call=NUM_ROWS,
+        ),
+    )
+    bench_utils.report(
+        "resolve_buffer() lon",
+        bench_utils.throughput(
+            lambda: TimeZoneSolar.resolve_buffer(lon, index_out=index_out, offset_out=offset_out),
+            ops_per_call=NUM_ROWS,
+        ),
+    )
+    packed = lon.tobytes()
+    bench_utils.report(
+        "resolve_buffer() packed bytes lon",
+        bench_utils.throughput(
+            lambda: TimeZoneSolar.resolve_buffer(packed, index_out=index_out), ops_per_call=NUM_ROWS
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
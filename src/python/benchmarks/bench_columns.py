@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""benchmark of resolving memory-mapped binary column files, with peak memory use"""
+
+import os
+import tempfile
+import tracemalloc
+import numpy as np
+import bench_utils
+from timezone_solar.tzscolumns import resolve_columns
+
+# constants
+NUM_ROWS = 20_000_000
+
+
+def main():
+    """run benchmarks"""
+    rng = np.random.default_rng(1)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        lon_path = os.path.join(tmpdirname, "lon.f64")
+        lat_path = os.path.join(tmpdirname, "lat.f64")
+        offset_path = os.path.join(tmpdirname, "offset.i16")
+        index_path = os.path.join(tmpdirname, "index.u16")
+        rng.uniform(-180, 180, NUM_ROWS).tofile(lon_path)
+        rng.uniform(-90, 90, NUM_ROWS).tofile(lat_path)
+
+        bench_utils.report(
+            "resolve_columns lon+lat → offset+index",
+            bench_utils.throughput(
+                lambda: resolve_columns(lon_path, lat_path, offset_path, index_path),
+                ops_per_call=NUM_ROWS, repeat=3, min_time=0,
+            ),
+        )
+        tracemalloc.start()
+        resolve_columns(lon_path, lat_path, offset_path, index_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        input_mb = 2 * NUM_ROWS * 8 / 1e6
+        print(f"{NUM_ROWS:,} rows ({input_mb:,.0f} MB input): peak traced memory {peak / 1e6:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+bench_construct.py - benchmark single-object TimeZoneSolar construction throughput, and float and int coordinate
+checks compared with the decimal text pattern check they replaced
+
+usage:
+    python benchmarks/bench_construct.py
+"""
+
+import bench_utils
+from timezone_solar import TimeZoneSolar
+from timezone_solar.timezone_solar import _NUMERIC_RE
+from timezone_solar.tzstable import define_family
+
+# 5-minute zone family for the defined family case
+define_family("min05", 5)
+
+# construction cases: label and keyword parameters
+CASES = [
+    ("longitude, hour tz", {"longitude": -122.597, "use_lon_tz": False}),
+    ("longitude, longitude tz", {"longitude": -122.597, "use_lon_tz": True}),
+    ("longitude, narrow tz", {"longitude": -122.597, "use_narrow": True}),
+    ("longitude, 5-minute tz", {"longitude": -122.597, "tz_type": "min05"}),
+    ("longitude+latitude, hour tz", {"longitude": -122.597, "latitude": 45.589, "use_lon_tz": False}),
+    ("polar latitude, hour tz", {"longitude": -122.597, "latitude": 85.0, "use_lon_tz": False}),
+    ("integer longitude, hour tz", {"longitude": 135, "use_lon_tz": False}),
+    ("date line, longitude tz", {"longitude": -179.99, "use_lon_tz": True}),
+    ("text longitude, hour tz", {"longitude": "-122.597", "use_lon_tz": False}),
+]
+
+# coordinate check cases: label and longitude
+COORD_CASES = [
+    ("float", -122.597),
+    ("int", 135),
+]
+
+
+def _check_coord_text(value, limit: float, label: str) -> float:
+    """baseline coordinate check of every type by its decimal text, as before the arithmetic fast path"""
+    if not _NUMERIC_RE.fullmatch(str(value)):
+        raise ValueError(f"_tz_params: {label} {value}")
+    value = float(value)
+    if abs(value) > limit:
+        raise ValueError(f"_tz_params: {label} must be in the range -{limit:g} to +{limit:g}")
+    return value
+
+
+def main():
+    """run construction benchmarks"""
+    for label, params in CASES:
+        ops = bench_utils.throughput(lambda params=params: TimeZoneSolar(**params))
+        bench_utils.report(f"construct by {label}", ops)
+
+    check_coord = TimeZoneSolar._check_coord  # pylint: disable=protected-access
+    for label, value in COORD_CASES:
+        base_ops = bench_utils.throughput(lambda value=value: _check_coord_text(value, 180.0, "longitude"))
+        ops = bench_utils.throughput(lambda value=value: check_coord(value, 180.0, "longitude"))
+        bench_utils.report(f"check {label}, text pattern baseline", base_ops)
+        bench_utils.report(f"check {label}, fast path {ops / base_ops:.1f}x", ops)
+
+
+if __name__ == "__main__":
+    main()
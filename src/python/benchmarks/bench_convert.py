@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+bench_convert.py - benchmark converting wall-clock times between solar time zones, in batches and with astimezone()
+
+usage:
+    python benchmarks/bench_convert.py
+"""
+
+from datetime import datetime, timezone
+import numpy as np
+import bench_utils
+from timezone_solar import TimeZoneSolar
+from timezone_solar import tzsarray
+
+# number of times converted in a batch, and one at a time with astimezone()
+NUM_TIMES = 1_000_000
+NUM_TIMES_LOOP = 50_000
+
+
+def main():
+    """run conversion benchmarks"""
+    rng = np.random.default_rng(1)
+    num_zones = len(tzsarray.offset_delta_matrix())
+    local = rng.integers(1_600_000_000, 1_800_000_000, NUM_TIMES).astype("datetime64[s]")
+    from_ids = rng.integers(0, num_zones, NUM_TIMES)
+    to_ids = rng.integers(0, num_zones, NUM_TIMES)
+
+    # the same conversions as aware datetimes, for the astimezone() loop
+    zones = [TimeZoneSolar(tzname=name) for name in ("West08", "Lon122W", "East0530", "East00")]
+    stamps = [
+        datetime.fromtimestamp(int(stamp), tz=timezone.utc).astimezone(zones[num % len(zones)])
+        for num, stamp in enumerate(local[:NUM_TIMES_LOOP].astype(np.int64).tolist())
+    ]
+
+    def loop():
+        for num, stamp in enumerate(stamps):
+            stamp.astimezone(zones[(num + 1) % len(zones)])
+
+    bench_utils.report("astimezone() per time", bench_utils.throughput(loop, ops_per_call=NUM_TIMES_LOOP))
+    bench_utils.report(
+        "convert() zone ids",
+        bench_utils.throughput(lambda: tzsarray.convert(local, from_ids, to_ids), ops_per_call=NUM_TIMES),
+    )
+    bench_utils.report(
+        "convert() one zone to one zone",
+        bench_utils.throughput(lambda: tzsarray.convert(local, "West08", "Lon122W"), ops_per_call=NUM_TIMES),
+    )
+
+
+if __name__ == "__main__":
+    main()
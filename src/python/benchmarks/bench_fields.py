@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+bench_fields.py - benchmark reading the CLI output fields of records, with get() per field and with field_getter()
+
+usage:
+    python benchmarks/bench_fields.py
+"""
+
+import random
+import bench_utils
+from timezone_solar import TimeZoneSolar
+
+# fields of the CLI --get option
+CLI_FIELDS = (
+    "longitude", "latitude", "name", "long_name", "short_name", "offset", "offset_min", "offset_sec", "is_utc",
+)
+
+# number of records in each run
+NUM_ROWS = 50_000
+
+
+def main():
+    """run field access benchmarks"""
+    rng = random.Random(1)
+    locations = [
+        TimeZoneSolar.locate(longitude=rng.uniform(-180, 180), latitude=rng.uniform(-90, 90)) for _ in range(NUM_ROWS)
+    ]
+    zones = [location.zone for location in locations]
+    ops_per_call = NUM_ROWS * len(CLI_FIELDS)
+
+    def loop_get(records):
+        for record in records:
+            [str(record.get(field)) for field in CLI_FIELDS]
+
+    get_text = TimeZoneSolar.field_getter(*CLI_FIELDS, text=True)
+
+    def loop_getter(records):
+        for record in records:
+            get_text(record)
+
+    for label, records in (("zone", zones), ("location", locations)):
+        bench_utils.report(f"get() per field, {label}",
+                           bench_utils.throughput(lambda records=records: loop_get(records), ops_per_call))
+        bench_utils.report(f"field_getter(), {label}",
+                           bench_utils.throughput(lambda records=records: loop_getter(records), ops_per_call))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+bench_http.py - load test of the HTTP lookup server with keep-alive client connections, with and without coalescing
+
+usage:
+    python benchmarks/bench_http.py [connections] [requests-per-connection]
+"""
+
+import asyncio
+import statistics
+import sys
+import threading
+import time
+import bench_utils  # noqa: F401 - sets the module path
+from timezone_solar.tzshttp import LookupServer
+
+# default load
+DEFAULT_CONNECTIONS = 32
+DEFAULT_REQUESTS = 300
+
+# number of load runs for each server setting, of which the fastest is reported, after one warm-up run
+LOAD_RUNS = 3
+
+
+class _ServerThread:
+    """lookup server running in a thread with its own event loop"""
+
+    def __init__(self, coalesce: bool):
+        self.lookup_server = LookupServer(coalesce=coalesce)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.server = self._call(self.lookup_server.start("127.0.0.1", 0))
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def _call(self, coro):
+        """run a coroutine in the server thread and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def _stop(self):
+        """stop listening and wait for connection handlers to finish"""
+        self.server.close()
+        self.lookup_server.close_connections()
+        while self.lookup_server.writers:
+            await asyncio.sleep(0.001)
+
+    def stop(self) -> None:
+        """stop the server and its thread"""
+        self._call(self._stop())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+async def _client(port: int, requests: int, num: int, latencies: list) -> None:
+    """send requests one after another on a keep-alive connection, recording latencies"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for req in range(requests):
+        longitude = (num * 31 + req * 7) % 360 - 180
+        start = time.perf_counter()
+        writer.write(f"GET /lookup?longitude={longitude}&get=short_name,offset HTTP/1.1\r\n\r\n".encode("latin-1"))
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def _load(port: int, connections: int, requests: int) -> tuple:
+    """run concurrent clients, returning elapsed seconds and latencies in milliseconds"""
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(port, requests, num, latencies) for num in range(connections)))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    """run load tests"""
+    connections = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CONNECTIONS
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_REQUESTS
+    for coalesce in (False, True):
+        server = _ServerThread(coalesce)
+        asyncio.run(_load(server.port, connections, requests))
+        elapsed, latencies = min(
+            (asyncio.run(_load(server.port, connections, requests)) for _ in range(LOAD_RUNS)), key=lambda run: run[0]
+        )
+        server.stop()
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(f"coalesce={coalesce!s:<5} {connections} connections: {len(latencies) / elapsed:>10,.0f} req/sec  "
+              f"p50 {quantiles[49]:.2f} ms  p99 {quantiles[98]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""benchmark of converting UTC epoch times to local solar wall-clock fields, vectorized and per record"""
+
+from datetime import datetime
+import numpy as np
+import bench_utils
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzsarray import epoch_to_local, local_fields
+
+# constants
+NUM_ROWS = 1_000_000
+NUM_ROWS_LOOP = 20_000
+
+
+def main():
+    """run benchmarks"""
+    rng = np.random.default_rng(1)
+    epoch = rng.integers(0, 2_000_000_000, NUM_ROWS)
+    lon = rng.uniform(-180, 180, NUM_ROWS)
+    zone_index = TimeZoneSolar.resolve_array(lon)["zone_index"]
+    epoch_list = epoch[:NUM_ROWS_LOOP].tolist()
+    lon_list = lon[:NUM_ROWS_LOOP].tolist()
+
+    def loop():
+        for epoch_s, longitude in zip(epoch_list, lon_list):
+            dt_local = datetime.fromtimestamp(epoch_s, tz=TimeZoneSolar(longitude=longitude))
+            (dt_local.year, dt_local.month, dt_local.day, dt_local.hour, dt_local.minute)
+
+    bench_utils.report("datetime per record", bench_utils.throughput(loop, ops_per_call=NUM_ROWS_LOOP))
+    bench_utils.report(
+        "epoch_to_local from longitude",
+        bench_utils.throughput(lambda: epoch_to_local(epoch, lon), ops_per_call=NUM_ROWS),
+    )
+    bench_utils.report(
+        "epoch_to_local from zone index",
+        bench_utils.throughput(lambda: epoch_to_local(epoch, zone_index=zone_index), ops_per_call=NUM_ROWS),
+    )
+    bench_utils.report(
+        "epoch_to_local + local_fields",
+        bench_utils.throughput(lambda: local_fields(epoch_to_local(epoch, lon)), ops_per_call=NUM_ROWS),
+    )
+
+
+if __name__ == "__main__":
+    main()
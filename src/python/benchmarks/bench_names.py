@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+bench_names.py - benchmark TimeZoneSolar lookups by time zone name, one at a time and in bulk
+
+usage:
+    python benchmarks/bench_names.py
+"""
+
+import bench_utils
+from timezone_solar import TimeZoneSolar
+
+# single-name cases: label and time zone name
+CASES = [
+    ("hour tz name", "West08"),
+    ("longitude tz name", "Lon122W"),
+    ("lower-case name", "west08"),
+    ("Solar/ prefixed name", "Solar/East0815"),
+]
+
+# names for bulk lookups, as they might repeat in deserialized records
+BULK_NAMES = ["West08", "Lon122W", "East0100", "West05", "Lon000E", "East12"] * 10000
+
+
+def main():
+    """run name lookup benchmarks"""
+    for label, name in CASES:
+        ops = bench_utils.throughput(lambda name=name: TimeZoneSolar(tzname=name))
+        bench_utils.report(f"construct by {label}", ops)
+    ops = bench_utils.throughput(lambda: [TimeZoneSolar(tzname=name) for name in BULK_NAMES], len(BULK_NAMES))
+    bench_utils.report("construct loop over names", ops)
+    ops = bench_utils.throughput(lambda: TimeZoneSolar.resolve_names(BULK_NAMES), len(BULK_NAMES))
+    bench_utils.report("resolve_names", ops)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+bench_parallel.py - benchmark parallel batch lookups from an input file, by number of worker processes
+
+usage:
+    python benchmarks/bench_parallel.py
+"""
+
+import os
+import random
+import tempfile
+import bench_utils
+from timezone_solar.tzsparallel import parallel_batch
+
+# constants
+NUM_ROWS = 200_000
+WORKER_COUNTS = [1, 2, 4, 8]
+FIELDS = ["short_name", "offset", "longitude", "latitude"]
+CHUNK_SIZE = 1 << 18
+
+
+def main():
+    """run parallel batch benchmarks"""
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, "input.csv")
+        with open(path, "w", encoding="utf-8") as infile:
+            for _ in range(NUM_ROWS):
+                infile.write(f"{rng.uniform(-180, 180):.5f},{rng.uniform(-90, 90):.5f}\n")
+        print(f"{NUM_ROWS} input rows, {os.path.getsize(path)} bytes, {os.cpu_count()} CPU(s)")
+        with open(os.devnull, "w", encoding="utf-8") as outfile:
+            for workers in WORKER_COUNTS:
+                bench_utils.report(
+                    f"parallel_batch {workers} worker(s)",
+                    bench_utils.throughput(
+                        lambda workers=workers: parallel_batch(
+                            path, outfile, FIELDS, workers=workers, chunk_size=CHUNK_SIZE
+                        ),
+                        ops_per_call=NUM_ROWS, repeat=3, min_time=0,
+                    ),
+                )
+
+
+if __name__ == "__main__":
+    main()
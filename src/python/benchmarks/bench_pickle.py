@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+bench_pickle.py - benchmark pickling time zones, locations and aware datetimes, as sent to worker processes
+
+usage:
+    python benchmarks/bench_pickle.py
+"""
+
+import pickle
+import random
+from datetime import datetime, timezone
+import bench_utils
+from timezone_solar import TimeZoneSolar
+
+# number of records in each payload
+NUM_RECORDS = 10_000
+
+
+def main():
+    """run pickling benchmarks"""
+    rng = random.Random(1)
+    locations = [
+        TimeZoneSolar.locate(longitude=rng.uniform(-180, 180), latitude=rng.uniform(-90, 90), use_lon_tz=True)
+        for _ in range(NUM_RECORDS)
+    ]
+    aware = [
+        datetime.fromtimestamp(rng.randrange(1_600_000_000, 1_800_000_000), tz=timezone.utc).astimezone(location.zone)
+        for location in locations
+    ]
+    zone = TimeZoneSolar(tzname="West08")
+    print(f"one time zone: {len(pickle.dumps(zone))} bytes")
+
+    for label, payload in (("time zone", [zone]), ("locations", locations), ("aware datetimes", aware)):
+        data = pickle.dumps(payload)
+        print(f"{len(payload)} {label}: {len(data):,} bytes")
+        bench_utils.report(f"dumps() {label}",
+                           bench_utils.throughput(lambda payload=payload: pickle.dumps(payload), len(payload)))
+        bench_utils.report(f"loads() {label}",
+                           bench_utils.throughput(lambda data=data: pickle.loads(data), len(payload)))
+
+
+if __name__ == "__main__":
+    main()
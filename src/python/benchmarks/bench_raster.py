@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+bench_raster.py - benchmark zone lookups for map pixels from a memory-mapped raster and from TimeZoneSolar
+
+usage:
+    python benchmarks/bench_raster.py [cells-per-degree]
+"""
+
+import os
+import sys
+import tempfile
+import numpy as np
+import bench_utils
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzsraster import open_raster, write_raster
+
+# map image size for per-pixel lookups, and the number of pixels looked up one at a time with TimeZoneSolar
+IMAGE_SIZE = (600, 1200)
+NUM_PIXELS_LOOP = 50_000
+
+
+def main():
+    """run raster benchmarks"""
+    per_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "raster.bin")
+        build_time = bench_utils.best_time(lambda: write_raster(path, per_degree, use_narrow=True), repeat=3)
+        open_time = bench_utils.best_time(lambda: open_raster(path))
+        raster = open_raster(path)
+        rows, cols = raster.cells.shape
+        print(f"{rows} by {cols} narrow raster: built in {build_time:.3f} s, {os.path.getsize(path):,} bytes, "
+              f"opened in {open_time * 1e6:.0f} us")
+
+        # pixel centers of a map image, as longitude and latitude
+        height, width = IMAGE_SIZE
+        lon = np.broadcast_to((np.arange(width) + 0.5) * 360.0 / width - 180.0, IMAGE_SIZE)
+        lat = np.broadcast_to(90.0 - (np.arange(height) + 0.5) * 180.0 / height, (width, height)).T
+        pixels = list(zip(lon.ravel()[::7][:NUM_PIXELS_LOOP].tolist(), lat.ravel()[::7][:NUM_PIXELS_LOOP].tolist()))
+
+        def loop():
+            for longitude, latitude in pixels:
+                TimeZoneSolar(longitude=longitude, latitude=latitude, use_narrow=True).zone_index
+
+        def loop_raster():
+            cells, scale = raster.cells, raster.per_degree
+            for longitude, latitude in pixels:
+                cells[min(int((90.0 - latitude) * scale), rows - 1), min(int((longitude + 180.0) * scale), cols - 1)]
+
+        bench_utils.report("TimeZoneSolar per pixel", bench_utils.throughput(loop, ops_per_call=len(pixels)))
+        bench_utils.report("raster cell per pixel", bench_utils.throughput(loop_raster, ops_per_call=len(pixels)))
+        bench_utils.report(
+            "raster index_at() for an image",
+            bench_utils.throughput(lambda: raster.index_at(lon, lat), ops_per_call=lon.size),
+        )
+        bench_utils.report(
+            "resolve_array() for an image",
+            bench_utils.throughput(
+                lambda: TimeZoneSolar.resolve_array(lon, lat, use_narrow=True), ops_per_call=lon.size
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+bench_suite.py - run the timezone_solar benchmark suite, with JSON results and comparison to a saved baseline
+
+usage:
+    python benchmarks/bench_suite.py [--quick] [--only=pattern ...] [--output=results.json]
+    python benchmarks/bench_suite.py --baseline=baseline.json [--threshold=percent]
+        [--threshold-for=pattern=percent ...]
+
+Each result has a value, a unit and whether higher or lower values are better:
+* ops/sec (higher is better): library throughput
+* sec (lower is better): tzdata generation and CLI cold start, the fastest of several runs
+* bytes (lower is better): peak memory allocated by Python during large batches, from tracemalloc
+
+With --baseline, results are compared with a JSON file saved from an earlier run. A result is a regression if it is
+worse than the baseline by more than its threshold, in percent. Thresholds default to --threshold, and
+--threshold-for sets them for benchmark names matching a shell-style pattern such as "cli/*". The comparison is
+printed on standard error, and the exit status is 1 if there were any regressions.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+import bench_utils
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzsbatch import stream_batch
+from timezone_solar.tzsdata import tzif_bytes
+from timezone_solar.tzstable import TZ_TYPE_PARAMS
+
+# paths used by CLI benchmarks
+SRC_DIR = Path(__file__).resolve().parent.parent
+LON_TZ = SRC_DIR / "scripts" / "lon_tz.py"
+
+# default regression threshold in percent
+DEFAULT_THRESHOLD = 15.0
+
+# which direction is better for each unit
+UNIT_BETTER = {"ops/sec": "higher", "sec": "lower", "bytes": "lower"}
+
+# fields of the CLI --get option
+CLI_FIELDS = [
+    "longitude", "latitude", "name", "long_name", "short_name", "offset", "offset_min", "offset_sec", "is_utc",
+]
+
+# test data
+LONGITUDE = -122.597
+LATITUDE = 45.589
+DT_UTC = datetime(2023, 1, 3, 12, 0, tzinfo=timezone.utc)
+
+# sizes of large batches for full and --quick runs
+BATCH_ROWS = {False: 200_000, True: 20_000}
+
+
+class _NullWriter:
+    """text output stream which discards what is written, so batch output isn't counted in memory use"""
+
+    def write(self, text: str) -> int:
+        """discard text"""
+        return len(text)
+
+    def writelines(self, lines) -> None:
+        """discard lines"""
+        for _ in lines:
+            pass
+
+    def flush(self) -> None:
+        """nothing to flush"""
+
+
+def _batch_lines(rows: int):
+    """generate batch input lines of longitude and latitude"""
+    for num in range(rows):
+        yield f"{(num * 0.0137) % 360 - 180:.4f},{num % 170 - 85}\n"
+
+
+def _run_cli(*args: str) -> None:
+    """run lon_tz.py in a new Python process, discarding its output"""
+    subprocess.run(
+        [sys.executable, str(LON_TZ), *args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+    )
+
+
+def _benchmarks(quick: bool) -> list:
+    """
+    list the benchmarks in the suite
+
+    output: list of (name, unit, function) where the function runs the benchmark and returns its value
+    """
+    repeat = 3 if quick else bench_utils.DEFAULT_REPEAT
+    min_time = 0.05 if quick else bench_utils.DEFAULT_MIN_TIME
+    rows = BATCH_ROWS[quick]
+
+    def ops(func, ops_per_call=1):
+        return lambda: bench_utils.throughput(func, ops_per_call, repeat, min_time)
+
+    benchmarks = []
+    for tz_type, tz_params in TZ_TYPE_PARAMS.items():
+        benchmarks.append((
+            f"construct/longitude/{tz_type}", "ops/sec",
+            ops(lambda tz_params=tz_params: TimeZoneSolar(longitude=LONGITUDE, **tz_params)),
+        ))
+    # decimal text coordinates take the pattern check which floats and ints skip, as a baseline for that fast path
+    benchmarks.append((
+        "construct/longitude-text/hour", "ops/sec", ops(lambda: TimeZoneSolar(longitude=str(LONGITUDE))),
+    ))
+    benchmarks.append((
+        "construct/longitude+latitude/hour", "ops/sec",
+        ops(lambda: TimeZoneSolar(longitude=LONGITUDE, latitude=LATITUDE)),
+    ))
+    for tzname in ("West08", "West0815", "Lon123W"):
+        benchmarks.append((
+            f"construct/name/{tzname}", "ops/sec", ops(lambda tzname=tzname: TimeZoneSolar(tzname=tzname)),
+        ))
+    benchmarks.append(("locate/longitude+latitude", "ops/sec",
+                       ops(lambda: TimeZoneSolar.locate(longitude=LONGITUDE, latitude=LATITUDE))))
+
+    location = TimeZoneSolar.locate(longitude=LONGITUDE, latitude=LATITUDE)
+    for field in CLI_FIELDS:
+        benchmarks.append((f"get/{field}", "ops/sec", ops(lambda field=field: location.get(field))))
+    get_fields = TimeZoneSolar.field_getter(*CLI_FIELDS, text=True)
+    benchmarks.append(("get/field_getter", "ops/sec", ops(lambda: get_fields(location))))
+
+    zone = TimeZoneSolar(longitude=LONGITUDE)
+    dt_solar = DT_UTC.astimezone(zone)
+    benchmarks.append(("tzinfo/utcoffset", "ops/sec", ops(lambda: zone.utcoffset(dt_solar))))
+    benchmarks.append(("tzinfo/astimezone", "ops/sec", ops(lambda: DT_UTC.astimezone(zone))))
+    benchmarks.append(("tzinfo/astimezone_utc", "ops/sec", ops(lambda: dt_solar.astimezone(timezone.utc))))
+
+    all_zones = [zone for tz_params in TZ_TYPE_PARAMS.values() for zone in TimeZoneSolar.zones(**tz_params)]
+    benchmarks.append(("tzdata/tzif_all", "sec",
+                       lambda: bench_utils.best_time(lambda: [tzif_bytes(zone) for zone in all_zones], repeat)))
+    benchmarks.append(("tzdata/tzfile_cli", "sec", lambda: bench_utils.best_time(lambda: _run_cli("--tzfile"), repeat)))
+    benchmarks.append((
+        "cli/cold_start", "sec",
+        lambda: bench_utils.best_time(lambda: _run_cli(f"--longitude={LONGITUDE}", "--get=short_name"), repeat),
+    ))
+
+    fields = ["short_name", "offset"]
+    benchmarks.append((
+        "batch/stream", "ops/sec",
+        lambda: bench_utils.throughput(
+            lambda: stream_batch(_batch_lines(rows), _NullWriter(), fields), rows, repeat, min_time
+        ),
+    ))
+    benchmarks.append((
+        "batch/stream_peak_memory", "bytes",
+        lambda: bench_utils.peak_memory(lambda: stream_batch(_batch_lines(rows), _NullWriter(), fields)),
+    ))
+    names = [zone.short_name for zone in all_zones] * (rows // len(all_zones) + 1)
+    benchmarks.append(("names/resolve_names", "ops/sec",
+                       ops(lambda: TimeZoneSolar.resolve_names(names), len(names))))
+    benchmarks.append(("names/resolve_names_peak_memory", "bytes",
+                       lambda: bench_utils.peak_memory(lambda: TimeZoneSolar.resolve_names(names))))
+    return benchmarks
+
+
+def run_suite(quick: bool = False, patterns: list = None) -> dict:
+    """
+    run the benchmarks whose names match any of the patterns, or all of them
+
+    output: JSON-compatible dictionary of results and the environment they were measured in
+    """
+    results = {}
+    for name, unit, func in _benchmarks(quick):
+        if patterns and not any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+            continue
+        value = func()
+        results[name] = {"value": value, "unit": unit, "better": UNIT_BETTER[unit]}
+        print(f"{name:<40} {_format(value, unit):>16} {unit}", file=sys.stderr)
+    return {
+        "suite": "timezone_solar",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def _format(value: float, unit: str) -> str:
+    """format a result value for its unit"""
+    if unit == "sec":
+        return f"{value:.6f}"
+    return f"{value:,.0f}"
+
+
+def _threshold(name: str, default: float, overrides: list) -> float:
+    """regression threshold for a benchmark name, from the last matching --threshold-for pattern"""
+    threshold = default
+    for pattern, value in overrides:
+        if fnmatch.fnmatchcase(name, pattern):
+            threshold = value
+    return threshold
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD, overrides: list = ()) -> list:
+    """
+    compare suite results with a baseline
+
+    input:
+        current: results of run_suite()
+        baseline: results of an earlier run, as loaded from JSON
+        threshold: default regression threshold in percent
+        overrides: list of (pattern, threshold) for benchmark names matching shell-style patterns
+
+    output: list of dictionaries with name, unit, baseline, current, change and threshold in percent, and
+    regression flag, for benchmarks in both results
+    """
+    comparison = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or base["unit"] != result["unit"] or base["value"] == 0:
+            continue
+        change = (result["value"] - base["value"]) / base["value"] * 100.0
+        worse = -change if result["better"] == "higher" else change
+        limit = _threshold(name, threshold, overrides)
+        comparison.append({
+            "name": name,
+            "unit": result["unit"],
+            "baseline": base["value"],
+            "current": result["value"],
+            "change": change,
+            "threshold": limit,
+            "regression": worse > limit,
+        })
+    return comparison
+
+
+def _parse_override(text: str) -> tuple:
+    """parse a --threshold-for option of pattern=percent"""
+    pattern, sep, value = text.rpartition("=")
+    if not sep or not pattern:
+        raise argparse.ArgumentTypeError(f"expected pattern=percent, got {text}")
+    try:
+        return pattern, float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"threshold must be a number, got {value}") from exc
+
+
+def _gen_arg_parser() -> argparse.ArgumentParser:
+    """generate argparse parser"""
+    parser = argparse.ArgumentParser(description="timezone_solar benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="shorter timing runs and smaller batches")
+    parser.add_argument("--only", action="append", metavar="PATTERN",
+                        help="run benchmarks with names matching a shell-style pattern (repeatable)")
+    parser.add_argument("--output", metavar="FILE", help="write JSON results to a file instead of standard output")
+    parser.add_argument("--baseline", metavar="FILE", help="compare with JSON results saved from an earlier run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, metavar="PERCENT",
+                        help=f"regression threshold in percent (default {DEFAULT_THRESHOLD:g})")
+    parser.add_argument("--threshold-for", type=_parse_override, action="append", default=[],
+                        metavar="PATTERN=PERCENT", help="regression threshold for matching benchmarks (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    return parser
+
+
+def main():
+    """run the benchmark suite"""
+    args = _gen_arg_parser().parse_args()
+    if args.list:
+        for name, unit, _ in _benchmarks(args.quick):
+            print(f"{name} ({unit})")
+        return 0
+
+    # load the baseline first, so a bad file is reported before a long run
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as infile:
+            baseline = json.load(infile)
+
+    results = run_suite(args.quick, args.only)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as outfile:
+            json.dump(results, outfile, indent=2)
+            outfile.write("\n")
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if baseline is None:
+        return 0
+    comparison = compare(results, baseline, args.threshold, args.threshold_for)
+    regressions = 0
+    print(f"\n{'benchmark':<40} {'baseline':>14} {'current':>14} {'change':>9}", file=sys.stderr)
+    for item in comparison:
+        status = "REGRESSION" if item["regression"] else ""
+        regressions += item["regression"]
+        baseline_text = _format(item["baseline"], item["unit"])
+        current_text = _format(item["current"], item["unit"])
+        print(f"{item['name']:<40} {baseline_text:>14} {current_text:>14} {item['change']:>+8.1f}% {status}",
+              file=sys.stderr)
+    print(f"{regressions} regression(s) in {len(comparison)} compared benchmark(s)", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+bench_sun.py - benchmark daily solar noon, sunrise and sunset tables, for all sites in one call and one site at a time
+
+usage:
+    python benchmarks/bench_sun.py [sites]
+"""
+
+import sys
+import numpy as np
+import bench_utils
+from timezone_solar.tzssun import sun_table
+
+# a year of days
+DATES = np.arange(np.datetime64("2025-01-01"), np.datetime64("2026-01-01"))
+
+# number of sites tabulated one at a time
+NUM_SITES_LOOP = 100
+
+
+def main():
+    """run sun table benchmarks"""
+    num_sites = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = np.random.default_rng(1)
+    lon = rng.uniform(-180, 180, num_sites)
+    lat = rng.uniform(-70, 70, num_sites)
+    days = len(DATES)
+
+    def loop():
+        for site in range(NUM_SITES_LOOP):
+            sun_table(lon[site], lat[site], DATES, use_lon_tz=True)
+
+    bench_utils.report("sun_table() one site at a time",
+                       bench_utils.throughput(loop, ops_per_call=NUM_SITES_LOOP * days))
+    bench_utils.report(f"sun_table() {num_sites} sites",
+                       bench_utils.throughput(lambda: sun_table(lon, lat, DATES, use_lon_tz=True),
+                                              ops_per_call=num_sites * days))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+bench_threads.py - benchmark TimeZoneSolar lookup throughput from a thread pool with 1 thread up to the core count
+
+Throughput only scales with threads on a free-threaded (no-GIL) Python build, such as python3.13t.
+With a global interpreter lock, the results show the cost of sharing one core between threads instead.
+
+usage:
+    python benchmarks/bench_threads.py [max-threads]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import bench_utils  # noqa: F401 - sets the module path
+from timezone_solar import TimeZoneSolar
+
+# lookups per task, and tasks per thread in each run
+TASK_LOOKUPS = 20_000
+TASKS_PER_THREAD = 4
+
+# number of runs at each thread count, of which the fastest is reported
+RUNS = 3
+
+
+def _task(num: int) -> int:
+    """look up time zones by longitude and name and read a field, as a thread pool task"""
+    count = 0
+    for step in range(TASK_LOOKUPS):
+        longitude = (num * 7919 + step * 0.37) % 360 - 180
+        zone = TimeZoneSolar(longitude=longitude, latitude=45.589)
+        if TimeZoneSolar(tzname=zone.short_name) is zone and zone.get("offset"):
+            count += 1
+    return count
+
+
+def _run(threads: int) -> float:
+    """run tasks on a thread pool, returning lookups per second"""
+    tasks = threads * TASKS_PER_THREAD
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        done = sum(executor.map(_task, range(tasks)))
+        elapsed = time.perf_counter() - start
+    if done != tasks * TASK_LOOKUPS:
+        raise RuntimeError(f"expected {tasks * TASK_LOOKUPS} lookups, got {done}")
+    return done / elapsed
+
+
+def main():
+    """run thread scaling benchmarks"""
+    cpus = os.cpu_count() or 1
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else cpus
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True  # pylint: disable=protected-access
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {cpus} CPU(s)")
+    base = None
+    for threads in sorted({min(1 << power, max_threads) for power in range(max_threads.bit_length() + 1)}):
+        ops = max(_run(threads) for _ in range(RUNS))
+        base = base or ops
+        print(f"{threads:>3} thread(s) {ops:>14,.0f} lookups/sec  speedup {ops / base:5.2f}x  "
+              f"efficiency {ops / base / threads:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+bench_timezone_repr.py - compare astimezone() cost for TimeZoneSolar and its C-backed equivalents
+
+The zoneinfo.ZoneInfo representation is loaded from zoneinfo.TZPATH if the Solar time zones are installed there,
+otherwise from TZif data generated in memory.
+
+usage:
+    python benchmarks/bench_timezone_repr.py
+"""
+
+from datetime import datetime, timezone
+import bench_utils
+from timezone_solar import TimeZoneSolar
+
+# test data
+TZ = TimeZoneSolar(longitude=-122.597, use_lon_tz=False)
+DT_UTC = datetime(2023, 1, 3, 12, 0, tzinfo=timezone.utc)
+
+
+def bench_repr(label: str, tz_repr) -> None:
+    """run astimezone() benchmarks for one time zone representation"""
+    dt_local = DT_UTC.astimezone(tz_repr)
+    bench_utils.report(f"{label}: astimezone() from UTC", bench_utils.throughput(lambda: DT_UTC.astimezone(tz_repr)))
+    bench_utils.report(
+        f"{label}: astimezone() to UTC", bench_utils.throughput(lambda: dt_local.astimezone(timezone.utc))
+    )
+
+
+def main():
+    """run time zone representation benchmarks"""
+    bench_repr("TimeZoneSolar", TZ)
+    bench_repr("datetime.timezone", TZ.as_fixed_timezone())
+    bench_repr("zoneinfo.ZoneInfo", TZ.as_zoneinfo())
+
+
+if __name__ == "__main__":
+    main()
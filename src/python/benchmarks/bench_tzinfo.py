@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+bench_tzinfo.py - benchmark datetime.tzinfo methods of TimeZoneSolar in datetime operations
+
+usage:
+    python benchmarks/bench_tzinfo.py
+"""
+
+from datetime import datetime, timezone
+import bench_utils
+from timezone_solar import TimeZoneSolar
+
+# test data
+TZ = TimeZoneSolar(longitude=-122.597, use_lon_tz=False)
+DT_UTC = datetime(2023, 1, 3, 12, 0, tzinfo=timezone.utc)
+DT_SOLAR = DT_UTC.astimezone(TZ)
+
+
+def main():
+    """run tzinfo benchmarks"""
+    bench_utils.report("utcoffset()", bench_utils.throughput(lambda: DT_SOLAR.utcoffset()))
+    bench_utils.report("dst()", bench_utils.throughput(lambda: DT_SOLAR.dst()))
+    bench_utils.report("tzname()", bench_utils.throughput(lambda: DT_SOLAR.tzname()))
+    bench_utils.report("astimezone() from UTC", bench_utils.throughput(lambda: DT_UTC.astimezone(TZ)))
+    bench_utils.report("astimezone() to UTC", bench_utils.throughput(lambda: DT_SOLAR.astimezone(timezone.utc)))
+    bench_utils.report("datetime.now(tz)", bench_utils.throughput(lambda: datetime.now(TZ)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""timing utilities for timezone_solar benchmarks"""
+
+import sys
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# run from the source tree without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# defaults for timing runs
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.2
+
+
+def throughput(func, ops_per_call: int = 1, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> float:
+    """
+    measure throughput of a function in operations per second
+
+    input:
+        func: function with no arguments to time
+        ops_per_call: number of operations performed by each call of func
+        repeat: number of timing runs, of which the fastest is used
+        min_time: minimum time in seconds for each timing run
+
+    output: operations per second in the fastest timing run
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    while number * timer.timeit(1) < min_time:
+        number *= 2
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number * ops_per_call / best
+
+
+def best_time(func, repeat: int = DEFAULT_REPEAT) -> float:
+    """
+    measure the time of a long-running function, such as a subprocess or file generation
+
+    output: seconds taken by the fastest of repeat calls
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(func) -> int:
+    """
+    measure peak memory allocated by Python while a function runs
+
+    output: peak traced memory in bytes, from tracemalloc
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def report(label: str, ops_per_sec: float) -> None:
+    """print a benchmark result line"""
+    print(f"{label:<40} {ops_per_sec:>14,.0f} ops/sec")
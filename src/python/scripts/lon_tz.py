@@ -7,19 +7,34 @@ by Ian Kluft
 usage:
     lon_tz.py --version
     lon_tz.py --tzfile > output-file
-    lon_tz.py [--longitude=nnn.nn] [--latitude=nnn.nn] fieldname [...]
+    lon_tz.py --tzif-dir=directory
+    lon_tz.py --serve < request-lines
+    lon_tz.py --http=[host:]port
+    lon_tz.py --raster=raster-file [--raster-res=cells-per-degree] [--type=hour|narrow|longitude]
+    lon_tz.py --batch [--type=hour|narrow|longitude] [--format=tsv|csv|ndjson] --get=fieldname[,...] < input-file
+    lon_tz.py --batch --input=input-file [--workers=n] [--chunk-size=bytes] [...] --get=fieldname[,...]
+    lon_tz.py [--longitude=nnn.nn] [--latitude=nnn.nn] [--type=hour|narrow|longitude] --get=fieldname[,...]
+
+Any of these can add --profile to print cProfile statistics on standard error, or --profile=file to save them.
 """
 
+import os
 import sys
 import argparse
 from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
 import lib_programname
-from timezone_solar import __version__, TimeZoneSolar
+from timezone_solar import __version__
+from timezone_solar import tzsbatch, tzsserve
+from timezone_solar.tzsdata import write_tzif_tree
+from timezone_solar.tzstable import DEFAULT_TZ_TYPE, TZ_TYPE_NAMES
 
 # type alias for error strings
 ErrStr = str
 
+# number of functions listed by --profile
+PROFILE_LINES = 30
+
 # package and program name
 PKG_NAME = "timezone_solar"
 PROG_NAME = (
@@ -76,6 +91,34 @@ def _gen_hour_tz(hour_in) -> None:
     print("")
 
 
+# generate narrow solar time zone info
+# input parameter: integer position in the range -48 to 48, in 15-minute increments of offset from GMT
+# Solar Time Zone centered on the meridian at 3.75 degree multiples, including 1.875 degrees either side of it.
+# The exception is at the Solar Date Line, where +12 and -12 time zones are 1.875 degrees wide.
+def _gen_narrow_tz(pos_in) -> None:
+    """generate narrow 15-minute-wide (3.75 degrees longitude) time zones"""
+    tz_pos = int(pos_in)
+    if tz_pos < -48 or tz_pos > 48:
+        raise ValueError("position parameter must be -48 to +48 inclusive")
+
+    # derive time zone parameters from 15 minutes of offset for each position
+    sign = "" if tz_pos >= 0 else "-"
+    e_w = "East" if tz_pos >= 0 else "West"
+    offset_hr = abs(tz_pos) // 4
+    offset_min = abs(tz_pos) % 4 * 15
+
+    # generate strings from time zone parameters
+    zone_abbrev = f"{e_w}{offset_hr:0>2d}{offset_min:0>2d}"
+    zone_name = f"Solar/{zone_abbrev}"
+    offset_str = f"{sign}{offset_hr:d}:{offset_min:0>2d}"
+
+    # output time zone data
+    print(f"# Solar Time by 15-minute increment: {offset_str}")
+    print("# Zone\tNAME\t\tSTDOFF\tRULES\tFORMAT\t[UNTIL]")
+    print(f"Zone\t{zone_name}\t{offset_str}\t-\t{zone_abbrev}")
+    print("")
+
+
 # generate longitude-based solar time zone info
 # input parameter: integer degrees of longitude in the range 180 to -180,
 # Solar Time Zone centered on the meridian, including one half degree either side of the meridian.
@@ -118,65 +161,113 @@ def _do_tzfile() -> None:
     for h_zone in range(-12, 12 + 1):
         _gen_hour_tz(h_zone)
 
+    # generate solar time zones in increments of 15 minutes / 3.75 degrees of longitude (EastXXXX or WestXXXX)
+    # narrow 15-minute-wide time zones
+    for n_zone in range(-48, 48 + 1):
+        _gen_narrow_tz(n_zone)
+
     # generate solar time zones in incrememnts of 4 minutes / 1 degree of longitude (LonXXXE or LonXXXW)
     # hyperlocal 4-minute-wide time zones for conversion to/from niche uses of local solar time
     for d_zone in range(-180, 180 + 1):
         _gen_lon_tz(d_zone)
 
 
+def _do_tzif(args: dict) -> None:
+    """write binary TZif files into a directory tree"""
+    count = write_tzif_tree(args["tzif_dir"])
+    if "verbose" in args and args["verbose"]:
+        print(f"wrote {count} TZif files in {args['tzif_dir']}/Solar")
+
+
+def _do_batch(args: dict) -> ErrStr | None:
+    """resolve a stream of locations from standard input, writing requested field(s) for each one"""
+    if args["get"] is None:
+        return "--batch requires --get to specify output field(s)"
+    get_keys = (','.join(args["get"])).split(sep=',')
+    if args["input"] is None and (args["workers"] is not None or args["chunk_size"] is not None):
+        return "--workers and --chunk-size require --input"
+    tz_type = args["type"] if args["type"] is not None else DEFAULT_TZ_TYPE
+    workers = args["workers"] if args["workers"] is not None else (os.cpu_count() or 1)
+    with open(
+        sys.stdout.fileno(), "w", buffering=tzsbatch.OUTPUT_BUFFER_SIZE, encoding="utf-8", closefd=False
+    ) as outfile:
+        try:
+            if args["input"] is not None and workers != 1:
+                from timezone_solar import tzsparallel  # pylint: disable=import-outside-toplevel
+                errors = tzsparallel.parallel_batch(
+                    args["input"], outfile, get_keys, args["format"], tz_type, sys.stderr,
+                    workers=workers,
+                    chunk_size=args["chunk_size"] or tzsbatch.DEFAULT_CHUNK_SIZE,
+                )
+            elif args["input"] is not None:
+                with open(args["input"], encoding="utf-8") as infile:
+                    errors = tzsbatch.stream_batch(infile, outfile, get_keys, args["format"], tz_type, sys.stderr)
+            else:
+                errors = tzsbatch.stream_batch(sys.stdin, outfile, get_keys, args["format"], tz_type, sys.stderr)
+        except ValueError as tz_exc:
+            return str(tz_exc)
+    if errors > 0:
+        return f"{errors} input line(s) could not be resolved"
+    return None
+
+
+def _print_fields(args: dict) -> ErrStr | None:
+    """print requested field(s) of the time zone from parameters on command line"""
+    values, err = tzsserve.tz_fields(args)
+    for value in values:
+        print(value)
+    return err
+
+
 def _do_lon_tz(args: dict) -> ErrStr | None:
     """call TimeZoneSolar to generate time zone from parmeters on command line"""
-    err = None
-
-    # collect parameters
     if "longitude" not in args:
         raise ValueError("longitude parameter missing")
-    tzs_params = {}
-    tzs_params["longitude"] = args["longitude"]
-    tzs_params["latitude"] = args["latitude"] if "latitude" in args else None
-    tzs_params["use_lon_tz"] = False
-    if "type" in args:
-        match args["type"]:
-            case "hour":
-                tzs_params["use_lon_tz"] = False
-            case "longitude":
-                tzs_params["use_lon_tz"] = True
-
-    # instantiate TimeZoneSolar object and print requested field(s)
-    tzs = TimeZoneSolar(**tzs_params)
-    try:
-        get_keys = (','.join(args["get"])).split(sep=',')
-        for get_key in get_keys:
-            value = tzs.get(get_key)
-            if value is None:
-                print("")
-            else:
-                print(value)
-    except ValueError as tz_exc:
-        err = str(tz_exc)
-
-    return err
+    return _print_fields(args)
 
 
 def _do_named_tz(args: dict) -> ErrStr | None:
     """call TimeZoneSolar to generate date for a named time zone"""
-    err = None
+    return _print_fields(args)
 
-    # instantiate TimeZoneSolar object and print requested field(s)
-    tzname = args["tzname"]
-    tzs = TimeZoneSolar(tzname=tzname)
+
+def _do_serve() -> None:
+    """answer lookup requests from standard input until end of input, as a co-process"""
+    tzsserve.serve(sys.stdin, sys.stdout)
+
+
+def _do_http(args: dict) -> ErrStr | None:
+    """run the HTTP lookup server until interrupted"""
+    host, _, port = args["http"].rpartition(":")
+    if not port.isdigit() or int(port) > 65535:
+        return f"--http requires [host:]port, got {args['http']}"
+    import asyncio  # pylint: disable=import-outside-toplevel
+    from timezone_solar import tzshttp  # pylint: disable=import-outside-toplevel
+    host = host.strip("[]") or tzshttp.DEFAULT_HOST
+    print(f"serving solar time zone lookups on {host} port {port}", file=sys.stderr)
     try:
-        get_keys = (','.join(args["get"])).split(sep=',')
-        for get_key in get_keys:
-            value = tzs.get(get_key)
-            if value is None:
-                print("")
-            else:
-                print(value)
-    except ValueError as tz_exc:
-        err = str(tz_exc)
+        asyncio.run(tzshttp.serve_http(host, int(port)))
+    except KeyboardInterrupt:
+        pass
+    return None
 
-    return err
+
+def _do_raster(args: dict) -> ErrStr | None:
+    """write a raster file of zone indexes by latitude and longitude"""
+    try:
+        from timezone_solar import tzsraster  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return "--raster requires NumPy, which is installed with the numpy extra"
+    per_degree = args["raster_res"] if args["raster_res"] is not None else tzsraster.DEFAULT_PER_DEGREE
+    tz_type = args["type"] if args["type"] is not None else DEFAULT_TZ_TYPE
+    try:
+        raster = tzsraster.write_raster(args["raster"], per_degree, tz_type=tz_type)
+    except ValueError as tz_exc:
+        return str(tz_exc)
+    if "verbose" in args and args["verbose"]:
+        rows, cols = raster.cells.shape
+        print(f"wrote {rows} by {cols} {tz_type} raster to {args['raster']}")
+    return None
 
 #
 # command-line parsing functions
@@ -216,6 +307,44 @@ def _gen_arg_parser() -> argparse.ArgumentParser:
         help="generate solar time zones tzdata text",
     )
 
+    # --tzif-dir writes binary TZif files for all time zones into a directory tree and ends program
+    excl_group.add_argument(
+        "--tzif-dir",
+        type=str,
+        metavar="DIR",
+        help="write binary TZif files for all solar time zones into DIR/Solar (use DIR in zoneinfo.TZPATH)",
+    )
+
+    # --batch reads locations from standard input and writes requested field(s) for each one
+    excl_group.add_argument(
+        "--batch",
+        action='store_true',
+        help="read longitude[,latitude[,type]] or NDJSON lines from standard input, write --get fields per line",
+    )
+
+    # --serve answers lookup requests from standard input, one per line, until end of input
+    excl_group.add_argument(
+        "--serve",
+        action='store_true',
+        help="answer lookup requests (lon_tz.py options or JSON) from standard input as a co-process",
+    )
+
+    # --http runs an HTTP lookup server until interrupted
+    excl_group.add_argument(
+        "--http",
+        type=str,
+        metavar="[HOST:]PORT",
+        help="answer lookups as an HTTP/1.1 JSON server on PORT (default host: local connections only)",
+    )
+
+    # --raster writes a raster file of zone indexes by latitude and longitude and ends program
+    excl_group.add_argument(
+        "--raster",
+        type=str,
+        metavar="FILE",
+        help="write a memory-mappable raster of zone indexes for --type, with --raster-res cells per degree",
+    )
+
     # --tzname sets a name for a specified time zone, no other parameters allowed when this is used
     excl_group.add_argument(
         "--tzname",
@@ -238,8 +367,43 @@ def _gen_arg_parser() -> argparse.ArgumentParser:
     )
     top_parser.add_argument(
         "--type",
-        choices=['hour', 'longitude'],
-        help="solar time zone type: 'hour' or 'longitude' (default: hour)",
+        choices=TZ_TYPE_NAMES,
+        help="solar time zone type: 'hour', 'narrow' or 'longitude' (default: hour)",
+    )
+
+    # resolution for --raster
+    top_parser.add_argument(
+        "--raster-res",
+        type=int,
+        metavar="N",
+        help="cells per degree of latitude and longitude for --raster (default: 4)",
+    )
+
+    # output format for --batch
+    top_parser.add_argument(
+        "--format",
+        choices=tzsbatch.BATCH_FORMATS,
+        default="tsv",
+        help="output format for --batch: 'tsv', 'csv' or 'ndjson' (default: tsv)",
+    )
+
+    # input file for --batch, resolved in parallel worker processes
+    top_parser.add_argument(
+        "--input",
+        type=str,
+        metavar="FILE",
+        help="input file for --batch, split into chunks resolved by parallel worker processes (default: stdin)",
+    )
+    top_parser.add_argument(
+        "--workers",
+        type=int,
+        help="number of worker processes for --batch --input (default: number of CPUs)",
+    )
+    top_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        metavar="BYTES",
+        help=f"size of input chunks for --batch --input (default: {tzsbatch.DEFAULT_CHUNK_SIZE})",
     )
 
     # specify time zone field to display
@@ -249,8 +413,54 @@ def _gen_arg_parser() -> argparse.ArgumentParser:
         help="specify solar time zone field(s) for output",
     )
 
+    # --profile runs with cProfile, for any of the other modes
+    top_parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help="profile the run with cProfile: print statistics on standard error, or save them to FILE for pstats",
+    )
+
     return top_parser
 
+
+def _run(args: dict) -> ErrStr | None:
+    """call function named in argument parser settings with a dictionary of the CLI arguments"""
+    if "tzfile" in args and args["tzfile"] is True:
+        _do_tzfile()
+    elif "tzif_dir" in args and args["tzif_dir"] is not None:
+        _do_tzif(args)
+    elif "batch" in args and args["batch"] is True:
+        return _do_batch(args)
+    elif "serve" in args and args["serve"] is True:
+        _do_serve()
+    elif "http" in args and args["http"] is not None:
+        return _do_http(args)
+    elif "raster" in args and args["raster"] is not None:
+        return _do_raster(args)
+    elif "tzname" in args and args["tzname"] is not None:
+        return _do_named_tz(args)
+    else:
+        return _do_lon_tz(args)
+    return None
+
+
+def _profile_run(args: dict) -> ErrStr | None:
+    """run with cProfile, then print or save the profile statistics even if the run failed"""
+    import cProfile  # pylint: disable=import-outside-toplevel
+    import pstats  # pylint: disable=import-outside-toplevel
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(_run, args)
+    finally:
+        if args["profile"] == "-":
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_LINES)
+        else:
+            profiler.dump_stats(args["profile"])
+
+
 #
 # program mainline - this executes first
 #
@@ -264,23 +474,19 @@ def main():
 
     # parse arguments and run subcommand functions
     args = vars(top_parser.parse_args())
-    err = None
     debug = False
     if "debug" in args and args["debug"] is not None:
         debug = args["debug"]
     if debug:
         print(f"debug: args => {args}", file=sys.stderr)
-    if "longitude" in args and args["longitude"] is not None and "get" not in args:
+    if (args["longitude"] is not None or args["tzname"] is not None) and args["get"] is None:
         top_parser.print_help()
         top_parser.exit()
     try:
-        # call function named in argument parser settings with a dictionary of the CLI arguments
-        if "tzfile" in args and args["tzfile"] is True:
-            _do_tzfile()
-        elif "tzname" in args and args["tzname"] is not None:
-            err = _do_named_tz(args)
+        if args["profile"] is not None:
+            err = _profile_run(args)
         else:
-            err = _do_lon_tz(args)
+            err = _run(args)
     except Exception as exc:
         exc_class = exc.__class__
         if "verbose" in args and args["verbose"]:
@@ -1,6 +1,6 @@
 """ local solar timezone lookup and utilities including datetime compatibility """
 # print(f'timezone_solar __package__=>{__package__} / __name__=>{__name__} / __path__=>{__path__}')
-from .timezone_solar import TimeZoneSolar  # noqa: F401
+from .timezone_solar import TimeZoneSolar, SolarLocation  # noqa: F401
 
 # set package version
 __version__ = "0.0.2"
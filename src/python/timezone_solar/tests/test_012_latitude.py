@@ -59,7 +59,7 @@ class TestLatitude(unittest.TestCase, LongitudeUtils):
         Flags.verbose_print(f"make test: {description}")
 
         def check(self):
-            obj = TimeZoneSolar(
+            obj = TimeZoneSolar.locate(
                 longitude=expected["longitude"],
                 latitude=expected["latitude"],
                 use_lon_tz=expected["use_lon_tz"],
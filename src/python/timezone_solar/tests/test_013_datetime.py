@@ -3,6 +3,7 @@
 
 import unittest
 from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from timezone_solar import TimeZoneSolar
 from timezone_solar.tests.utils import LongitudeUtils
 from timezone_solar.tests.run_tests import Flags, main_tests_per_file
@@ -192,6 +193,45 @@ class TestDateTime(unittest.TestCase, LongitudeUtils):
 
                 testnum += 1
 
+    def test_fromutc_local_time(self):
+        """fromutc() adds the fixed offset to the wall clock time"""
+        tz_test = TimeZoneSolar(longitude=-122.597, use_lon_tz=True)
+        dt_utc = datetime(2023, 1, 3, 12, 0, tzinfo=timezone.utc)
+        dt_local = dt_utc.astimezone(tz_test)
+        self.assertIs(dt_local.tzinfo, tz_test)
+        self.assertEqual((dt_local.hour, dt_local.minute), (3, 48))
+        self.assertEqual(dt_local.astimezone(timezone.utc), dt_utc)
+
+    def test_fromutc_errors(self):
+        """fromutc() rejects arguments the same way as the generic tzinfo.fromutc()"""
+        tz_test = TimeZoneSolar(longitude=0, use_lon_tz=False)
+        with self.assertRaises(ValueError):
+            tz_test.fromutc(datetime(2023, 1, 3, 12, 0, tzinfo=timezone.utc))
+        with self.assertRaises(TypeError):
+            tz_test.fromutc("2023-01-03 12:00")
+
+    def test_as_fixed_timezone(self):
+        """as_fixed_timezone() is a cached datetime.timezone equivalent"""
+        tz_test = TimeZoneSolar(longitude=-122.597, use_lon_tz=True)
+        tz_fixed = tz_test.as_fixed_timezone()
+        self.assertIsInstance(tz_fixed, timezone)
+        self.assertIs(tz_fixed, tz_test.as_fixed_timezone())
+        dt_utc = datetime(2023, 1, 3, 12, 0, tzinfo=timezone.utc)
+        dt_fixed = dt_utc.astimezone(tz_fixed)
+        dt_solar = dt_utc.astimezone(tz_test)
+        self.assertEqual(dt_fixed.replace(tzinfo=None), dt_solar.replace(tzinfo=None))
+        self.assertEqual(dt_fixed.utcoffset(), dt_solar.utcoffset())
+        self.assertEqual(dt_fixed.tzname(), "Solar/Lon123W")
+
+    def test_as_zoneinfo(self):
+        """as_zoneinfo() is a cached zoneinfo.ZoneInfo equivalent"""
+        tz_test = TimeZoneSolar(tzname="West08")
+        tz_zoneinfo = tz_test.as_zoneinfo()
+        self.assertIsInstance(tz_zoneinfo, ZoneInfo)
+        self.assertIs(tz_zoneinfo, tz_test.as_zoneinfo())
+        dt_utc = datetime(2023, 1, 3, 12, 0, tzinfo=timezone.utc)
+        self.assertEqual(dt_utc.astimezone(tz_zoneinfo).utcoffset(), timedelta(hours=-8))
+
 
 if __name__ == "__main__":
     main_tests_per_file(__file__)
@@ -131,7 +131,7 @@ class TestAccessors(unittest.TestCase, LongitudeUtils):
     def make_field_test(cls, base_func_name: str, fixture: dict, field: str, expect_value: str) -> callable:
         """generate test case function for accessor value within a test fixture"""
         description = f"test {base_func_name}: -> {field} {expect_value}"
-        obj = TimeZoneSolar(**fixture["params"])
+        obj = TimeZoneSolar.locate(**fixture["params"])
 
         # generate check function to be stored as tests for each fixture & field
         def check(self):
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar batch resolution of NumPy arrays"""
+
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzsconst import TZSConst
+from timezone_solar.tzstable import TZ_TYPE_NAMES, TZ_TYPE_PARAMS
+from timezone_solar.tests.utils import LongitudeUtils
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+try:
+    import numpy as np
+    from timezone_solar.tzsarray import check_range
+except ImportError as exc:
+    raise unittest.SkipTest("NumPy is not installed") from exc
+
+# constants
+PROGNUM = 15
+TEST_LATITUDES = [None, 0.0, 45.589, 79.99999, 80.0, -80.0, 90.0]
+TEST_EDGE_LONGITUDES = [
+    -180.0, -179.99, -179.75, -178.125, -176.25, -172.5, -7.5, -7.4999995, 7.5, 172.5, 179.5, 179.99, 180.0
+]
+
+
+class TestArray(unittest.TestCase, LongitudeUtils):
+    """unit tests of timezone_solar batch resolution of NumPy arrays"""
+
+    @staticmethod
+    def compare_longitudes() -> list:
+        """longitudes for comparison with the scalar path: every 1/8 degree plus edge cases"""
+        return [step / 8.0 for step in range(-180 * 8, 180 * 8 + 1)] + TEST_EDGE_LONGITUDES
+
+    @classmethod
+    def make_compare_test(cls, testnum, latitude, tz_type) -> callable:
+        """generate test case function comparing resolve_array() with TimeZoneSolar objects"""
+        tz_params = TZ_TYPE_PARAMS[tz_type]
+        description = f"test {PROGNUM:03}-{testnum:03}: lat {latitude}, tz by {tz_type} → match scalar path"
+
+        def check(self):
+            lon_list = cls.compare_longitudes()
+            lat_arg = None if latitude is None else np.full(len(lon_list), latitude)
+            result = TimeZoneSolar.resolve_array(np.array(lon_list), lat_arg, **tz_params)
+            for pos, longitude in enumerate(lon_list):
+                obj = TimeZoneSolar(longitude=longitude, latitude=latitude, **tz_params)
+                self.assertEqual(result["short_name"][pos], obj.get("short_name"), msg=f"lon {longitude}")
+                self.assertEqual(result["offset_min"][pos], obj.get("offset_min"), msg=f"lon {longitude}")
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def make_error_test(cls, testnum, lon, lat) -> callable:
+        """generate test case function for out-of-range or non-finite input"""
+        description = f"test {PROGNUM:03}-{testnum:03}: lon {lon}, lat {lat} → ValueError"
+
+        def check(self):
+            with self.assertRaises(ValueError):
+                TimeZoneSolar.resolve_array(np.array([0.0, lon]), None if lat is None else np.array([0.0, lat]))
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for batch resolution"""
+        testnum = 0
+        for latitude in TEST_LATITUDES:
+            lat_str = "none" if latitude is None else cls.coord2str(latitude)
+            for tz_type in TZ_TYPE_NAMES:
+                func_name = f"test_{PROGNUM:03}_{testnum:03}_compare_lat_{lat_str}_{tz_type}"
+                Flags.verbose_print(f"generating test {func_name}...")
+                setattr(cls, func_name, cls.make_compare_test(testnum, latitude, tz_type))
+                testnum += 1
+        for lon, lat in [(180.1, None), (-181.0, None), (float("nan"), None), (0.0, 90.1), (0.0, float("nan"))]:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_error_{cls.coord2str(lon)}_{lat}"
+            setattr(cls, func_name, cls.make_error_test(testnum, lon, lat))
+            testnum += 1
+
+    def test_polar_skips_longitude_check(self):
+        """polar latitude overrides longitude before its range check, as in the scalar path"""
+        result = TimeZoneSolar.resolve_array(np.array([200.0]), np.array([85.0]), use_lon_tz=True)
+        self.assertEqual(result["short_name"][0], "Lon000E")
+        self.assertEqual(result["offset_min"][0], 0)
+
+    def test_check_range(self):
+        """range checks allow the precision margin, and report the first bad value and the calling function"""
+        check_range(np.array([-180.0, 180.0 + TZSConst.PRECISION_FP, 0.0]), TZSConst.MAX_LONGITUDE_FP, "longitude", "f")
+        check_range(np.array([]), TZSConst.MAX_LATITUDE_FP, "latitude", "f")
+        with self.assertRaisesRegex(ValueError, "^sun_table: latitude 95.5 must be in the range -90 to \\+90$"):
+            check_range(np.array([0.0, 95.5, np.nan]), TZSConst.MAX_LATITUDE_FP, "latitude", "sun_table")
+        with self.assertRaisesRegex(ValueError, "^resolve_array: longitude nan "):
+            TimeZoneSolar.resolve_array(np.array([0.0, np.nan]))
+
+    def test_result_dtypes(self):
+        """zone indexes are uint16 and offsets are int16"""
+        result = TimeZoneSolar.resolve_array(np.array([-122.597, 0.0, 180.0]))
+        self.assertEqual(result["zone_index"].dtype, np.uint16)
+        self.assertEqual(result["offset_min"].dtype, np.int16)
+        self.assertEqual(list(result["zone_index"]), [4, 12, 24])
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
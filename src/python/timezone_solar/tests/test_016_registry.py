@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""unit tests of shared TimeZoneSolar instances and SolarLocation records"""
+
+import copy
+import pickle
+import unittest
+from datetime import datetime
+from timezone_solar import TimeZoneSolar, SolarLocation
+from timezone_solar.tests.utils import LongitudeUtils
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 16
+
+
+class TestRegistry(unittest.TestCase, LongitudeUtils):
+    """unit tests of shared TimeZoneSolar instances and SolarLocation records"""
+
+    @classmethod
+    def make_shared_test(cls, testnum, longitude, use_lon_tz) -> callable:
+        """generate test case function checking lookups by longitude and by name get the same instance"""
+        expected = cls.expect_lon2tz(longitude, use_lon_tz)
+        description = f"test {PROGNUM:03}-{testnum:03}: lon {longitude} → shared {expected['short_name']}"
+
+        def check(self):
+            by_lon = TimeZoneSolar(longitude=longitude, use_lon_tz=use_lon_tz)
+            by_lon_float = TimeZoneSolar(longitude=longitude + 0.25, use_lon_tz=use_lon_tz)
+            by_name = TimeZoneSolar(tzname=expected["short_name"])
+            by_name_lower = TimeZoneSolar(tzname=expected["short_name"].lower())
+            self.assertIs(by_lon, by_name)
+            self.assertIs(by_lon, by_name_lower)
+            if by_lon_float.get("short_name") == expected["short_name"]:
+                self.assertIs(by_lon, by_lon_float)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for shared instances at each degree of longitude"""
+        testnum = 0
+        for longitude in range(-179, 180, 7):
+            lon_str = cls.coord2str(longitude)
+            for use_lon_tz in [False, True]:
+                tz_type = "deg" if use_lon_tz else "hour"
+                func_name = f"test_{PROGNUM:03}_{testnum:03}_shared_{lon_str}_{tz_type}"
+                Flags.verbose_print(f"generating test {func_name}...")
+                setattr(cls, func_name, cls.make_shared_test(testnum, longitude, use_lon_tz))
+                testnum += 1
+
+    def test_aliases(self):
+        """West00 and Lon000W are aliases of East00 and Lon000E"""
+        self.assertIs(TimeZoneSolar(tzname="West00"), TimeZoneSolar(tzname="East00"))
+        self.assertIs(TimeZoneSolar(tzname="Lon000W"), TimeZoneSolar(tzname="Lon000E"))
+
+    def test_west_date_line_names(self):
+        """zones named for the west side of the date line aren't confused with the east side"""
+        self.assertEqual(TimeZoneSolar(tzname="West12").get("offset_min"), -720)
+        self.assertEqual(TimeZoneSolar(tzname="Lon180W").get("offset_min"), -720)
+        self.assertIs(TimeZoneSolar(tzname="West12"), TimeZoneSolar(longitude=-179.99, use_lon_tz=False))
+
+    def test_polar_shared(self):
+        """polar latitude override returns the shared UTC-equivalent instance"""
+        self.assertIs(
+            TimeZoneSolar(longitude=-122.597, latitude=85.0, use_lon_tz=False),
+            TimeZoneSolar(tzname="East00"),
+        )
+
+    def test_immutable(self):
+        """shared instances can't be modified and have no __dict__"""
+        obj = TimeZoneSolar(tzname="West08")
+        with self.assertRaises(AttributeError):
+            obj.offset_min = 0
+        with self.assertRaises(AttributeError):
+            del obj.name
+        self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertEqual(obj.get("offset_min"), -480)
+
+    def test_datetime_same_tzinfo(self):
+        """datetimes created from different lookups in the same time zone share one tzinfo"""
+        dt1 = datetime(2023, 1, 3, 12, 0, tzinfo=TimeZoneSolar(longitude=-122.597, use_lon_tz=False))
+        dt2 = datetime(2023, 1, 3, 13, 0, tzinfo=TimeZoneSolar(longitude=-118.0, use_lon_tz=False))
+        self.assertIs(dt1.tzinfo, dt2.tzinfo)
+        self.assertEqual((dt2 - dt1).total_seconds(), 3600)
+
+    def test_locate(self):
+        """SolarLocation keeps source coordinates apart from the shared time zone"""
+        loc = TimeZoneSolar.locate(longitude=-122.597, latitude=45.589, use_lon_tz=True)
+        self.assertIsInstance(loc, SolarLocation)
+        self.assertIs(loc.zone, TimeZoneSolar(tzname="Lon123W"))
+        self.assertEqual(loc.get("longitude"), "-122.597")
+        self.assertEqual(loc.get("latitude"), "45.589")
+        self.assertEqual(loc.get("short_name"), "Lon123W")
+        self.assertEqual(loc.short_name, "Lon123W")
+        self.assertEqual(loc.zone.get("longitude"), "-123")
+        self.assertEqual(loc.zone.get("latitude"), "")
+
+    def test_pickle(self):
+        """pickled and copied time zones, aware datetimes and locations get the shared instances back"""
+        for kwargs in (
+            {"longitude": -122.597, "use_lon_tz": False}, {"longitude": -180.0, "use_lon_tz": True},
+            {"tzname": "West12"}, {"tzname": "Lon122W"}, {"longitude": 10.0, "latitude": 85.0, "use_lon_tz": False},
+        ):
+            zone = TimeZoneSolar(**kwargs)
+            self.assertIs(pickle.loads(pickle.dumps(zone)), zone, msg=kwargs)
+            self.assertIs(copy.deepcopy(zone), zone)
+            aware = datetime(2024, 6, 21, 12, 0, tzinfo=zone)
+            self.assertIs(pickle.loads(pickle.dumps(aware)).tzinfo, zone)
+        location = TimeZoneSolar.locate(longitude=-122.597, latitude=45.589, use_lon_tz=False)
+        location = pickle.loads(pickle.dumps(location))
+        self.assertEqual((location.short_name, location.longitude, location.latitude), ("West08", -122.597, 45.589))
+
+    def test_update_lon_lat(self):
+        """update_lon_lat() is deprecated, returning a SolarLocation and leaving the shared instance unchanged"""
+        zone = TimeZoneSolar(tzname="East12")
+        with self.assertWarnsRegex(DeprecationWarning, "no longer changes the time zone") as context:
+            loc = zone.update_lon_lat({"longitude": -180, "latitude": 1.5})
+        self.assertEqual(context.filename, __file__)
+        self.assertIs(loc.zone, zone)
+        self.assertEqual(loc.get("longitude"), "-180")
+        self.assertEqual(loc.get("latitude"), "1.5")
+        self.assertEqual(zone.get("longitude"), "180")
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
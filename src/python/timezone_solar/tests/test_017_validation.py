@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""unit tests of longitude and latitude parameter checks in timezone_solar"""
+
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 17
+VALID_FIXTURE = [
+    # longitude, latitude, use_lon_tz, expected short name
+    (1e-07, None, False, "East00"),
+    (-1e-07, None, True, "Lon000E"),
+    ("-122.597", "45.589", False, "West08"),
+    ("+135", None, True, "Lon135E"),
+    (135, 0, False, "East09"),
+    (-180, -89.9, True, "Lon000E"),
+]
+INVALID_FIXTURE = [
+    # longitude, latitude, expected error message
+    (float("nan"), None, "_tz_params: longitude nan"),
+    (float("inf"), None, "_tz_params: longitude inf"),
+    ("1e5", None, "_tz_params: longitude 1e5"),
+    ("west", None, "_tz_params: longitude west"),
+    (180.1, None, "_tz_params: longitude must be in the range -180 to +180"),
+    (-181, None, "_tz_params: longitude must be in the range -180 to +180"),
+    (0.0, float("nan"), "_tz_params: latitude nan"),
+    (0.0, 90.5, "_tz_params: latitude must be in the range -90 to +90"),
+    (0.0, "north", "_tz_params: latitude north"),
+]
+
+
+class TestValidation(unittest.TestCase):
+    """unit tests of longitude and latitude parameter checks in timezone_solar"""
+
+    @classmethod
+    def make_valid_test(cls, testnum, longitude, latitude, use_lon_tz, expected) -> callable:
+        """generate test case function for accepted parameters"""
+        description = f"test {PROGNUM:03}-{testnum:03}: lon {longitude!r}, lat {latitude!r} → {expected}"
+
+        def check(self):
+            obj = TimeZoneSolar(longitude=longitude, latitude=latitude, use_lon_tz=use_lon_tz)
+            self.assertEqual(obj.get("short_name"), expected)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def make_invalid_test(cls, testnum, longitude, latitude, message) -> callable:
+        """generate test case function for rejected parameters"""
+        description = f"test {PROGNUM:03}-{testnum:03}: lon {longitude!r}, lat {latitude!r} → ValueError"
+
+        def check(self):
+            with self.assertRaises(ValueError) as context:
+                TimeZoneSolar(longitude=longitude, latitude=latitude, use_lon_tz=False)
+            self.assertEqual(str(context.exception), message)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions from fixtures of valid and invalid parameters"""
+        testnum = 0
+        for longitude, latitude, use_lon_tz, expected in VALID_FIXTURE:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_valid"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_valid_test(testnum, longitude, latitude, use_lon_tz, expected))
+            testnum += 1
+        for longitude, latitude, message in INVALID_FIXTURE:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_invalid"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_invalid_test(testnum, longitude, latitude, message))
+            testnum += 1
+
+    def test_float_subclass(self):
+        """float subclasses such as numpy.float64 are checked as floats, and bools aren't numbers"""
+
+        class Degrees(float):
+            """float subclass whose text doesn't look like a decimal number"""
+
+            def __str__(self):
+                return f"{float(self)} degrees"
+
+        self.assertEqual(TimeZoneSolar(longitude=Degrees(1e-07)).short_name, "East00")
+        self.assertEqual(TimeZoneSolar(longitude=Degrees(-122.597), latitude=Degrees(45.589)).short_name, "West08")
+        with self.assertRaises(ValueError):
+            TimeZoneSolar(longitude=Degrees("nan"))
+        with self.assertRaisesRegex(ValueError, "^_tz_params: longitude True$"):
+            TimeZoneSolar(longitude=True)
+        try:
+            import numpy as np  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return
+        self.assertEqual(TimeZoneSolar(longitude=np.float64(1e-7)).short_name, "East00")
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""unit tests of binary TZif generation in timezone_solar"""
+
+import io
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzsdata import posix_tz, tzif_bytes, write_tzif_tree
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 18
+TEST_TIME = datetime(2023, 1, 3, 12, 0, tzinfo=timezone.utc)
+POSIX_TZ_FIXTURE = {
+    "East00": "<East00>0",
+    "East05": "<East05>-5",
+    "West08": "<West08>8",
+    "West12": "<West12>12",
+    "Lon123W": "<Lon123W>8:12",
+    "Lon005E": "<Lon005E>-0:20",
+    "Lon180E": "<Lon180E>-12",
+}
+
+
+class TestTZData(unittest.TestCase):
+    """unit tests of binary TZif generation in timezone_solar"""
+
+    @classmethod
+    def make_zoneinfo_test(cls, testnum, zone) -> callable:
+        """generate test case function loading a zone's TZif data into zoneinfo"""
+        description = f"test {PROGNUM:03}-{testnum:03}: {zone.short_name} TZif → zoneinfo offset {zone.offset_min}"
+
+        def check(self):
+            tz_data = tzif_bytes(zone)
+            self.assertEqual(tz_data[0:5], b"TZif2")
+            tz_zoneinfo = ZoneInfo.from_file(io.BytesIO(tz_data), key=zone.name)
+            dt_local = TEST_TIME.astimezone(tz_zoneinfo)
+            self.assertEqual(dt_local.utcoffset(), timedelta(minutes=zone.offset_min))
+            self.assertEqual(dt_local.tzname(), zone.short_name)
+            self.assertEqual(dt_local.replace(tzinfo=None), TEST_TIME.astimezone(zone).replace(tzinfo=None))
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def make_posix_tz_test(cls, testnum, short_name, expected) -> callable:
+        """generate test case function for POSIX TZ footer string"""
+        description = f"test {PROGNUM:03}-{testnum:03}: {short_name} → POSIX TZ {expected}"
+
+        def check(self):
+            self.assertEqual(posix_tz(TimeZoneSolar(tzname=short_name)), expected)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for TZif data of every time zone"""
+        testnum = 0
+        for use_lon_tz in [False, True]:
+            for zone in TimeZoneSolar.zones(use_lon_tz):
+                func_name = f"test_{PROGNUM:03}_{testnum:03}_tzif_{zone.short_name}"
+                Flags.verbose_print(f"generating test {func_name}...")
+                setattr(cls, func_name, cls.make_zoneinfo_test(testnum, zone))
+                testnum += 1
+        for short_name, expected in POSIX_TZ_FIXTURE.items():
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_posix_tz_{short_name}"
+            setattr(cls, func_name, cls.make_posix_tz_test(testnum, short_name, expected))
+            testnum += 1
+
+    def test_write_tzif_tree(self):
+        """write_tzif_tree() writes a file for every time zone under Solar/"""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            count = write_tzif_tree(tmpdirname)
+            self.assertEqual(count, 25 + 97 + 361)
+            files = sorted(path.name for path in (Path(tmpdirname) / "Solar").iterdir())
+            self.assertEqual(len(files), count)
+            self.assertEqual(
+                (Path(tmpdirname) / "Solar" / "West08").read_bytes(), tzif_bytes(TimeZoneSolar(tzname="West08"))
+            )
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""unit tests of streaming batch lookups in timezone_solar"""
+
+import io
+import json
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzsbatch import resolve_rows, stream_batch, parse_row
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 19
+TEST_FIELDS = ["short_name", "offset", "longitude", "latitude", "is_utc"]
+TEST_INPUT = (
+    "longitude,latitude,type\n"
+    "-122.597,45.589\n"
+    "-122.597,45.589,longitude\n"
+    "\n"
+    "180,85\n"
+    "abc\n"
+    '{"tzname": "West08"}\n'
+    '{"longitude": 10.5, "type": "longitude"}\n'
+    "-179.99,,hour\n"
+)
+TEST_FIXTURE = {
+    "tsv": [
+        "West08\t-08:00\t-122.597\t45.589\t0",
+        "Lon123W\t-08:12\t-122.597\t45.589\t0",
+        "East00\t+00:00\t180\t85\t1",
+        "\t\t\t\t",
+        "West08\t-08:00\t-120\t\t0",
+        "Lon011E\t+00:44\t10.5\t\t0",
+        "West12\t-12:00\t-179.99\t\t0",
+    ],
+    "csv": [
+        "West08,-08:00,-122.597,45.589,0",
+        "Lon123W,-08:12,-122.597,45.589,0",
+        "East00,+00:00,180,85,1",
+        ",,,,",
+        "West08,-08:00,-120,,0",
+        "Lon011E,+00:44,10.5,,0",
+        "West12,-12:00,-179.99,,0",
+    ],
+}
+
+
+class TestBatch(unittest.TestCase):
+    """unit tests of streaming batch lookups in timezone_solar"""
+
+    @classmethod
+    def make_format_test(cls, testnum, fmt, expected) -> callable:
+        """generate test case function for batch output in a text format"""
+        description = f"test {PROGNUM:03}-{testnum:03}: batch output as {fmt}"
+
+        def check(self):
+            outfile = io.StringIO()
+            errfile = io.StringIO()
+            errors = stream_batch(io.StringIO(TEST_INPUT), outfile, TEST_FIELDS, fmt, "hour", errfile)
+            self.assertEqual(errors, 1)
+            self.assertEqual(outfile.getvalue().splitlines(), expected)
+            self.assertEqual(errfile.getvalue(), "line 6: _tz_params: longitude abc\n")
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each text output format"""
+        testnum = 0
+        for fmt, expected in TEST_FIXTURE.items():
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_format_{fmt}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_format_test(testnum, fmt, expected))
+            testnum += 1
+
+    def test_ndjson(self):
+        """NDJSON output has an object per input line, with an error key for failed lines"""
+        outfile = io.StringIO()
+        errors = stream_batch(io.StringIO(TEST_INPUT), outfile, TEST_FIELDS, "ndjson")
+        rows = [json.loads(line) for line in outfile.getvalue().splitlines()]
+        self.assertEqual(errors, 1)
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(rows[1]["short_name"], "Lon123W")
+        self.assertEqual(rows[3], {"error": "_tz_params: longitude abc"})
+
+    def test_default_type(self):
+        """lines without a type use the default time zone type"""
+        outfile = io.StringIO()
+        infile = io.StringIO("-122.597\n-122.597,,hour\n-122.597,,narrow\n")
+        stream_batch(infile, outfile, ["short_name"], "tsv", "longitude")
+        self.assertEqual(outfile.getvalue(), "Lon123W\nWest08\nWest0815\n")
+
+    def test_header(self):
+        """a first line starting with "longitude" is skipped as a CSV header only at the start of input"""
+        lines = ["longitude,latitude", "-122.597,45.589"]
+        self.assertEqual(list(resolve_rows(lines, ["short_name"])), ["West08\n"])
+        errors = []
+        rows = resolve_rows(lines, ["short_name"], header=False, on_error=lambda *args: errors.append(args))
+        self.assertEqual(list(rows), ["\n", "West08\n"])
+        self.assertEqual([lineno for lineno, _ in errors], [1])
+
+    def test_unknown_field(self):
+        """an unknown field name fails before any output"""
+        outfile = io.StringIO()
+        with self.assertRaises(ValueError):
+            stream_batch(io.StringIO("0\n"), outfile, ["name", "bogus"])
+        self.assertEqual(outfile.getvalue(), "")
+
+    def test_parse_row_errors(self):
+        """parse_row() rejects lines which don't describe a location"""
+        for line in [
+            "", "1,2,3,4", "1,2,bogus", "[1, 2]", '{"latitude": 5}', '{"tzname": 8}', '{"tzname": ["West08"]}',
+        ]:
+            with self.assertRaises(ValueError, msg=line):
+                TimeZoneSolar.locate(**parse_row(line))
+
+    def test_bad_tzname(self):
+        """a JSON line with a tzname which isn't a string is a row error, and later rows are still resolved"""
+        outfile = io.StringIO()
+        errfile = io.StringIO()
+        infile = io.StringIO('{"tzname": "West08"}\n{"tzname": 8}\n{"tzname": "East01"}\n')
+        errors = stream_batch(infile, outfile, ["short_name"], "tsv", errfile=errfile)
+        self.assertEqual(errors, 1)
+        self.assertEqual(outfile.getvalue(), "West08\n\nEast01\n")
+        self.assertEqual(errfile.getvalue(), "line 2: tzname must be a string\n")
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
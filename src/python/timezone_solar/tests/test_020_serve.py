@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""unit tests of the co-process request protocol in timezone_solar"""
+
+import io
+import unittest
+from timezone_solar.tzsserve import handle_request, serve
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 20
+TEST_FIXTURE = [
+    ("--longitude=-122.597 --latitude=45.589 --get=short_name,offset", ["ok 2", "West08", "-08:00"]),
+    ("--longitude=-122.597 --type=longitude --get=short_name --get=longitude", ["ok 2", "Lon123W", "-122.597"]),
+    ("--longitude=180 --latitude=85 --get=short_name,is_utc", ["ok 2", "East00", "1"]),
+    ("--tzname=West08 --get=longitude,latitude", ["ok 2", "-120", ""]),
+    ('{"longitude": 10.5, "type": "longitude", "get": "short_name,offset"}', ["ok 2", "Lon011E", "+00:44"]),
+    ('{"tzname": "Lon123W", "get": ["offset_min"]}', ["ok 1", "-492"]),
+    ("--longitude=-122.597 --get=name,bogus", ["error 1 unknown field bogus", "Solar/West08"]),
+    ("--longitude=190 --get=name", ["error 0 _tz_params: longitude must be in the range -180 to +180"]),
+    ("--longitude=abc --get=name", ["error 0 argument --longitude: invalid float value: 'abc'"]),
+    ("--get=name", ["error 0 one of the arguments --tzname --longitude is required"]),
+    ("--longitude=0", ["error 0 --get is required to specify output field(s)"]),
+    ("--longitude=-122.597 --type=narrow --get=short_name,offset", ["ok 2", "West0815", "-08:15"]),
+    ('{"longitude": 0, "type": "bogus", "get": "name"}', ["error 0 unknown time zone type bogus"]),
+    ('{"tzname": "West08", "get": 5}', ["error 0 get must be a string or a list of strings"]),
+    ('{"longitude": 0, "get": ["name", 3]}', ["error 0 get must be a string or a list of strings"]),
+    ('{"tzname": 5, "get": "name"}', ["error 0 tzname must be a string"]),
+    ('{"longitude": 0, "type": ["hour"], "get": "name"}', ["error 0 type must be a string"]),
+]
+
+
+class TestServe(unittest.TestCase):
+    """unit tests of the co-process request protocol in timezone_solar"""
+
+    @classmethod
+    def make_request_test(cls, testnum, request, expected) -> callable:
+        """generate test case function for a request line and its response"""
+        description = f"test {PROGNUM:03}-{testnum:03}: request {request}"
+
+        def check(self):
+            self.assertEqual(handle_request(request), "\n".join(expected) + "\n")
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each request in the fixture"""
+        testnum = 0
+        for request, expected in TEST_FIXTURE:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_request"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_request_test(testnum, request, expected))
+            testnum += 1
+
+    def test_serve(self):
+        """serve() answers each request line until a quit line, skipping blank lines"""
+        outfile = io.StringIO()
+        requests = "--tzname=East05 --get=offset\n\n--tzname=x --get=name\nquit\n--tzname=East05\n"
+        count = serve(io.StringIO(requests), outfile)
+        self.assertEqual(count, 2)
+        self.assertEqual(outfile.getvalue().splitlines()[0:2], ["ok 1", "+05:00"])
+        self.assertEqual(outfile.getvalue().splitlines()[2], "error 0 x  is not a valid solar/natural time zone name")
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""unit tests of parallel batch lookups in timezone_solar"""
+
+import io
+import os
+import tempfile
+import unittest
+from timezone_solar.tzsbatch import stream_batch
+from timezone_solar.tzsparallel import chunk_ranges, parallel_batch, resolve_chunk
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 21
+TEST_FIELDS = ["short_name", "offset", "longitude", "latitude"]
+TEST_CHUNK_SIZES = [1, 7, 64, 1 << 20]
+TEST_WORKERS = [1, 2]
+
+
+def _test_input() -> str:
+    """generate input text with a header, blank lines, errors, JSON lines and no newline at the end"""
+    lines = ["longitude,latitude,type"]
+    for num in range(200):
+        if num % 37 == 5:
+            lines.append("bad")
+        elif num % 23 == 0:
+            lines.append("")
+        elif num % 11 == 0:
+            lines.append(f'{{"longitude": {num - 100}, "type": "longitude"}}')
+        else:
+            lines.append(f"{(num * 1.7) % 360 - 180:.3f},{num % 180 - 90}")
+    return "\n".join(lines)
+
+
+class TestParallel(unittest.TestCase):
+    """unit tests of parallel batch lookups in timezone_solar"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.path = os.path.join(cls.tmpdir.name, "input.csv")
+        with open(cls.path, "w", encoding="utf-8") as infile:
+            infile.write(_test_input())
+        cls.expected_out = io.StringIO()
+        cls.expected_err = io.StringIO()
+        cls.expected_errors = stream_batch(
+            io.StringIO(_test_input()), cls.expected_out, TEST_FIELDS, "tsv", "hour", cls.expected_err
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    @classmethod
+    def make_parallel_test(cls, testnum, workers, chunk_size) -> callable:
+        """generate test case function comparing parallel output with streaming batch output"""
+        description = f"test {PROGNUM:03}-{testnum:03}: {workers} worker(s), chunk size {chunk_size}"
+
+        def check(self):
+            outfile = io.StringIO()
+            errfile = io.StringIO()
+            errors = parallel_batch(self.path, outfile, TEST_FIELDS, "tsv", "hour", errfile, workers, chunk_size)
+            self.assertEqual(errors, self.expected_errors)
+            self.assertEqual(outfile.getvalue(), self.expected_out.getvalue())
+            self.assertEqual(errfile.getvalue(), self.expected_err.getvalue())
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each worker count and chunk size"""
+        testnum = 0
+        for workers in TEST_WORKERS:
+            for chunk_size in TEST_CHUNK_SIZES:
+                func_name = f"test_{PROGNUM:03}_{testnum:03}_workers_{workers}_chunk_{chunk_size}"
+                Flags.verbose_print(f"generating test {func_name}...")
+                setattr(cls, func_name, cls.make_parallel_test(testnum, workers, chunk_size))
+                testnum += 1
+
+    def test_chunk_ranges(self):
+        """chunks cover the whole file without gaps and end after a newline"""
+        file_size = os.path.getsize(self.path)
+        with open(self.path, "rb") as infile:
+            data = infile.read()
+        for chunk_size in TEST_CHUNK_SIZES:
+            ranges = chunk_ranges(self.path, chunk_size)
+            self.assertEqual(ranges[0][0], 0)
+            self.assertEqual(ranges[-1][1], file_size)
+            for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                self.assertEqual(end, start)
+                self.assertEqual(data[end - 1:end], b"\n")
+
+    def test_resolve_chunk(self):
+        """line numbers of errors count from 1 in each chunk, and only the first chunk may have a CSV header"""
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", dir=self.tmpdir.name, delete=False) as infile:
+            infile.write("longitude\n-122.597\nbad\nlongitude\n0\n")
+        start = len("longitude\n-122.597\n")
+        output, line_count, errors = resolve_chunk(infile.name, 0, start, ["short_name"], tz_type="hour")
+        self.assertEqual((output, line_count, errors), ("West08\n", 2, []))
+        output, line_count, errors = resolve_chunk(infile.name, start, start + 16, ["short_name"], tz_type="hour")
+        self.assertEqual((output, line_count), ("\n\nEast00\n", 3))
+        self.assertEqual([lineno for lineno, _ in errors], [1, 2])
+
+    def test_unknown_field(self):
+        """an unknown field name fails before any output"""
+        outfile = io.StringIO()
+        with self.assertRaises(ValueError):
+            parallel_batch(self.path, outfile, ["name", "bogus"], workers=2)
+        self.assertEqual(outfile.getvalue(), "")
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
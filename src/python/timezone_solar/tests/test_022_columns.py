@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar memory-mapped column files"""
+
+import os
+import tempfile
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+try:
+    import numpy as np
+    from timezone_solar.tzscolumns import resolve_columns
+except ImportError as exc:
+    raise unittest.SkipTest("NumPy is not installed") from exc
+
+# constants
+PROGNUM = 22
+TEST_ROWS = 5000
+TEST_BLOCK_ROWS = [1, 333, 1 << 20]
+
+define_family("half", 30)
+
+
+class TestColumns(unittest.TestCase):
+    """unit tests of timezone_solar memory-mapped column files"""
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(1)
+        cls.lon = rng.uniform(-180, 180, TEST_ROWS)
+        cls.lat = rng.uniform(-90, 90, TEST_ROWS)
+        cls.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.lon.astype("<f8").tofile(cls.path("lon.f64"))
+        cls.lat.astype("<f8").tofile(cls.path("lat.f64"))
+        np.save(cls.path("lon.npy"), cls.lon)
+        np.save(cls.path("lat.npy"), cls.lat.astype(np.float32))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    @classmethod
+    def path(cls, name) -> str:
+        """path of a file in the temporary directory"""
+        return os.path.join(cls.tmpdir.name, name)
+
+    @classmethod
+    def make_columns_test(cls, testnum, suffix, block_rows, use_lon_tz) -> callable:
+        """generate test case function comparing column file output with resolve_array()"""
+        tz_type = "deg" if use_lon_tz else "hour"
+        description = f"test {PROGNUM:03}-{testnum:03}: {suffix} files, {block_rows} row blocks, tz by {tz_type}"
+
+        def check(self):
+            in_suffix = "npy" if suffix == "npy" else "f64"
+            offset_path = self.path(f"offset-{testnum}.{suffix}")
+            index_path = self.path(f"index-{testnum}.{suffix}")
+            rows = resolve_columns(
+                self.path(f"lon.{in_suffix}"), self.path(f"lat.{in_suffix}"), offset_path, index_path,
+                use_lon_tz=use_lon_tz, block_rows=block_rows,
+            )
+            self.assertEqual(rows, TEST_ROWS)
+            if suffix == "npy":
+                offset_min, zone_index = np.load(offset_path), np.load(index_path)
+            else:
+                offset_min, zone_index = np.fromfile(offset_path, "<i2"), np.fromfile(index_path, "<u2")
+            lat = np.load(self.path("lat.npy")) if suffix == "npy" else self.lat
+            expected = TimeZoneSolar.resolve_array(self.lon, lat, use_lon_tz)
+            np.testing.assert_array_equal(offset_min, expected["offset_min"])
+            np.testing.assert_array_equal(zone_index, expected["zone_index"])
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each file format, block size and time zone type"""
+        testnum = 0
+        for suffix in ["raw", "npy"]:
+            for block_rows in TEST_BLOCK_ROWS:
+                for use_lon_tz in [False, True]:
+                    func_name = f"test_{PROGNUM:03}_{testnum:03}_{suffix}_block_{block_rows}"
+                    Flags.verbose_print(f"generating test {func_name}...")
+                    setattr(cls, func_name, cls.make_columns_test(testnum, suffix, block_rows, use_lon_tz))
+                    testnum += 1
+
+    def test_longitude_only(self):
+        """latitude column is optional, and either output column may be omitted"""
+        index_path = self.path("index-lon-only.raw")
+        resolve_columns(self.path("lon.f64"), index_path=index_path)
+        np.testing.assert_array_equal(
+            np.fromfile(index_path, "<u2"), TimeZoneSolar.resolve_array(self.lon)["zone_index"]
+        )
+
+    def test_family(self):
+        """a tz_type name selects a zone family"""
+        offset_path, index_path = self.path("offset-half.raw"), self.path("index-half.raw")
+        resolve_columns(self.path("lon.f64"), self.path("lat.f64"), offset_path, index_path, tz_type="half")
+        expected = TimeZoneSolar.resolve_array(self.lon, self.lat, tz_type="half")
+        np.testing.assert_array_equal(np.fromfile(offset_path, "<i2"), expected["offset_min"])
+        np.testing.assert_array_equal(np.fromfile(index_path, "<u2"), expected["zone_index"])
+
+    def test_errors(self):
+        """mismatched columns, bad values and missing outputs raise ValueError"""
+        np.arange(10, dtype="<f8").tofile(self.path("short.f64"))
+        np.array([0.0, 190.0], dtype="<f8").tofile(self.path("bad.f64"))
+        with open(self.path("odd.f64"), "wb") as odd_file:
+            odd_file.write(b"12345")
+        with self.assertRaises(ValueError):
+            resolve_columns(self.path("lon.f64"))
+        with self.assertRaises(ValueError):
+            resolve_columns(self.path("lon.f64"), self.path("short.f64"), index_path=self.path("x.raw"))
+        with self.assertRaises(ValueError):
+            resolve_columns(self.path("odd.f64"), index_path=self.path("x.raw"))
+        with self.assertRaisesRegex(ValueError, "^resolve_columns: longitude 190.*rows 0-1"):
+            resolve_columns(self.path("bad.f64"), index_path=self.path("x.raw"))
+
+    def test_empty(self):
+        """empty input columns produce empty output columns"""
+        open(self.path("empty.f64"), "wb").close()  # pylint: disable=consider-using-with
+        self.assertEqual(resolve_columns(self.path("empty.f64"), offset_path=self.path("empty-out.npy")), 0)
+        self.assertEqual(len(np.load(self.path("empty-out.npy"))), 0)
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
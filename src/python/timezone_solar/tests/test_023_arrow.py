@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar Arrow and Parquet column annotation"""
+
+import os
+import tempfile
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from timezone_solar.tzsarrow import annotate_batch, annotate_table, annotate_parquet
+except ImportError as exc:
+    raise unittest.SkipTest("PyArrow or NumPy is not installed") from exc
+
+# constants
+PROGNUM = 23
+TEST_ROWS = 1000
+TEST_BATCH_SIZES = [1, 97, 1 << 16]
+
+define_family("half", 30)
+
+
+def _test_table() -> pa.Table:
+    """generate a table of locations, with some null latitudes and longitudes"""
+    lon = [(num * 7.31) % 360 - 180 for num in range(TEST_ROWS)]
+    lat = [(num * 3.7) % 180 - 90 for num in range(TEST_ROWS)]
+    return pa.table({
+        "id": pa.array(range(TEST_ROWS), type=pa.int32()),
+        "longitude": pa.array([None if num % 101 == 0 else value for num, value in enumerate(lon)]),
+        "latitude": pa.array([None if num % 13 == 0 else value for num, value in enumerate(lat)]),
+    })
+
+
+def _expected_row(row: dict, use_lon_tz: bool) -> tuple:
+    """expected annotation columns for a table row, from a TimeZoneSolar object"""
+    if row["longitude"] is None:
+        return (None, None, None)
+    tzs = TimeZoneSolar(longitude=row["longitude"], latitude=row["latitude"], use_lon_tz=use_lon_tz)
+    return (tzs.short_name, tzs.offset_min, tzs.offset_min == 0)
+
+
+class TestArrow(unittest.TestCase):
+    """unit tests of timezone_solar Arrow and Parquet column annotation"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.table = _test_table()
+        cls.in_path = os.path.join(cls.tmpdir.name, "input.parquet")
+        pq.write_table(cls.table, cls.in_path, row_group_size=300)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def check_annotated(self, table: pa.Table, use_lon_tz: bool) -> None:
+        """compare an annotated table with TimeZoneSolar objects for each row"""
+        self.assertEqual(table.column_names, ["id", "longitude", "latitude", "short_name", "offset_min", "is_utc"])
+        self.assertEqual(table.schema.field("offset_min").type, pa.int16())
+        for row in table.to_pylist():
+            self.assertEqual(
+                (row["short_name"], row["offset_min"], row["is_utc"]), _expected_row(row, use_lon_tz), msg=str(row)
+            )
+
+    @classmethod
+    def make_parquet_test(cls, testnum, batch_size, use_lon_tz) -> callable:
+        """generate test case function for annotation of a Parquet file"""
+        tz_type = "deg" if use_lon_tz else "hour"
+        description = f"test {PROGNUM:03}-{testnum:03}: Parquet batches of {batch_size}, tz by {tz_type}"
+
+        def check(self):
+            out_path = os.path.join(self.tmpdir.name, f"output-{testnum}.parquet")
+            rows = annotate_parquet(self.in_path, out_path, batch_size=batch_size, use_lon_tz=use_lon_tz)
+            self.assertEqual(rows, TEST_ROWS)
+            self.check_annotated(pq.read_table(out_path), use_lon_tz)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each batch size and time zone type"""
+        testnum = 0
+        for batch_size in TEST_BATCH_SIZES:
+            for use_lon_tz in [False, True]:
+                func_name = f"test_{PROGNUM:03}_{testnum:03}_parquet_batch_{batch_size}"
+                Flags.verbose_print(f"generating test {func_name}...")
+                setattr(cls, func_name, cls.make_parquet_test(testnum, batch_size, use_lon_tz))
+                testnum += 1
+
+    def test_annotate_table(self):
+        """annotate_table() appends columns to each record batch of a table"""
+        self.check_annotated(annotate_table(self.table, use_lon_tz=True), True)
+
+    def test_column_names(self):
+        """longitude and latitude columns can have other names, and latitude is optional"""
+        batch = pa.record_batch({"x": pa.array([-122.597, 10.0]), "y": pa.array([45.589, 85.0])})
+        result = annotate_batch(batch, lon_column="x", lat_column="y")
+        self.assertEqual(result.column("short_name").to_pylist(), ["West08", "East00"])
+        result = annotate_batch(batch, lon_column="x")
+        self.assertEqual(result.column("short_name").to_pylist(), ["West08", "East01"])
+
+    def test_family(self):
+        """a tz_type name selects a zone family"""
+        batch = pa.record_batch({
+            "longitude": pa.array([-122.597, 5.0, None]),
+            "latitude": pa.array([45.589, 85.0, 0.0]),
+        })
+        result = annotate_table(pa.Table.from_batches([batch]), tz_type="half")
+        self.assertEqual(result.column("short_name").to_pylist(), ["West0800", "East0000", None])
+        self.assertEqual(result.column("offset_min").to_pylist(), [-480, 0, None])
+
+    def test_errors(self):
+        """missing longitude, existing output columns and out-of-range values raise ValueError"""
+        with self.assertRaises(ValueError):
+            annotate_batch(pa.record_batch({"lon": pa.array([1.0])}))
+        with self.assertRaises(ValueError):
+            annotate_batch(pa.record_batch({"longitude": pa.array([1.0]), "is_utc": pa.array([True])}))
+        with self.assertRaises(ValueError):
+            annotate_batch(pa.record_batch({"longitude": pa.array([190.0])}))
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
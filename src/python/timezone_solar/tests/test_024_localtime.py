@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar vectorized conversion of epoch times to local solar time"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+try:
+    import numpy as np
+    from timezone_solar.tzsarray import EPOCH_UNITS, epoch_to_local, local_fields
+except ImportError as exc:
+    raise unittest.SkipTest("NumPy is not installed") from exc
+
+# constants
+PROGNUM = 24
+TEST_ROWS = 2000
+EPOCH_MIN = -2208988800  # 1900-01-01
+EPOCH_MAX = 4102444800  # 2100-01-01
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+define_family("half", 30)
+
+
+class TestLocalTime(unittest.TestCase):
+    """unit tests of timezone_solar vectorized conversion of epoch times to local solar time"""
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(1)
+        cls.epoch_s = rng.integers(EPOCH_MIN, EPOCH_MAX, TEST_ROWS)
+        cls.fraction_ns = rng.integers(0, 1000000000, TEST_ROWS)
+        cls.lon = rng.uniform(-180, 180, TEST_ROWS)
+        cls.lat = rng.uniform(-90, 90, TEST_ROWS)
+
+    @classmethod
+    def make_convert_test(cls, testnum, unit, use_lon_tz) -> callable:
+        """generate test case function comparing epoch_to_local() with datetime.astimezone()"""
+        tz_type = "deg" if use_lon_tz else "hour"
+        description = f"test {PROGNUM:03}-{testnum:03}: epoch in {unit}, tz by {tz_type} → match datetime"
+
+        def check(self):
+            per_sec = EPOCH_UNITS[unit]
+            epoch = self.epoch_s * per_sec + self.fraction_ns // (1000000000 // per_sec)
+            local = epoch_to_local(epoch, self.lon, self.lat, use_lon_tz=use_lon_tz, unit=unit)
+            self.assertEqual(local.dtype, np.dtype(f"datetime64[{unit}]"))
+            fields = local_fields(local)
+            for pos in range(TEST_ROWS):
+                tzs = TimeZoneSolar(longitude=self.lon[pos], latitude=self.lat[pos], use_lon_tz=use_lon_tz)
+                dt_local = (UNIX_EPOCH + timedelta(seconds=int(self.epoch_s[pos]))).astimezone(tzs)
+                self.assertEqual(
+                    [int(fields[key][pos]) for key in ["year", "month", "day", "hour", "minute", "second"]],
+                    [dt_local.year, dt_local.month, dt_local.day, dt_local.hour, dt_local.minute, dt_local.second],
+                    msg=f"epoch {epoch[pos]} lon {self.lon[pos]} lat {self.lat[pos]}",
+                )
+                self.assertEqual(fields["date"][pos], np.datetime64(dt_local.date()))
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each epoch unit and time zone type"""
+        testnum = 0
+        for unit in EPOCH_UNITS:
+            for use_lon_tz in [False, True]:
+                func_name = f"test_{PROGNUM:03}_{testnum:03}_epoch_{unit}"
+                Flags.verbose_print(f"generating test {func_name}...")
+                setattr(cls, func_name, cls.make_convert_test(testnum, unit, use_lon_tz))
+                testnum += 1
+
+    def test_zone_index(self):
+        """zone indexes give the same results as the longitudes they were resolved from"""
+        result = TimeZoneSolar.resolve_array(self.lon, self.lat, use_lon_tz=True)
+        np.testing.assert_array_equal(
+            epoch_to_local(self.epoch_s, zone_index=result["zone_index"], use_lon_tz=True),
+            epoch_to_local(self.epoch_s, self.lon, self.lat, use_lon_tz=True),
+        )
+
+    def test_broadcast(self):
+        """a single longitude applies to every epoch time"""
+        local = epoch_to_local(np.array([0, 86400]), -122.597)
+        np.testing.assert_array_equal(local, np.array(["1969-12-31T16:00:00", "1970-01-01T16:00:00"], "datetime64[s]"))
+
+    def test_family(self):
+        """a tz_type name selects a zone family, for longitudes and for zone indexes of that family"""
+        result = TimeZoneSolar.resolve_array(self.lon, self.lat, tz_type="half")
+        local = epoch_to_local(self.epoch_s, self.lon, self.lat, tz_type="half")
+        by_index = epoch_to_local(self.epoch_s, zone_index=result["zone_index"], tz_type="half")
+        np.testing.assert_array_equal(local, by_index)
+        offset = result["offset_min"].astype(np.int64) * 60
+        np.testing.assert_array_equal(local, (self.epoch_s + offset).astype("datetime64[s]"))
+        local = epoch_to_local(np.array([0]), -122.597, tz_type="half")
+        np.testing.assert_array_equal(local, np.array(["1969-12-31T16:00:00"], "datetime64[s]"))
+        with self.assertRaises(ValueError):
+            epoch_to_local([0], zone_index=[49], tz_type="half")
+        with self.assertRaises(ValueError):
+            epoch_to_local([0], [0.0], use_lon_tz=True, tz_type="half")
+
+    def test_errors(self):
+        """bad units, float epoch times, bad zone indexes and missing or extra zone parameters raise ValueError"""
+        with self.assertRaises(ValueError):
+            epoch_to_local([0], [0.0], unit="m")
+        with self.assertRaises(ValueError):
+            epoch_to_local([0])
+        with self.assertRaises(ValueError):
+            epoch_to_local([0], [0.0], zone_index=[12])
+        with self.assertRaises(ValueError):
+            epoch_to_local([0], zone_index=[25])
+        with self.assertRaisesRegex(ValueError, "^epoch_to_local: epoch times must be integers"):
+            epoch_to_local([1.5e9], [0.0])
+        with self.assertRaisesRegex(ValueError, "^epoch_to_local: latitude 95"):
+            epoch_to_local([0], [0.0], [95.0])
+        with self.assertRaises(ValueError):
+            local_fields(np.array(["2024-01-01"], "datetime64[D]"))
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""unit tests of the timezone_solar zone table and narrow time zones"""
+
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzsconst import TZSConst
+from timezone_solar.tzstable import TZ_TYPE_NAMES, TZ_TYPE_PARAMS, ZONE_TABLE
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 25
+NARROW_WIDTH = 3.75
+TABLE_SIZES = {"hour": 25, "narrow": 97, "longitude": 361}
+BAD_NARROW_NAMES = ["East0010", "West0050", "East1215", "West1300", "East9900"]
+
+
+def expect_narrow(lon: float) -> tuple:
+    """expected narrow time zone short name and offset at a longitude, as in the black-box test harness"""
+    precision = TZSConst.PRECISION_FP
+    max_lon = TZSConst.MAX_LONGITUDE_INT
+    if lon >= max_lon - NARROW_WIDTH / 2.0 - precision or lon <= -max_lon + precision:
+        return "East1200", 720
+    if lon <= -max_lon + NARROW_WIDTH / 2.0 + precision:
+        return "West1200", -720
+    tz_int = int(abs(lon) / NARROW_WIDTH + 0.5 + precision)
+    sign = 1 if lon > -NARROW_WIDTH / 2.0 + precision else -1
+    tz_hour, tz_min = tz_int // 4, tz_int % 4 * 15
+    return f"{'East' if sign > 0 else 'West'}{tz_hour:02d}{tz_min:02d}", sign * (tz_hour * 60 + tz_min)
+
+
+class TestZoneTable(unittest.TestCase):
+    """unit tests of the timezone_solar zone table and narrow time zones"""
+
+    @classmethod
+    def make_narrow_test(cls, testnum, longitude) -> callable:
+        """generate test case function for a narrow time zone by longitude"""
+        short_name, offset_min = expect_narrow(longitude)
+        description = f"test {PROGNUM:03}-{testnum:03}: lon {longitude} narrow → {short_name}"
+
+        def check(self):
+            obj = TimeZoneSolar(longitude=longitude, use_narrow=True)
+            self.assertEqual(obj.short_name, short_name)
+            self.assertEqual(obj.offset_min, offset_min)
+            self.assertIs(obj, TimeZoneSolar(tzname=short_name))
+            if abs(longitude) < 180:
+                entry = obj.zone_entry()
+                self.assertLessEqual(entry.west_lon - TZSConst.PRECISION_FP, longitude)
+                self.assertLessEqual(longitude, entry.east_lon + TZSConst.PRECISION_FP)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def make_table_test(cls, testnum, tz_type) -> callable:
+        """generate test case function checking zone table entries of a time zone type"""
+        description = f"test {PROGNUM:03}-{testnum:03}: {tz_type} zone table"
+
+        def check(self):
+            zones = ZONE_TABLE[tz_type]
+            self.assertEqual(len(zones), TABLE_SIZES[tz_type])
+            self.assertEqual(zones[0].west_lon, -180)
+            self.assertEqual(zones[-1].east_lon, 180)
+            self.assertEqual(zones[len(zones) // 2].offset_min, 0)
+            for index, entry in enumerate(zones):
+                self.assertEqual(entry.index, index)
+                self.assertEqual(entry.tz_type, tz_type)
+                self.assertEqual(entry.name, "Solar/" + entry.short_name)
+                self.assertEqual(entry.offset_min, round(entry.longitude * TZSConst.MINUTES_PER_DEGREE_LON))
+                if index > 0:
+                    self.assertEqual(entry.west_lon, zones[index - 1].east_lon)
+                zone = TimeZoneSolar(tzname=entry.short_name)
+                self.assertIs(zone.zone_entry(), entry)
+                self.assertEqual(zone.tz_type, tz_type)
+                self.assertIs(zone, TimeZoneSolar.zones(**TZ_TYPE_PARAMS[tz_type])[index])
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each zone table and narrow time zones at each 1/4 degree of longitude"""
+        testnum = 0
+        for tz_type in TZ_TYPE_NAMES:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_table_{tz_type}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_table_test(testnum, tz_type))
+            testnum += 1
+        for step in range(-180 * 4, 180 * 4 + 1):
+            longitude = step / 4.0
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_narrow_{step}"
+            setattr(cls, func_name, cls.make_narrow_test(testnum, longitude))
+            testnum += 1
+
+    def test_narrow_polar(self):
+        """narrow time zones use East0000 in polar regions"""
+        self.assertEqual(TimeZoneSolar(longitude=-122.597, latitude=85.0, use_narrow=True).short_name, "East0000")
+
+    def test_narrow_aliases(self):
+        """West0000 is an alias of East0000, and names are case-insensitive"""
+        self.assertIs(TimeZoneSolar(tzname="West0000"), TimeZoneSolar(tzname="East0000"))
+        self.assertIs(TimeZoneSolar(tzname="west0815"), TimeZoneSolar(tzname="West0815"))
+        self.assertEqual(TimeZoneSolar(tzname="West1200").offset_min, -720)
+
+    def test_bad_narrow_names(self):
+        """narrow time zone names must have minutes 00, 15, 30 or 45 and be within ±1200"""
+        for name in BAD_NARROW_NAMES:
+            with self.assertRaises(ValueError, msg=name):
+                TimeZoneSolar(tzname=name)
+
+    def test_type_flags(self):
+        """use_lon_tz and use_narrow can't both be set"""
+        with self.assertRaises(ValueError):
+            TimeZoneSolar(longitude=0, use_lon_tz=True, use_narrow=True)
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""unit tests of the timezone_solar name index and bulk name lookups"""
+
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import NAME_ALIASES, TZ_TYPE_NAMES, ZONE_NAMES, ZONE_TABLE
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 26
+BAD_NAMES = ["", "East", "East13", "West1215", "Lon181E", "Lon10W", "Solar/", "Solar/East13", "Solar:East08",
+             "Solar/Solar/East08", " East08", "East08 "]
+
+
+def _case_variants(name: str) -> list:
+    """variants of a name in different upper and lower case"""
+    return [name, name.lower(), name.upper(), name.swapcase()]
+
+
+class TestNames(unittest.TestCase):
+    """unit tests of the timezone_solar name index and bulk name lookups"""
+
+    @classmethod
+    def make_name_test(cls, testnum, short_name) -> callable:
+        """generate test case function comparing the name index with the name parser for one time zone name"""
+        description = f"test {PROGNUM:03}-{testnum:03}: name {short_name}"
+
+        def check(self):
+            # pylint: disable=protected-access
+            expected = TimeZoneSolar._tz_index(TimeZoneSolar._tz_name2params(short_name))
+            entry = ZONE_NAMES[short_name.lower()]
+            self.assertEqual((entry.tz_type, entry.index), expected)
+            zone = TimeZoneSolar._tz_instance(*expected)
+            for name in _case_variants(short_name) + _case_variants("Solar/" + short_name):
+                self.assertIs(TimeZoneSolar(tzname=name), zone)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for every time zone name and alias"""
+        testnum = 0
+        short_names = [entry.short_name for zones in ZONE_TABLE.values() for entry in zones] + list(NAME_ALIASES)
+        for short_name in short_names:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_name_{short_name}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_name_test(testnum, short_name))
+            testnum += 1
+
+    def test_index_size(self):
+        """the name index has each built-in table entry and alias, with and without the Solar/ prefix"""
+        table_size = sum(len(ZONE_TABLE[tz_type]) for tz_type in TZ_TYPE_NAMES)
+        self.assertEqual(len(ZONE_NAMES), 2 * (table_size + len(NAME_ALIASES)))
+        for name, entry in ZONE_NAMES.items():
+            self.assertEqual(name, name.lower())
+            self.assertIn(name.removeprefix("solar/"), (entry.short_name.lower(), *map(str.lower, NAME_ALIASES)))
+
+    def test_aliases(self):
+        """aliases at the Prime Meridian are the same shared instances as the zones they name"""
+        for alias, short_name in NAME_ALIASES.items():
+            self.assertIs(TimeZoneSolar(tzname=alias), TimeZoneSolar(tzname=short_name))
+            self.assertEqual(TimeZoneSolar(tzname=alias).offset_min, 0)
+
+    def test_bad_names(self):
+        """invalid names raise ValueError, singly and in bulk"""
+        for name in BAD_NAMES:
+            with self.assertRaises(ValueError, msg=name):
+                TimeZoneSolar(tzname=name)
+            with self.assertRaises(ValueError, msg=name):
+                TimeZoneSolar.resolve_names(["East08", name])
+
+    def test_resolve_names(self):
+        """bulk lookups return shared instances in input order, from any iterable"""
+        names = ["West08", "lon122w", "Solar/East0815", "WEST08", "West08", "West00"]
+        expected = [TimeZoneSolar(tzname=name) for name in names]
+        self.assertEqual(TimeZoneSolar.resolve_names(names), expected)
+        self.assertEqual(TimeZoneSolar.resolve_names(iter(names)), expected)
+        self.assertEqual(TimeZoneSolar.resolve_names(name for name in names), expected)
+        self.assertIs(TimeZoneSolar.resolve_names(names)[0], TimeZoneSolar.resolve_names(names)[4])
+        self.assertEqual(TimeZoneSolar.resolve_names([]), [])
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
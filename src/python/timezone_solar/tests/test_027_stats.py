@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar instrumentation counters"""
+
+import threading
+import unittest
+from timezone_solar import TimeZoneSolar, SolarLocation
+from timezone_solar.tzsserve import tz_fields
+from timezone_solar.tests.run_tests import main_tests_per_file
+
+# constants
+THREADS = 4
+THREAD_LOOPS = 500
+ORIGINAL_METHODS = {
+    (TimeZoneSolar, "_tz_index"): TimeZoneSolar.__dict__["_tz_index"],
+    (TimeZoneSolar, "_tz_instance"): TimeZoneSolar.__dict__["_tz_instance"],
+    (TimeZoneSolar, "get"): TimeZoneSolar.__dict__["get"],
+    (TimeZoneSolar, "field_getter"): TimeZoneSolar.__dict__["field_getter"],
+    (SolarLocation, "get"): SolarLocation.__dict__["get"],
+}
+
+
+class TestStats(unittest.TestCase):
+    """unit tests of timezone_solar instrumentation counters"""
+
+    def setUp(self):
+        TimeZoneSolar.enable_stats()
+        TimeZoneSolar.stats(reset=True)
+
+    def tearDown(self):
+        TimeZoneSolar.enable_stats(False)
+        TimeZoneSolar.stats(reset=True)
+
+    def test_constructions(self):
+        """constructions are counted by path: name, longitude and polar latitude override"""
+        TimeZoneSolar(longitude=-122.597)
+        TimeZoneSolar(longitude=-122.597, latitude=45.589)
+        TimeZoneSolar(longitude=-122.597, latitude=85.0, use_narrow=True)
+        TimeZoneSolar(longitude=0, latitude="-80")
+        TimeZoneSolar(tzname="West08")
+        TimeZoneSolar.locate(tzname="Lon122W")
+        TimeZoneSolar.resolve_names(["East01", "East01", "East02"])
+        stats = TimeZoneSolar.stats()
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(stats["constructions"], {"name": 4, "longitude": 2, "polar": 2})
+        self.assertGreater(stats["time"]["lookup"], 0)
+        self.assertGreater(stats["time"]["instance"], 0)
+
+    def test_failures(self):
+        """validation failures are counted by path, and still raise ValueError"""
+        for params in ({"longitude": 181}, {"longitude": "x"}, {"longitude": 0, "latitude": 91}, {"tzname": "East13"}):
+            with self.assertRaises(ValueError):
+                TimeZoneSolar(**params)
+        location = TimeZoneSolar.locate(longitude=10)
+        with self.assertRaises(ValueError):
+            location.get("bogus")
+        stats = TimeZoneSolar.stats()
+        self.assertEqual(stats["failures"], {"name": 1, "longitude": 3, "get": 1})
+        self.assertEqual(stats["constructions"]["longitude"], 1)
+
+    def test_get(self):
+        """get() calls are counted once per field, whether on a time zone or a location"""
+        location = TimeZoneSolar.locate(longitude=-122.597, latitude=45.589)
+        for field in ("longitude", "latitude", "short_name", "long_name", "offset"):
+            self.assertEqual(location.get(field), location.get(field))
+        location.zone.get("offset")
+        stats = TimeZoneSolar.stats()
+        self.assertEqual(stats["get"], {"longitude": 2, "latitude": 2, "short_name": 2, "long_name": 2, "offset": 3})
+        self.assertGreater(stats["time"]["get"], 0)
+
+    def test_field_getter(self):
+        """fields read through field_getter() accessors and the CLI field lookups are counted like get() calls"""
+        location = TimeZoneSolar.locate(longitude=-122.597, latitude=45.589)
+        self.assertEqual(TimeZoneSolar.field_getter("short_name", "latitude", text=True)(location),
+                         ("West08", "45.589"))
+        self.assertEqual(tz_fields({"longitude": "-122", "get": ["name", "offset"]}),
+                         (["Solar/West08", "-08:00"], None))
+        self.assertEqual(tz_fields({"tzname": "East01", "get": ["name,offset"]}), (["Solar/East01", "+01:00"], None))
+        stats = TimeZoneSolar.stats()
+        self.assertEqual(stats["get"], {"short_name": 1, "latitude": 1, "name": 2, "offset": 2})
+        self.assertGreater(stats["time"]["get"], 0)
+
+        # accessors cached while instrumentation was enabled aren't used after it's disabled
+        TimeZoneSolar.enable_stats(False)
+        TimeZoneSolar.stats(reset=True)
+        self.assertEqual(tz_fields({"longitude": "-122", "get": ["name", "offset"]}),
+                         (["Solar/West08", "-08:00"], None))
+        self.assertEqual(TimeZoneSolar.stats()["get"], {})
+
+    def test_reset(self):
+        """a snapshot with reset returns the counts, then sets them to zero"""
+        TimeZoneSolar(longitude=5).get("name")
+        stats = TimeZoneSolar.stats(reset=True)
+        self.assertEqual(stats["constructions"]["longitude"], 1)
+        self.assertEqual(stats["get"], {"name": 1})
+        stats = TimeZoneSolar.stats()
+        self.assertEqual(stats["constructions"], {"name": 0, "longitude": 0, "polar": 0})
+        self.assertEqual(stats["get"], {})
+        self.assertEqual(stats["time"], {"lookup": 0.0, "instance": 0.0, "get": 0.0})
+
+    def test_disabled(self):
+        """disabling restores the original methods, and nothing more is counted"""
+        TimeZoneSolar.enable_stats()  # enabling twice doesn't wrap twice
+        TimeZoneSolar.enable_stats(False)
+        for (cls, name), method in ORIGINAL_METHODS.items():
+            self.assertIs(cls.__dict__[name], method)
+        TimeZoneSolar(longitude=5).get("name")
+        stats = TimeZoneSolar.stats()
+        self.assertFalse(stats["enabled"])
+        self.assertEqual(stats["constructions"]["longitude"], 0)
+        self.assertEqual(stats["get"], {})
+
+    def test_threads(self):
+        """counts are exact when several threads construct time zones at once"""
+
+        def worker():
+            for num in range(THREAD_LOOPS):
+                TimeZoneSolar(longitude=num % 360 - 180).get("short_name")
+
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = TimeZoneSolar.stats()
+        self.assertEqual(stats["constructions"]["longitude"], THREADS * THREAD_LOOPS)
+        self.assertEqual(stats["get"], {"short_name": THREADS * THREAD_LOOPS})
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""unit tests of the asyncio HTTP lookup server in timezone_solar"""
+
+import asyncio
+import json
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzshttp import LookupServer, LatencyHistogram, lookup_args, resolve_lookup, resolve_lookups
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 28
+CONCURRENT_CLIENTS = 50
+TEST_FIXTURE = [
+    ("GET", "/lookup?longitude=-122.597&latitude=45.589&get=short_name,offset", None,
+     200, {"short_name": "West08", "offset": "-08:00"}),
+    ("GET", "/lookup?longitude=-122.597&type=narrow&get=short_name&get=longitude", None,
+     200, {"short_name": "West0815", "longitude": "-122.597"}),
+    ("GET", "/lookup?tzname=west08&get=name,is_utc", None, 200, {"name": "Solar/West08", "is_utc": "0"}),
+    ("POST", "/lookup", {"longitude": 10.5, "type": "longitude", "get": "short_name,offset"},
+     200, {"short_name": "Lon011E", "offset": "+00:44"}),
+    ("POST", "/lookup", {"longitude": "180", "latitude": 85, "get": ["short_name", "is_utc"]},
+     200, {"short_name": "East00", "is_utc": "1"}),
+    ("POST", "/lookup", {"tzname": "Solar/Lon123W", "get": ["offset_min"]}, 200, {"offset_min": "-492"}),
+    ("POST", "/lookup", {"longitude": -122.597, "get": "name,bogus"}, 400, {"error": "unknown field bogus"}),
+    ("POST", "/lookup", {"longitude": 190, "get": "name"},
+     400, {"error": "_tz_params: longitude must be in the range -180 to +180"}),
+    ("GET", "/lookup?longitude=abc&get=name", None, 400, {"error": "longitude must be a number, got abc"}),
+    ("POST", "/lookup", {"longitude": True, "get": "name"}, 400, {"error": "longitude must be a number"}),
+    ("GET", "/lookup?longitude=0", None, 400, {"error": "get is required to specify output field(s)"}),
+    ("GET", "/lookup?get=name", None, 400, {"error": "longitude parameter missing"}),
+    ("POST", "/lookup", {"longitude": 0, "type": "bogus", "get": "name"},
+     400, {"error": "unknown time zone type bogus"}),
+    ("POST", "/lookup", [1, 2], 400, {"error": "lookup must be a JSON object"}),
+    ("GET", "/health", None, 200, {"status": "ok"}),
+    ("GET", "/nowhere", None, 404, {"error": "no endpoint /nowhere"}),
+    ("GET", "/batch", None, 405, {"error": "/batch doesn't accept GET"}),
+    ("POST", "/batch", {"requests": "x"},
+     400, {"error": "batch must be a JSON array or an object with a requests array"}),
+]
+
+
+def _http_request(method: str, target: str, body=None, headers: dict = None) -> bytes:
+    """format an HTTP/1.1 request with an optional JSON body"""
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    lines = [f"{method} {target} HTTP/1.1", "Host: localhost", f"Content-Length: {len(data)}"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + data
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple:
+    """read an HTTP response, returning the status, lower-case headers and decoded JSON body"""
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers["content-length"]))
+    return status, headers, json.loads(body)
+
+
+class TestHTTP(unittest.IsolatedAsyncioTestCase):
+    """unit tests of the asyncio HTTP lookup server in timezone_solar"""
+
+    async def asyncSetUp(self):
+        self.lookup_server = LookupServer()
+        self.server = await self.lookup_server.start("127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        self.lookup_server.close_connections()
+        await self.server.wait_closed()
+        while self.lookup_server.writers:
+            await asyncio.sleep(0)
+
+    async def _connect(self) -> tuple:
+        """open a client connection to the test server"""
+        return await asyncio.open_connection("127.0.0.1", self.port)
+
+    async def _exchange(self, method: str, target: str, body=None, headers: dict = None) -> tuple:
+        """send one request on a new connection and read the response"""
+        reader, writer = await self._connect()
+        try:
+            writer.write(_http_request(method, target, body, headers))
+            return await _read_response(reader)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    @classmethod
+    def make_request_test(cls, testnum, method, target, body, status, expected) -> callable:
+        """generate test case function for one request and its response"""
+        description = f"test {PROGNUM:03}-{testnum:03}: {method} {target} {'' if body is None else json.dumps(body)}"
+
+        async def check(self):
+            result = await self._exchange(method, target, body)
+            self.assertEqual(result[0], status)
+            self.assertEqual(result[1]["content-type"], "application/json")
+            self.assertEqual(result[2], expected)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each request in the fixture"""
+        testnum = 0
+        for method, target, body, status, expected in TEST_FIXTURE:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_request"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_request_test(testnum, method, target, body, status, expected))
+            testnum += 1
+
+    async def test_batch(self):
+        """a batch request has a result or error for each lookup, in order"""
+        lookups = [
+            {"longitude": -122.597, "get": "short_name"},
+            {"tzname": "East0815", "get": "offset"},
+            {"longitude": 999, "get": "name"},
+            "West08",
+            {"longitude": -122.597, "get": "short_name"},
+        ]
+        status, _, result = await self._exchange("POST", "/batch", lookups)
+        self.assertEqual(status, 200)
+        self.assertEqual(result, [
+            {"short_name": "West08"},
+            {"offset": "+08:15"},
+            {"error": "_tz_params: longitude must be in the range -180 to +180"},
+            {"error": "lookup must be a JSON object"},
+            {"short_name": "West08"},
+        ])
+
+    async def test_keep_alive(self):
+        """a connection answers pipelined requests in order, until the client asks to close it"""
+        reader, writer = await self._connect()
+        writer.write(_http_request("GET", "/lookup?longitude=15&get=short_name")
+                     + _http_request("POST", "/lookup", {"longitude": 30, "get": "short_name"})
+                     + _http_request("GET", "/lookup?longitude=45&get=short_name", headers={"Connection": "close"}))
+        for short_name, connection in (("East01", "keep-alive"), ("East02", "keep-alive"), ("East03", "close")):
+            status, headers, result = await _read_response(reader)
+            self.assertEqual((status, headers["connection"], result), (200, connection, {"short_name": short_name}))
+        self.assertEqual(await reader.read(), b"")
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_http10(self):
+        """HTTP/1.0 connections close after one response"""
+        reader, writer = await self._connect()
+        writer.write(b"GET /health HTTP/1.0\r\n\r\n")
+        status, headers, _ = await _read_response(reader)
+        self.assertEqual((status, headers["connection"]), (200, "close"))
+        self.assertEqual(await reader.read(), b"")
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_bad_requests(self):
+        """requests which can't be read get an error response and the connection is closed"""
+        for request, status in (
+            (b"NONSENSE\r\n\r\n", 400),
+            (b"POST /lookup HTTP/1.1\r\nContent-Length: x\r\n\r\n", 400),
+            (b"POST /lookup HTTP/1.1\r\nContent-Length: 999999999\r\n\r\n", 413),
+            (b"POST /lookup HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", 501),
+        ):
+            reader, writer = await self._connect()
+            writer.write(request)
+            result = await _read_response(reader)
+            self.assertEqual((result[0], result[1]["connection"]), (status, "close"), msg=request)
+            self.assertEqual(await reader.read(), b"")
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_coalescing(self):
+        """single lookups from concurrent connections are resolved in shared batches, with correct results"""
+
+        async def client(num):
+            longitude = num * 7 % 360 - 180
+            return await self._exchange("GET", f"/lookup?longitude={longitude}&get=longitude,offset_min")
+
+        results = await asyncio.gather(*(client(num) for num in range(CONCURRENT_CLIENTS)))
+        for num, (status, _, result) in enumerate(results):
+            self.assertEqual(status, 200)
+            self.assertEqual(result["longitude"], str(num * 7 % 360 - 180))
+        coalescing = self.lookup_server.metrics.as_dict()["coalescing"]
+        self.assertEqual(coalescing["lookups"], CONCURRENT_CLIENTS)
+        self.assertLess(coalescing["batches"], CONCURRENT_CLIENTS)
+        self.assertGreater(coalescing["max_batch"], 1)
+
+    async def test_metrics(self):
+        """the metrics endpoint counts responses and their latencies by endpoint"""
+        await self._exchange("GET", "/lookup?longitude=15&get=short_name")
+        await self._exchange("GET", "/lookup?longitude=15")
+        await self._exchange("GET", "/elsewhere")
+        status, _, metrics = await self._exchange("GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertEqual(metrics["responses"], [
+            {"endpoint": "/lookup", "status": 200, "count": 1},
+            {"endpoint": "/lookup", "status": 400, "count": 1},
+            {"endpoint": "other", "status": 404, "count": 1},
+        ])
+        histogram = metrics["latency"]["/lookup"]
+        self.assertEqual(histogram["count"], 2)
+        self.assertEqual(histogram["buckets_ms"]["+Inf"], 2)
+        self.assertEqual(metrics["connections"]["total"], 4)
+        self.assertEqual(metrics["connections"]["open"], 1)
+
+    def test_resolve_lookups(self):
+        """lookups resolved together by type get the same results as each lookup resolved alone"""
+        objs = [
+            {"longitude": (num * 7.31) % 360 - 180, "latitude": (num * 3.7) % 180 - 90, "type": tz_type,
+             "get": "short_name,offset,longitude,latitude"}
+            for num in range(200) for tz_type in (None, "narrow", "longitude")
+        ]
+        objs += [{"longitude": (num * 11.3) % 360 - 180, "get": ["name", "is_utc"]} for num in range(50)]
+        objs += [
+            {"tzname": "Lon122W", "get": "offset"},
+            {"longitude": -122.597, "get": "name,bogus"},
+            {"longitude": 0, "type": "bogus", "get": "name"},
+            {"longitude": -122.597, "latitude": 45.589, "get": "short_name"},
+        ]
+        lookups = [lookup_args(obj) for obj in objs]
+        lookups += lookups[:10]
+        self.assertEqual(resolve_lookups(lookups), [resolve_lookup(args) for args in lookups])
+
+        # a group with an invalid coordinate reports it, and the other lookups of the group are still resolved
+        lookups = [lookup_args({"longitude": lon, "get": "short_name"}) for lon in (-122.597, 190, 15)]
+        self.assertEqual(resolve_lookups(lookups), [
+            (True, {"short_name": "West08"}),
+            (False, {"error": "_tz_params: longitude must be in the range -180 to +180"}),
+            (True, {"short_name": "East01"}),
+        ])
+
+    def test_resolve_lookups_vectorized(self):
+        """lookups by longitude are resolved from zone indexes, without constructing a TimeZoneSolar per point"""
+        lookups = [lookup_args({"longitude": lon / 4.0, "get": "short_name"}) for lon in range(-720, 721)]
+        TimeZoneSolar.enable_stats()
+        try:
+            TimeZoneSolar.stats(reset=True)
+            resolve_lookups(lookups)
+            self.assertEqual(sum(TimeZoneSolar.stats()["constructions"].values()), 0)
+        finally:
+            TimeZoneSolar.enable_stats(False)
+            TimeZoneSolar.stats(reset=True)
+
+    def test_histogram(self):
+        """latency histograms count each latency in the first bucket with an upper bound at least as large"""
+        histogram = LatencyHistogram()
+        for latency_ms in (0.05, 0.1, 0.3, 7.0, 2000.0):
+            histogram.add(latency_ms)
+        data = histogram.as_dict()
+        self.assertEqual(data["buckets_ms"]["0.1"], 2)
+        self.assertEqual(data["buckets_ms"]["0.5"], 3)
+        self.assertEqual(data["buckets_ms"]["10"], 4)
+        self.assertEqual(data["buckets_ms"]["1000"], 4)
+        self.assertEqual(data["buckets_ms"]["+Inf"], 5)
+        self.assertEqual(data["p50_ms"], 0.5)
+        self.assertIsNone(data["p99_ms"])
+        self.assertEqual(data["max_ms"], 2000.0)
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""unit tests of concurrent use of timezone_solar from multiple threads"""
+
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from timezone_solar import TimeZoneSolar, SolarLocation
+from timezone_solar.tzsconst import TZSConst
+from timezone_solar.tzstable import TZ_TYPE_NAMES, TZ_TYPE_PARAMS, ZONE_FAMILIES, ZONE_TABLE, define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 29
+THREADS = 8
+TASKS = 64
+SWITCH_INTERVAL = 1e-6
+DT_UTC = datetime(2024, 6, 21, 12, 0, tzinfo=timezone.utc)
+
+
+def _lookup_task(num: int) -> tuple:
+    """a mix of lookups by one thread, returning what it found"""
+    longitude = (num * 37.3) % 360 - 180
+    latitude = (num * 11.1) % 180 - 90
+    results = []
+    for tz_params in TZ_TYPE_PARAMS.values():
+        zone = TimeZoneSolar(longitude=longitude, latitude=latitude, **tz_params)
+        location = TimeZoneSolar.locate(longitude=longitude, latitude=latitude, **tz_params)
+        results.append((
+            zone,
+            location.zone,
+            TimeZoneSolar(tzname=zone.short_name.lower()),
+            location.get("longitude"),
+            location.get("offset"),
+            DT_UTC.astimezone(zone).isoformat(),
+        ))
+    results.append(tuple(TimeZoneSolar.resolve_names(["West08", "Lon123W", "East0815"] * 3)))
+    return tuple(results)
+
+
+class TestThreads(unittest.TestCase):
+    """unit tests of concurrent use of timezone_solar from multiple threads"""
+
+    def setUp(self):
+        # switch threads as often as possible, to interleave threads on builds with a global interpreter lock
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(SWITCH_INTERVAL)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    @classmethod
+    def make_cold_cache_test(cls, testnum, tz_type) -> callable:
+        """generate test case function for threads racing to create the shared instances of a time zone type"""
+        description = f"test {PROGNUM:03}-{testnum:03}: {THREADS} threads create shared {tz_type} instances"
+
+        def check(self):
+            # a new subclass has its own shared instances, so none of them exist before the threads start
+            class FreshZone(TimeZoneSolar):
+                """subclass with no shared instances yet"""
+
+                __slots__ = ()
+
+            barrier = threading.Barrier(THREADS)
+            zones = ZONE_TABLE[tz_type]
+            middles = [(entry.west_lon + entry.east_lon) / 2 for entry in zones]
+
+            def create_all():
+                barrier.wait()
+                return [FreshZone(longitude=middle, **TZ_TYPE_PARAMS[tz_type]) for middle in middles]
+
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                results = list(executor.map(lambda _: create_all(), range(THREADS)))
+            for result in results:
+                for first, other in zip(results[0], result):
+                    self.assertIs(first, other)
+            self.assertEqual([zone.short_name for zone in results[0]], [entry.short_name for entry in zones])
+            self.assertEqual(FreshZone.zones(**TZ_TYPE_PARAMS[tz_type]), tuple(results[0]))
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each time zone type"""
+        testnum = 0
+        for tz_type in TZ_TYPE_NAMES:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_cold_cache_{tz_type}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_cold_cache_test(testnum, tz_type))
+            testnum += 1
+
+    def test_thread_pool(self):
+        """lookups from a thread pool get the same results as the same lookups in one thread"""
+        expected = [_lookup_task(num) for num in range(TASKS)]
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(_lookup_task, range(TASKS)))
+        self.assertEqual(results, expected)
+        for result, expect in zip(results, expected):
+            for found, found_expect in zip(result, expect):
+                for item, item_expect in zip(found, found_expect):
+                    if isinstance(item, TimeZoneSolar):
+                        self.assertIs(item, item_expect)
+
+    def test_locations(self):
+        """recording coordinates from many threads doesn't change the shared instance"""
+        zone = TimeZoneSolar(tzname="West08")
+
+        def locate(num):
+            longitude = -120 + num / TASKS
+            location = SolarLocation(zone, longitude, num % 90)
+            return location.longitude, location.latitude, location.zone
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(locate, range(TASKS)))
+        for num, (longitude, latitude, found) in enumerate(results):
+            self.assertEqual((longitude, latitude), (-120 + num / TASKS, num % 90))
+            self.assertIs(found, zone)
+        self.assertEqual(zone.longitude, -120)
+
+    def test_zoneinfo(self):
+        """threads racing to load zoneinfo equivalents all get the same object"""
+        zones = TimeZoneSolar.zones(use_lon_tz=True)
+        barrier = threading.Barrier(THREADS)
+
+        def load_all():
+            barrier.wait()
+            return [zone.as_zoneinfo() for zone in zones]
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(lambda _: load_all(), range(THREADS)))
+        for result in results:
+            for first, other in zip(results[0], result):
+                self.assertIs(first, other)
+
+    def test_define_family(self):
+        """threads racing to define a zone family all get the same one, and can look up its zones at once"""
+        barrier = threading.Barrier(THREADS)
+
+        def define(_):
+            barrier.wait()
+            family = define_family("race20", 20)
+            return family, TimeZoneSolar(longitude=-120.0, tz_type="race20")
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(define, range(THREADS)))
+        family = ZONE_FAMILIES["race20"]
+        self.assertIs(family.zones, ZONE_TABLE["race20"])
+        for found, zone in results:
+            self.assertIs(found, family)
+            self.assertIs(zone, results[0][1])
+        self.assertEqual(results[0][1].short_name, "West0800")
+
+    def test_constants(self):
+        """constants can be read from many threads"""
+
+        def read(_):
+            return TZSConst.get("PRECISION_FP"), TZSConst().max_longitude_int, TZSConst.LIMIT_LATITUDE
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = set(executor.map(read, range(TASKS)))
+        self.assertEqual(results, {(TZSConst.PRECISION_FP, TZSConst.MAX_LONGITUDE_INT, TZSConst.LIMIT_LATITUDE)})
+
+    def test_stats_toggle(self):
+        """instrumentation can be turned on and off while other threads look up time zones"""
+        stop = threading.Event()
+
+        def toggle():
+            while not stop.is_set():
+                TimeZoneSolar.enable_stats(True)
+                TimeZoneSolar.enable_stats(False)
+
+        toggler = threading.Thread(target=toggle)
+        toggler.start()
+        try:
+            expected = [_lookup_task(num) for num in range(TASKS // 4)]
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                results = list(executor.map(_lookup_task, range(TASKS // 4)))
+        finally:
+            stop.set()
+            toggler.join()
+            TimeZoneSolar.enable_stats(False)
+            TimeZoneSolar.stats(reset=True)
+        self.assertEqual(results, expected)
+        self.assertFalse(TimeZoneSolar.stats()["enabled"])
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar zone families and their precomputed boundaries"""
+
+import importlib.util
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzsconst import TZSConst
+from timezone_solar.tzstable import TZ_TYPE_WIDTHS, ZONE_FAMILIES, ZONE_TABLE, define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 30
+DEFINED_FAMILIES = {"half": 30, "min05": 5, "min01": 1}
+TEST_FAMILIES = {"hour": 60, "narrow": 15, "longitude": 4, **DEFINED_FAMILIES}
+TEST_FIXTURE = [
+    # (tz_type, longitude, short name, offset in minutes)
+    ("half", -122.597, "West0800", -480),
+    ("half", 3.749, "East0000", 0),
+    ("half", 3.75, "East0030", 30),
+    ("half", -3.75, "West0030", -30),
+    ("half", 176.25, "East1200", 720),
+    ("half", -176.25, "West1200", -720),
+    ("half", -180, "East1200", 720),
+    ("min05", -122.597, "West0810", -490),
+    ("min05", 0.625, "East0005", 5),
+    ("min05", 179.5, "East1200", 720),
+    ("min05", -179.5, "West1200", -720),
+    ("min01", 45.12, "East0300", 180),
+    ("min01", 45.125, "East0301", 181),
+]
+BAD_STEPS = [0, -30, 7, 1.5, "30", True, 1440]
+
+# define test families before generating tests from the zone table
+for _tz_type, _step_min in DEFINED_FAMILIES.items():
+    define_family(_tz_type, _step_min)
+
+
+def nearest_index(longitude: float, width: float, tz_max: int) -> int:
+    """reference zone index by rounding to the nearest zone centerline, for longitudes away from boundaries"""
+    return round(longitude / width) + tz_max
+
+
+class TestFamilies(unittest.TestCase):
+    """unit tests of timezone_solar zone families and their precomputed boundaries"""
+
+    @classmethod
+    def make_family_test(cls, testnum, tz_type, step_min) -> callable:
+        """generate test case function for the boundaries and zones of a zone family"""
+        description = f"test {PROGNUM:03}-{testnum:03}: {tz_type} zone family boundaries"
+
+        def check(self):
+            family = ZONE_FAMILIES[tz_type]
+            self.assertEqual(family.step_min, step_min)
+            self.assertEqual(family.width, step_min / TZSConst.MINUTES_PER_DEGREE_LON)
+            self.assertEqual(len(family.zones), 2 * family.tz_max + 1)
+            self.assertIs(ZONE_TABLE[tz_type], family.zones)
+            self.assertEqual(list(family.bounds), sorted(family.bounds))
+            self.assertEqual(len(family.slot_index), len(family.bounds) + 1)
+
+            # each zone contains its centerline and the midpoints between its centerline and boundaries
+            for entry in family.zones:
+                for longitude in (entry.longitude, (entry.west_lon + entry.longitude) / 2,
+                                  (entry.longitude + entry.east_lon) / 2):
+                    if longitude > -TZSConst.MAX_LONGITUDE_INT:
+                        self.assertEqual(family.lon2index(longitude), entry.index, msg=longitude)
+                        zone = TimeZoneSolar(longitude=longitude, tz_type=tz_type)
+                        self.assertEqual((zone.tz_type, zone.zone_index), (tz_type, entry.index))
+
+            # boundaries belong to the zone farther from the Prime Meridian, and -180° is the same as +180°
+            for entry in family.zones[1:-1]:
+                west = entry.index - 1 if entry.longitude <= 0 else entry.index
+                east = entry.index + 1 if entry.longitude >= 0 else entry.index
+                self.assertEqual(family.lon2index(entry.west_lon), west)
+                self.assertEqual(family.lon2index(entry.east_lon), east)
+            for longitude in (-TZSConst.MAX_LONGITUDE_FP, -TZSConst.MAX_LONGITUDE_INT, TZSConst.MAX_LONGITUDE_FP):
+                self.assertEqual(family.lon2index(longitude), 2 * family.tz_max)
+
+            # all other longitudes round to the nearest centerline
+            for step in range(-360 * 8, 360 * 8 + 1):
+                longitude = step / 16.0 + 0.01
+                if abs(longitude) <= TZSConst.MAX_LONGITUDE_INT:
+                    expected = nearest_index(longitude, family.width, family.tz_max)
+                    self.assertEqual(family.lon2index(longitude), expected, msg=longitude)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def make_lookup_test(cls, testnum, tz_type, longitude, short_name, offset_min) -> callable:
+        """generate test case function for a time zone lookup in a defined zone family"""
+        description = f"test {PROGNUM:03}-{testnum:03}: lon {longitude} {tz_type} → {short_name}"
+
+        def check(self):
+            zone = TimeZoneSolar(longitude=longitude, tz_type=tz_type)
+            self.assertEqual((zone.short_name, zone.name), (short_name, f"Solar/{short_name}"))
+            self.assertEqual(zone.offset_min, offset_min)
+            self.assertEqual((zone.use_lon_tz, zone.use_narrow), (False, False))
+            self.assertIs(zone, TimeZoneSolar(longitude=longitude, tz_type=tz_type))
+            self.assertIs(zone, TimeZoneSolar.zones(tz_type=tz_type)[zone.zone_index])
+            self.assertEqual(zone.zone_entry().short_name, short_name)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each zone family and fixture lookup"""
+        testnum = 0
+        for tz_type, step_min in TEST_FAMILIES.items():
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_family_{tz_type}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_family_test(testnum, tz_type, step_min))
+            testnum += 1
+        for tz_type, longitude, short_name, offset_min in TEST_FIXTURE:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_lookup_{tz_type}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_lookup_test(testnum, tz_type, longitude, short_name, offset_min))
+            testnum += 1
+
+    def test_builtin_widths(self):
+        """the built-in zone families have the widths of their time zone types"""
+        for tz_type, width in TZ_TYPE_WIDTHS.items():
+            self.assertEqual(ZONE_FAMILIES[tz_type].width, width)
+
+    def test_define(self):
+        """defining a family again with the same step returns it, and invalid definitions are rejected"""
+        self.assertIs(define_family("half", 30), ZONE_FAMILIES["half"])
+        with self.assertRaises(ValueError):
+            define_family("half", 20)
+        self.assertIs(define_family("narrow", 15), ZONE_FAMILIES["narrow"])
+        with self.assertRaises(ValueError):
+            define_family("hour", 30)
+        for step_min in BAD_STEPS:
+            with self.assertRaises(ValueError, msg=step_min):
+                define_family("bad", step_min)
+        self.assertNotIn("bad", ZONE_FAMILIES)
+        with self.assertRaises(ValueError):
+            define_family("", 30)
+
+    def test_params(self):
+        """tz_type names a zone family, and can't be combined with use_lon_tz or use_narrow"""
+        self.assertIs(TimeZoneSolar(longitude=-122.597, tz_type="narrow"),
+                      TimeZoneSolar(longitude=-122.597, use_narrow=True))
+        self.assertIs(TimeZoneSolar(longitude=-122.597, latitude=85, tz_type="half"),
+                      TimeZoneSolar(longitude=0, tz_type="half"))
+        for tz_params in ({"tz_type": "bogus"}, {"tz_type": "half", "use_narrow": True},
+                          {"tz_type": "longitude", "use_lon_tz": True}):
+            with self.assertRaises(ValueError, msg=tz_params):
+                TimeZoneSolar(longitude=0, **tz_params)
+
+    def test_names(self):
+        """defined families aren't in the name index, so names resolve to the built-in zones"""
+        self.assertEqual(TimeZoneSolar(tzname="East0030").tz_type, "narrow")
+        with self.assertRaises(ValueError):
+            TimeZoneSolar(tzname="East0005")
+
+    @unittest.skipIf(importlib.util.find_spec("numpy") is None, "NumPy is not installed")
+    def test_array(self):
+        """vectorized lookups in a defined family match the scalar path"""
+        longitudes = [step / 8.0 for step in range(-180 * 8, 180 * 8 + 1)]
+        for tz_type in DEFINED_FAMILIES:
+            result = TimeZoneSolar.resolve_array(longitudes, tz_type=tz_type)
+            zones = [TimeZoneSolar(longitude=longitude, tz_type=tz_type) for longitude in longitudes]
+            self.assertEqual(result["zone_index"].tolist(), [zone.zone_index for zone in zones])
+            self.assertEqual(result["offset_min"].tolist(), [zone.offset_min for zone in zones])
+            self.assertEqual(result["short_name"].tolist(), [zone.short_name for zone in zones])
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar memory-mapped zone rasters"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+try:
+    import numpy as np
+    from timezone_solar import tzsraster
+except ImportError as exc:
+    raise unittest.SkipTest("NumPy is not installed") from exc
+
+# constants
+PROGNUM = 31
+TEST_RASTERS = [
+    # (time zone type, cells per degree)
+    ("hour", 1),
+    ("hour", 3),
+    ("narrow", 2),
+    ("longitude", 4),
+    ("half", 2),
+]
+TEST_POINTS = 2000
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "..", "scripts", "lon_tz.py")
+
+define_family("half", 30)
+
+
+class TestRaster(unittest.TestCase):
+    """unit tests of timezone_solar memory-mapped zone rasters"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    @classmethod
+    def path(cls, name) -> str:
+        """path of a file in the temporary directory"""
+        return os.path.join(cls.tmpdir.name, name)
+
+    @classmethod
+    def make_raster_test(cls, testnum, tz_type, per_degree) -> callable:
+        """generate test case function comparing a raster with TimeZoneSolar at cell centers and random points"""
+        description = f"test {PROGNUM:03}-{testnum:03}: {tz_type} raster, {per_degree} cells per degree"
+
+        def check(self):
+            path = self.path(f"raster-{testnum}.bin")
+            written = tzsraster.write_raster(path, per_degree, tz_type=tz_type)
+            raster = tzsraster.open_raster(path)
+            self.assertEqual((raster.tz_type, raster.per_degree), (tz_type, per_degree))
+            self.assertEqual(raster.cells.shape, (180 * per_degree, 360 * per_degree))
+            self.assertTrue(np.array_equal(raster.cells, written.cells))
+            self.assertFalse(raster.cells.flags.writeable)
+            self.assertEqual(os.listdir(self.tmpdir.name).count(f"raster-{testnum}.bin"), 1)
+
+            # every cell holds the zone of its center
+            lon, lat = raster.centers()
+            for row in range(0, len(lat), max(1, len(lat) // 24)):
+                expected = [
+                    TimeZoneSolar(longitude=float(center), latitude=float(lat[row]), tz_type=tz_type).zone_index
+                    for center in lon
+                ]
+                self.assertEqual(raster.cells[row].tolist(), expected, msg=f"row {row}, latitude {lat[row]}")
+
+            # points are found in the cells which contain them
+            rng = np.random.default_rng(testnum)
+            points_lon = np.concatenate([rng.uniform(-180, 180, TEST_POINTS), [-180.0, 180.0, 0.0, 0.0]])
+            points_lat = np.concatenate([rng.uniform(-90, 90, TEST_POINTS), [90.0, -90.0, 90.0, -90.0]])
+            row, col = raster.cell_of(points_lon, points_lat)
+            self.assertTrue(np.all(np.abs(lon[col] - points_lon) <= 0.5 / per_degree + 1e-9))
+            self.assertTrue(np.all(np.abs(lat[row] - points_lat) <= 0.5 / per_degree + 1e-9))
+            self.assertEqual(raster.index_at(points_lon, points_lat).tolist(), raster.cells[row, col].tolist())
+            self.assertEqual(raster.short_names()[raster.index_at(-122.597, 45.589)],
+                             TimeZoneSolar(longitude=-122.597, tz_type=tz_type).short_name)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each raster type and resolution"""
+        testnum = 0
+        for tz_type, per_degree in TEST_RASTERS:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_raster_{tz_type}_{per_degree}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_raster_test(testnum, tz_type, per_degree))
+            testnum += 1
+
+    def test_invalid(self):
+        """invalid resolutions and files which aren't rasters are rejected"""
+        for per_degree in (0, -1, 1.5, True, tzsraster.MAX_PER_DEGREE + 1):
+            with self.assertRaises(ValueError, msg=per_degree):
+                tzsraster.write_raster(self.path("invalid.bin"), per_degree)
+        self.assertFalse(any(name.startswith("invalid") for name in os.listdir(self.tmpdir.name)))
+        with self.assertRaises(ValueError):
+            tzsraster.write_raster(self.path("invalid.bin"), tz_type="bogus")
+
+        path = self.path("truncated.bin")
+        tzsraster.write_raster(path, 1)
+        with open(path, "r+b") as rasterfile:
+            rasterfile.truncate(tzsraster.HEADER_SIZE + 100)
+        with self.assertRaises(ValueError):
+            tzsraster.open_raster(path)
+        with open(path, "wb") as rasterfile:
+            rasterfile.write(b"not a raster")
+        with self.assertRaises(ValueError):
+            tzsraster.open_raster(path)
+
+    def test_cli(self):
+        """lon_tz.py --raster writes a raster file"""
+        path = self.path("cli.bin")
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, SCRIPT, f"--raster={path}", "--raster-res=2", "--type=narrow"],
+            capture_output=True, text=True, env=env, check=False,
+        )
+        self.assertEqual((result.returncode, result.stderr), (0, ""))
+        raster = tzsraster.open_raster(path)
+        self.assertEqual((raster.tz_type, raster.per_degree, raster.cells.shape), ("narrow", 2, (360, 720)))
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar batch resolution of buffer-protocol arrays"""
+
+import unittest
+from array import array
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import TZ_TYPE_PARAMS, define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 32
+TEST_LONGITUDES = [step / 4.0 for step in range(-180 * 4, 180 * 4 + 1)] + [
+    -180.0, -179.9999995, -172.5, -7.5, -7.4999995, -0.0, 7.5, 172.5, 179.9999995, 180.0000004,
+]
+TEST_LATITUDES = [0.0, 45.589, -79.99999, 80.0, -90.0]
+TEST_TYPES = {tz_type: dict(tz_params) for tz_type, tz_params in TZ_TYPE_PARAMS.items()}
+TEST_TYPES["half"] = {"tz_type": "half"}
+
+define_family("half", 30)
+
+
+def expected_zones(longitudes, latitudes, tz_params) -> list:
+    """zones from TimeZoneSolar for each point"""
+    if latitudes is None:
+        return [TimeZoneSolar(longitude=lon, **tz_params) for lon in longitudes]
+    return [TimeZoneSolar(longitude=lon, latitude=lat, **tz_params) for lon, lat in zip(longitudes, latitudes)]
+
+
+class TestBuffer(unittest.TestCase):
+    """unit tests of timezone_solar batch resolution of buffer-protocol arrays"""
+
+    @classmethod
+    def make_buffer_test(cls, testnum, tz_type, with_lat) -> callable:
+        """generate test case function comparing buffer resolution with TimeZoneSolar per point"""
+        tz_params = TEST_TYPES[tz_type]
+        description = f"test {PROGNUM:03}-{testnum:03}: tz by {tz_type}, {'with' if with_lat else 'no'} latitude"
+
+        def check(self):
+            rows = len(TEST_LONGITUDES)
+            latitudes = [TEST_LATITUDES[row % len(TEST_LATITUDES)] for row in range(rows)] if with_lat else None
+            zones = expected_zones(TEST_LONGITUDES, latitudes, tz_params)
+            lon = array("d", TEST_LONGITUDES)
+            lat = None if latitudes is None else array("d", latitudes)
+
+            # preallocated outputs, longer than the input, are written in place
+            index_out = array("H", [9999] * (rows + 2))
+            offset_out = array("h", [9999] * (rows + 2))
+            index_id, offset_id = id(index_out), id(offset_out)
+            count = TimeZoneSolar.resolve_buffer(lon, lat, index_out=index_out, offset_out=offset_out, **tz_params)
+            self.assertEqual(count, rows)
+            self.assertEqual((id(index_out), id(offset_out)), (index_id, offset_id))
+            self.assertEqual(index_out[:rows].tolist(), [zone.zone_index for zone in zones])
+            self.assertEqual(offset_out[:rows].tolist(), [zone.offset_min for zone in zones])
+            self.assertEqual(index_out[rows:].tolist() + offset_out[rows:].tolist(), [9999] * 4)
+
+            # packed bytes in, bytearray and memoryview out, with only one of the outputs
+            raw_index = bytearray(2 * rows)
+            TimeZoneSolar.resolve_buffer(
+                lon.tobytes(), None if lat is None else memoryview(lat.tobytes()), index_out=raw_index, **tz_params
+            )
+            self.assertEqual(array("H", bytes(raw_index)), index_out[:rows])
+            offsets = array("h", bytes(2 * rows))
+            TimeZoneSolar.resolve_buffer(memoryview(lon), lat, offset_out=memoryview(offsets), **tz_params)
+            self.assertEqual(offsets, offset_out[:rows])
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each time zone type, with and without latitude"""
+        testnum = 0
+        for tz_type in TEST_TYPES:
+            for with_lat in (False, True):
+                func_name = f"test_{PROGNUM:03}_{testnum:03}_buffer_{tz_type}{'_lat' if with_lat else ''}"
+                Flags.verbose_print(f"generating test {func_name}...")
+                setattr(cls, func_name, cls.make_buffer_test(testnum, tz_type, with_lat))
+                testnum += 1
+
+    def test_float32(self):
+        """single precision coordinates are resolved as their double values"""
+        lon = array("f", [-122.597, 0.5, 179.9])
+        index_out = array("H", bytes(6))
+        TimeZoneSolar.resolve_buffer(lon, index_out=index_out, use_lon_tz=True)
+        zones = expected_zones(lon, None, {"use_lon_tz": True})
+        self.assertEqual(index_out.tolist(), [zone.zone_index for zone in zones])
+
+    def test_empty(self):
+        """an empty input resolves no rows"""
+        self.assertEqual(TimeZoneSolar.resolve_buffer(array("d"), index_out=array("H")), 0)
+
+    def test_invalid_buffers(self):
+        """buffers of the wrong format, size or shape, and missing outputs, are rejected"""
+        lon = array("d", [1.0, 2.0])
+        for kwargs in (
+            {"lon": array("i", [1, 2]), "index_out": array("H", [0, 0])},
+            {"lon": b"1234567", "index_out": array("H", [0, 0])},
+            {"lon": memoryview(bytes(32)).cast("d", (2, 2)), "index_out": array("H", [0] * 4)},
+            {"lon": lon, "lat": array("d", [1.0]), "index_out": array("H", [0, 0])},
+            {"lon": lon},
+            {"lon": lon, "index_out": array("H", [0])},
+            {"lon": lon, "index_out": array("h", [0, 0])},
+            {"lon": lon, "offset_out": array("H", [0, 0])},
+            {"lon": lon, "offset_out": array("i", [0, 0])},
+            {"lon": lon, "index_out": bytes(4)},
+            {"lon": lon, "index_out": array("H", [0, 0]), "tz_type": "bogus"},
+        ):
+            with self.assertRaises(ValueError, msg=kwargs):
+                TimeZoneSolar.resolve_buffer(**kwargs)
+
+    def test_invalid_coordinates(self):
+        """an invalid coordinate raises ValueError with its row number, after earlier rows are written"""
+        index_out = array("H", [0] * 4)
+        for lon, lat, row in (
+            (array("d", [0.0, 15.0, 190.0, 30.0]), None, 2),
+            (array("d", [0.0, 15.0, 30.0, float("nan")]), None, 3),
+            (array("d", [15.0, 15.0, 15.0, 15.0]), array("d", [0.0, 91.0, 0.0, 0.0]), 1),
+        ):
+            with self.assertRaisesRegex(ValueError, f"^resolve_buffer: row {row}: _tz_params: "):
+                TimeZoneSolar.resolve_buffer(lon, lat, index_out=index_out)
+            self.assertNotEqual(index_out[row - 1], 0)
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar precomputed fields and compiled multi-field accessors"""
+
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import TZ_TYPE_PARAMS, define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 33
+FIELDS = (
+    "name", "short_name", "long_name", "offset", "offset_sec", "offset_min", "is_utc", "longitude", "latitude",
+    "use_lon_tz", "use_narrow", "tz_type", "zone_index",
+)
+TEST_LONGITUDES = [-180.0, -122.597, -7.5, -0.0, 0.5, 37.6, 172.5, 180.0]
+TEST_LATITUDES = [None, 45.589, -85.0]
+TEST_TYPES = {tz_type: dict(tz_params) for tz_type, tz_params in TZ_TYPE_PARAMS.items()}
+TEST_TYPES["half"] = {"tz_type": "half"}
+
+define_family("half", 30)
+
+
+class TestFields(unittest.TestCase):
+    """unit tests of timezone_solar precomputed fields and compiled multi-field accessors"""
+
+    @classmethod
+    def make_fields_test(cls, testnum, tz_type) -> callable:
+        """generate test case function comparing field_getter() with get() for each field"""
+        tz_params = TEST_TYPES[tz_type]
+        description = f"test {PROGNUM:03}-{testnum:03}: fields by {tz_type}"
+
+        def check(self):
+            get_values = TimeZoneSolar.field_getter(*FIELDS)
+            get_text = TimeZoneSolar.field_getter(*FIELDS, text=True)
+            for longitude in TEST_LONGITUDES:
+                for latitude in TEST_LATITUDES:
+                    location = TimeZoneSolar.locate(longitude=longitude, latitude=latitude, **tz_params)
+                    for obj in (location, location.zone):
+                        expected = tuple(obj.get(field) for field in FIELDS)
+                        self.assertEqual(get_values(obj), expected, msg=f"{obj} {longitude} {latitude}")
+                        self.assertEqual(get_text(obj), tuple(str(value) for value in expected))
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each time zone type"""
+        testnum = 0
+        for tz_type in TEST_TYPES:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_fields_{tz_type}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_fields_test(testnum, tz_type))
+            testnum += 1
+
+    def test_values(self):
+        """fields keep the types get() has always returned"""
+        zone = TimeZoneSolar(tzname="East00")
+        self.assertEqual(TimeZoneSolar.field_getter("is_utc", "offset_min", "offset_sec")(zone), (1, 0, "0"))
+        self.assertEqual(TimeZoneSolar.field_getter("is_utc", text=True)(zone), ("1",))
+        location = TimeZoneSolar.locate(longitude=-122.597)
+        self.assertEqual(TimeZoneSolar.field_getter("longitude", "latitude")(location), ("-122.597", ""))
+        self.assertEqual(TimeZoneSolar.field_getter("longitude", "latitude")(location.zone), ("-120", ""))
+
+    def test_order(self):
+        """values are returned in the order of the field names, including repeated fields"""
+        getter = TimeZoneSolar.field_getter("offset", "name", "offset")
+        self.assertEqual(getter(TimeZoneSolar(longitude=-122.597)), ("-08:00", "Solar/West08", "-08:00"))
+        self.assertEqual(TimeZoneSolar.field_getter()(TimeZoneSolar(longitude=0)), ())
+
+    def test_attributes(self):
+        """other attributes which get() reads are still available, read for each record"""
+        zone = TimeZoneSolar(longitude=15)
+        self.assertEqual(TimeZoneSolar.field_getter("name", "zone_entry")(zone), ("Solar/East01", zone.zone_entry))
+
+    def test_unknown(self):
+        """unknown field names are rejected when the accessor is made"""
+        for fields in (("bogus",), ("name", "bogus"), ("",)):
+            with self.assertRaisesRegex(ValueError, "^unknown field ", msg=fields):
+                TimeZoneSolar.field_getter(*fields)
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar solar noon, sunrise and sunset tables"""
+
+import unittest
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import TZ_TYPE_PARAMS, ZONE_FAMILIES, define_family, tz_type_name
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+try:
+    import numpy as np
+    from timezone_solar.tzssun import sun_table
+except ImportError as exc:
+    raise unittest.SkipTest("NumPy is not installed") from exc
+
+# constants
+PROGNUM = 34
+TEST_LONGITUDES = [-180.0, -172.5, -122.597, -7.5, -0.1278, 0.0, 18.96, 37.6, 151.2, 180.0]
+TEST_LATITUDES = [-89.0, -66.0, -33.9, 0.0, 45.589, 51.5074, 65.0, 69.65, 79.9, 85.0]
+TEST_DATES = np.arange(np.datetime64("2024-01-01"), np.datetime64("2025-01-01"))
+TEST_TYPES = {tz_type: dict(tz_params) for tz_type, tz_params in TZ_TYPE_PARAMS.items()}
+TEST_TYPES["half"] = {"tz_type": "half"}
+
+# almanac times (NOAA solar calculator) in standard time, checked to within this many seconds
+ALMANAC_TOLERANCE = 120
+ALMANAC = [
+    # (longitude, latitude, date, sunrise, solar noon, sunset), Portland OR in UTC-8 and London in UTC
+    (-122.597, 45.589, "2024-06-20", "04:21", "12:11", "20:03"),
+    (-122.597, 45.589, "2024-12-21", "07:48", "12:08", "16:29"),
+    (-0.1278, 51.5074, "2024-06-20", "03:43", "12:02", "20:21"),
+    (-0.1278, 51.5074, "2024-12-21", "08:04", "11:58", "15:53"),
+]
+
+define_family("half", 30)
+
+
+def minutes(times: np.ndarray, dates: np.ndarray) -> np.ndarray:
+    """minutes after local midnight of the table dates"""
+    return (times - dates.astype("datetime64[s]")).astype(np.float64) / 60.0
+
+
+class TestSun(unittest.TestCase):
+    """unit tests of timezone_solar solar noon, sunrise and sunset tables"""
+
+    @classmethod
+    def make_sun_test(cls, testnum, tz_type) -> callable:
+        """generate test case function checking a year of tables for a grid of locations"""
+        tz_params = TEST_TYPES[tz_type]
+        description = f"test {PROGNUM:03}-{testnum:03}: sun tables by {tz_type}"
+
+        def check(self):
+            lon, lat = (grid.ravel() for grid in np.meshgrid(TEST_LONGITUDES, TEST_LATITUDES))
+            table = sun_table(lon, lat, TEST_DATES, **tz_params)
+            shape = (len(lon), len(TEST_DATES))
+            for key in ("noon", "sunrise", "sunset", "daylight", "equation_of_time"):
+                self.assertEqual(table[key].shape, shape, msg=key)
+
+            # each location is in the same zone as TimeZoneSolar finds
+            zones = [TimeZoneSolar(longitude=float(x), latitude=float(y), **tz_params) for x, y in zip(lon, lat)]
+            self.assertEqual(table["zone_index"].tolist(), [zone.zone_index for zone in zones])
+            self.assertEqual(table["offset_min"].tolist(), [zone.offset_min for zone in zones])
+
+            # solar noon is half way between sunrise and sunset, which are daylight apart
+            risen = ~np.isnat(table["sunrise"])
+            self.assertTrue(np.all(np.isnat(table["sunset"]) == ~risen))
+            daylight = table["daylight"].astype(np.int64)
+            noon = table["noon"][risen]
+            self.assertTrue(np.all(np.abs((noon - table["sunrise"][risen]).astype(np.int64) - daylight[risen] / 2)
+                                   <= 1))
+            self.assertTrue(np.all(np.abs((table["sunset"][risen] - noon).astype(np.int64) - daylight[risen] / 2)
+                                   <= 1))
+            self.assertTrue(np.all(np.isin(daylight[~risen], (0, 86400))))
+
+            # outside the polar override, apparent noon is within half a zone plus the equation of time of 12:00
+            family = ZONE_FAMILIES[tz_type_name(**tz_params)]
+            local = np.abs(lat) < 80
+            limit = family.width * 2.0 + 16.5
+            self.assertTrue(np.all(np.abs(minutes(table["noon"][local], TEST_DATES) - 720.0) <= limit))
+
+            # a table of one location is the same as its row of a larger table
+            for row in range(0, len(lon), 7):
+                single = sun_table(lon[row], lat[row], TEST_DATES, **tz_params)
+                for key in ("noon", "sunrise", "sunset", "daylight"):
+                    self.assertTrue(np.array_equal(single[key][0].view(np.int64), table[key][row].view(np.int64)),
+                                    msg=f"{key} row {row}")
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each time zone type"""
+        testnum = 0
+        for tz_type in TEST_TYPES:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_sun_{tz_type}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_sun_test(testnum, tz_type))
+            testnum += 1
+
+    def test_almanac(self):
+        """sunrise, solar noon and sunset agree with almanac times"""
+        for lon, lat, date, *times in ALMANAC:
+            table = sun_table(lon, lat, date)
+            for key, expected in zip(("sunrise", "noon", "sunset"), times):
+                found = table[key][0, 0]
+                diff = abs((found - np.datetime64(f"{date}T{expected}", "s")).astype(np.int64))
+                self.assertLessEqual(diff, ALMANAC_TOLERANCE, msg=f"{key} at {lon}, {lat} on {date}: {found}")
+
+    def test_polar(self):
+        """polar day and polar night have no sunrise or sunset"""
+        table = sun_table(18.96, 69.65, ["2024-06-21", "2024-12-21", "2024-03-20"])
+        self.assertEqual(np.isnat(table["sunrise"][0]).tolist(), [True, True, False])
+        self.assertEqual(table["daylight"][0, :2].astype(np.int64).tolist(), [86400, 0])
+        table = sun_table(10.0, 85.0, "2024-06-21")
+        self.assertEqual((table["zone_index"][0], table["offset_min"][0]), (12, 0))
+
+    def test_equation_of_time(self):
+        """the equation of time has its yearly extremes in February and November"""
+        eqtime = sun_table(0.0, 0.0, TEST_DATES)["equation_of_time"][0]
+        self.assertTrue(-14.6 < eqtime.min() < -13.8)
+        self.assertTrue(16.0 < eqtime.max() < 16.8)
+        self.assertEqual(str(TEST_DATES[np.argmin(eqtime)])[:7], "2024-02")
+        self.assertEqual(str(TEST_DATES[np.argmax(eqtime)])[:7], "2024-11")
+
+    def test_invalid(self):
+        """invalid coordinates, dates and time zone types are rejected"""
+        for args, kwargs in (
+            ((190.0, 0.0, "2024-01-01"), {}),
+            ((0.0, 91.0, "2024-01-01"), {}),
+            ((float("nan"), 0.0, "2024-01-01"), {}),
+            (([0.0, 1.0], [0.0, 1.0, 2.0], "2024-01-01"), {}),
+            (([[0.0]], [[0.0]], "2024-01-01"), {}),
+            ((0.0, 0.0, ["2024-01-01", "NaT"]), {}),
+            ((0.0, 0.0, "2024-01-01"), {"tz_type": "bogus"}),
+        ):
+            with self.assertRaises(ValueError, msg=args):
+                sun_table(*args, **kwargs)
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""unit tests of timezone_solar zone sets and batch conversion between solar time zones"""
+
+import unittest
+from datetime import datetime, timezone
+from timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import TZ_TYPE_NAMES, ZONE_TABLE, define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+try:
+    import numpy as np
+    from timezone_solar import tzsarray
+except ImportError as exc:
+    raise unittest.SkipTest("NumPy is not installed") from exc
+
+# constants
+PROGNUM = 35
+TEST_TIMES = 500
+TEST_UNITS = ["s", "ms", "us", "ns"]
+EPOCH_START = 1_600_000_000
+EPOCH_END = 1_800_000_000
+
+define_family("half", 30)
+
+
+def all_zones() -> list:
+    """shared instances of every zone in the default zone set, in zone id order"""
+    return [TimeZoneSolar(tzname=entry.short_name) for tz_type in TZ_TYPE_NAMES for entry in ZONE_TABLE[tz_type]]
+
+
+class TestConvert(unittest.TestCase):
+    """unit tests of timezone_solar zone sets and batch conversion between solar time zones"""
+
+    @classmethod
+    def make_convert_test(cls, testnum, unit) -> callable:
+        """generate test case function comparing batch conversion with datetime.astimezone()"""
+        description = f"test {PROGNUM:03}-{testnum:03}: convert wall-clock times in {unit}"
+
+        def check(self):
+            zones = all_zones()
+            rng = np.random.default_rng(testnum)
+            epoch = rng.integers(EPOCH_START, EPOCH_END, TEST_TIMES)
+            from_ids = rng.integers(0, len(zones), TEST_TIMES)
+            to_ids = rng.integers(0, len(zones), TEST_TIMES)
+
+            # wall-clock times in the source zones, and the expected times in the destination zones
+            local = []
+            expected = []
+            for stamp, from_id, to_id in zip(epoch.tolist(), from_ids.tolist(), to_ids.tolist()):
+                src = datetime.fromtimestamp(stamp, tz=timezone.utc).astimezone(zones[from_id])
+                dst = src.astimezone(zones[to_id])
+                local.append(np.datetime64(src.replace(tzinfo=None), unit))
+                expected.append(np.datetime64(dst.replace(tzinfo=None), unit))
+            local = np.array(local)
+            result = tzsarray.convert(local, from_ids, to_ids)
+            self.assertEqual(result.dtype, local.dtype)
+            self.assertEqual(result.tolist(), np.array(expected).tolist())
+
+            # integer times and zone names give the same results
+            names = np.array([zone.short_name for zone in zones])
+            ints = tzsarray.convert(local.astype(np.int64), names[from_ids], names[to_ids], unit=unit)
+            self.assertEqual(ints.tolist(), result.astype(np.int64).tolist())
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each time unit"""
+        testnum = 0
+        for unit in TEST_UNITS:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_convert_{unit}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_convert_test(testnum, unit))
+            testnum += 1
+
+    def test_matrix(self):
+        """the offset difference matrix covers every pair of zones in the set, and is read-only"""
+        zones = all_zones()
+        delta = tzsarray.offset_delta_matrix()
+        self.assertEqual(delta.shape, (len(zones), len(zones)))
+        offsets = np.array([zone.offset_min for zone in zones])
+        self.assertTrue(np.array_equal(delta, offsets[np.newaxis, :] - offsets[:, np.newaxis]))
+        self.assertFalse(delta.flags.writeable)
+        self.assertIs(tzsarray.offset_delta_matrix(), delta)
+
+    def test_zone_set_ids(self):
+        """zone ids come from names in any case or prefix, or from zone indexes of a type"""
+        self.assertEqual(tzsarray.zone_set_ids(["West12", "solar/east00", "WEST00", "East12"]).tolist(),
+                         [0, 12, 12, 24])
+        self.assertEqual(tzsarray.zone_set_ids(["West1200", "Lon180W", "Lon000W", "Lon180E"]).tolist(),
+                         [25, 122, 302, 482])
+        self.assertEqual(tzsarray.zone_set_ids([0, 48, 96], tz_type="narrow").tolist(), [25, 73, 121])
+        self.assertEqual(tzsarray.zone_set_ids([[1, 2]]).shape, (1, 2))
+
+    def test_family(self):
+        """zone sets may include defined families, whose zones are given by index"""
+        tz_types = ("hour", "half")
+        index = TimeZoneSolar(longitude=-122.597, tz_type="half").zone_index
+        half_id = tzsarray.zone_set_ids(index, tz_type="half", tz_types=tz_types)
+        self.assertEqual(int(half_id), 25 + index)
+        local = np.datetime64("2025-03-01T12:00")
+        self.assertEqual(tzsarray.convert(local, "West08", half_id, tz_types=tz_types), local)
+        self.assertEqual(tzsarray.convert(local, half_id, "East00", tz_types=tz_types),
+                         np.datetime64("2025-03-01T20:00"))
+
+    def test_invalid(self):
+        """unknown names, zones outside the set, out-of-range ids and unsupported times are rejected"""
+        for args, kwargs in (
+            (([0], "bogus", "West08"), {}),
+            (([0], "Lon122W", "West08"), {"tz_types": ("hour",)}),
+            (([0], 483, 0), {}),
+            (([0], -1, 0), {}),
+            (([0], 0.5, 0), {}),
+            (([1.5], 0, 0), {}),
+            ((np.array(["2025-01-01"], dtype="datetime64[D]"), 0, 0), {}),
+            (([0], 0, 0), {"unit": "m"}),
+            (([0], 0, 0), {"tz_types": ("hour", "hour")}),
+            (([0], 0, 0), {"tz_types": ("bogus",)}),
+        ):
+            with self.assertRaises(ValueError, msg=(args, kwargs)):
+                tzsarray.convert(*args, **kwargs)
+        with self.assertRaises(ValueError):
+            tzsarray.zone_set_ids([25], tz_type="hour")
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""unit tests of compact pickling of timezone_solar time zones and locations"""
+
+import copy
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+from datetime import datetime
+from timezone_solar import TimeZoneSolar, SolarLocation
+from timezone_solar.tzstable import TZ_TYPE_NAMES, ZONE_TABLE, define_family
+from timezone_solar.tests.run_tests import Flags, main_tests_per_file
+
+# constants
+PROGNUM = 36
+TEST_TYPES = [*TZ_TYPE_NAMES, "half"]
+PROTOCOLS = range(pickle.HIGHEST_PROTOCOL + 1)
+MAX_ZONE_PICKLE = 96  # bytes in a pickle of one time zone, at the default protocol
+DT_LOCAL = datetime(2024, 6, 21, 12, 0)
+
+define_family("half", 30)
+
+
+class LocalZone(TimeZoneSolar):
+    """subclass of TimeZoneSolar, with its own shared instances"""
+
+    __slots__ = ()
+
+
+class TestPickle(unittest.TestCase):
+    """unit tests of compact pickling of timezone_solar time zones and locations"""
+
+    @classmethod
+    def make_pickle_test(cls, testnum, tz_type) -> callable:
+        """generate test case function checking that every zone of a type unpickles to its shared instance"""
+        description = f"test {PROGNUM:03}-{testnum:03}: pickle {tz_type} zones"
+
+        def check(self):
+            for entry in ZONE_TABLE[tz_type]:
+                zone = TimeZoneSolar._tz_instance(tz_type, entry.index)  # pylint: disable=protected-access
+                self.assertLessEqual(len(pickle.dumps(zone)), MAX_ZONE_PICKLE, msg=entry.short_name)
+                for protocol in PROTOCOLS:
+                    self.assertIs(pickle.loads(pickle.dumps(zone, protocol)), zone, msg=entry.short_name)
+                aware = DT_LOCAL.replace(tzinfo=zone)
+                restored = pickle.loads(pickle.dumps(aware))
+                self.assertEqual(restored, aware)
+                self.assertIs(restored.tzinfo, zone)
+
+        check.__doc__ = description
+        return check
+
+    @classmethod
+    def generate_tests(cls):
+        """generate test functions for each time zone type"""
+        testnum = 0
+        for tz_type in TEST_TYPES:
+            func_name = f"test_{PROGNUM:03}_{testnum:03}_pickle_{tz_type}"
+            Flags.verbose_print(f"generating test {func_name}...")
+            setattr(cls, func_name, cls.make_pickle_test(testnum, tz_type))
+            testnum += 1
+
+    def test_locations(self):
+        """locations keep their coordinates only if they were recorded"""
+        for kwargs, args_len in (
+            ({"tzname": "West08"}, 1),
+            ({"longitude": -120}, 1),
+            ({"longitude": -122.597}, 2),
+            ({"longitude": -122.597, "latitude": 45.589}, 3),
+            ({"longitude": 10.0, "latitude": 85.0, "use_narrow": True}, 3),
+        ):
+            location = TimeZoneSolar.locate(**kwargs)
+            self.assertEqual(len(location.__reduce__()[1]), args_len, msg=kwargs)
+            for protocol in PROTOCOLS:
+                restored = pickle.loads(pickle.dumps(location, protocol))
+                self.assertIsInstance(restored, SolarLocation)
+                self.assertIs(restored.zone, location.zone)
+                self.assertEqual((restored.longitude, restored.latitude), (location.longitude, location.latitude))
+
+    def test_no_validation(self):
+        """unpickling gets the shared instance without looking up parameters again"""
+        payload = pickle.dumps([TimeZoneSolar(tzname="Lon122W"), TimeZoneSolar.locate(longitude=5, latitude=5)])
+        TimeZoneSolar.enable_stats()
+        try:
+            TimeZoneSolar.stats(reset=True)
+            pickle.loads(payload)
+            self.assertEqual(sum(TimeZoneSolar.stats()["constructions"].values()), 0)
+        finally:
+            TimeZoneSolar.enable_stats(False)
+            TimeZoneSolar.stats(reset=True)
+
+    def test_copy(self):
+        """copies of a time zone are the shared instance"""
+        zone = TimeZoneSolar(tzname="East0815")
+        self.assertIs(copy.copy(zone), zone)
+        self.assertIs(copy.deepcopy(zone), zone)
+        self.assertIs(copy.deepcopy(TimeZoneSolar.locate(longitude=125.0)).zone, TimeZoneSolar(tzname="East08"))
+
+    def test_subclass(self):
+        """subclass instances unpickle to the subclass's shared instances"""
+        zone = LocalZone(longitude=-122.597)
+        restored = pickle.loads(pickle.dumps(zone))
+        self.assertIs(restored, zone)
+        self.assertIsNot(restored, TimeZoneSolar(longitude=-122.597))
+
+    def test_new_process(self):
+        """a process which hasn't defined a zone family defines it when unpickling one of its zones"""
+        payload = pickle.dumps([TimeZoneSolar(longitude=-122.597, tz_type="half"), TimeZoneSolar(tzname="West08")])
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        script = "import pickle, sys; print([zone.short_name for zone in pickle.load(sys.stdin.buffer)])"
+        result = subprocess.run(
+            [sys.executable, "-c", script], input=payload, capture_output=True, env=env, check=False,
+        )
+        self.assertEqual((result.returncode, result.stderr), (0, b""))
+        self.assertEqual(result.stdout.decode().strip(), "['West0800', 'West08']")
+
+    def test_invalid(self):
+        """a pickled zone of a family which is defined here with another step can't be unpickled"""
+        func, args = TimeZoneSolar(longitude=0, tz_type="half").__reduce__()
+        with self.assertRaises(ValueError):
+            func(args[0], 15, *args[2:])
+
+
+if __name__ == "__main__":
+    main_tests_per_file(__file__)
@@ -40,18 +40,81 @@ Negative numbers of degrees are west of the Prime Meridian, so Lon180W to Lon000
 Lon000E is the same thing as Lon000W, both in the 1-degree-wide time zone centered at
 the Prime Meridian.
 
+There are also narrow time zones, each 3.75 degrees of longitude wide, at 15 minute intervals
+of clock time. They are named for their offset from UTC in hours and minutes, East0000 to
+East1200 and West0000 to West1200. West0000 is the same thing as East0000.
+
 Once the timezone_solar package is loaded, the standard Python datetime package can
 process these time zones.
+
+Each time zone has one shared, immutable TimeZoneSolar instance. Constructing a TimeZoneSolar
+by name or by longitude returns that instance, so datetimes in the same time zone share the same tzinfo.
+The longitude and latitude used to find a time zone are recorded separately in a SolarLocation,
+which TimeZoneSolar.locate() returns.
+
+TimeZoneSolar is safe to use from multiple threads, including on free-threaded Python builds, without locks.
+Shared instances are immutable, and the name index is read-only once the module is loaded.
+The zone table, the caches of shared instances and their zoneinfo equivalents only grow, with dict.setdefault(), so
+if two threads create the same time zone or zone family at once, both get the first one stored.
+SolarLocation records belong to the caller.
 """
 
-from datetime import datetime, tzinfo, timedelta
+from bisect import bisect_right
+from datetime import datetime, tzinfo, timedelta, timezone
+import io
+import math
+from operator import itemgetter
 import re
+import warnings
 from timezone_solar.tzsconst import TZSConst
+from timezone_solar.tzstable import TZ_TYPE_NAMES, ZONE_FAMILIES, ZONE_NAMES, ZONE_TABLE, define_family, tz_type_name
+
+# constants read once for the construction path
+_PRECISION_FP = TZSConst.PRECISION_FP
+_MAX_LONGITUDE_FP = TZSConst.MAX_LONGITUDE_FP
+_MAX_LATITUDE_FP = TZSConst.MAX_LATITUDE_FP
+_LIMIT_LATITUDE = TZSConst.LIMIT_LATITUDE
+_ZERO = TZSConst.ZERO
+_NUMERIC_RE = re.compile(r"[-+]?\d+(\.\d+)?")
+_ZONE_NAMES_GET = ZONE_NAMES.get
+
+# fields which get() reads from attributes of a time zone, besides those with string-formatted _str_* accessors
+_ATTR_FIELDS = ("name", "short_name", "offset_min", "use_lon_tz", "use_narrow", "tz_type", "zone_index")
+
+# fields which a SolarLocation reads from its own coordinates
+_COORD_FIELDS = frozenset(("longitude", "latitude"))
+
+# shared instances of TimeZoneSolar, keyed by class, time zone type name and zone index
+_INSTANCES = {}
+
+
+def _build_codes() -> tuple:
+    """number the zones of the built-in time zone types in one sequence, in type order then zone index order"""
+    code_start = {}
+    code_zones = []
+    for tz_type in TZ_TYPE_NAMES:
+        code_start[tz_type] = len(code_zones)
+        code_zones.extend((tz_type, index) for index in range(len(ZONE_TABLE[tz_type])))
+    return code_start, tuple(code_zones)
+
+
+# zone codes used for pickling: the first code of each built-in time zone type, and the type and index of each code
+# these are the same numbers as the zone ids of the default zone set in tzsarray
+_CODE_START, _CODE_ZONES = _build_codes()
+
+# zoneinfo.ZoneInfo equivalents of solar time zones, keyed by time zone name
+_ZONEINFO = {}
 
 
 class TimeZoneSolar(tzinfo):
     """local solar timezone"""
 
+    # instances are shared by all users of a time zone, with no per-instance __dict__
+    __slots__ = (
+        "name", "short_name", "offset_min", "longitude", "use_lon_tz", "use_narrow", "tz_type", "zone_index",
+        "_utcoffset", "_fixed_timezone", "_fields", "_field_text",
+    )
+
     #
     # utility methods
     #
@@ -64,67 +127,37 @@ class TimeZoneSolar(tzinfo):
             return str(num_int)
         return str(num)
 
-    # generate a solar time zone name
-    # required parameters:
-    #   tz_num: integer number for time zone - hourly or longitude based depending on use_lon_tz
-    #   use_lon_tz: true=use longitude-based time zones, false=use hour-based time zones
-    #   sign: +1 = positive/zero, -1 = negative
     @staticmethod
-    def _tz_name(**params) -> str:
-        prefix = (
-            "Lon"
-            if params["use_lon_tz"]
-            else ("East" if params["sign"] > 0 else "West")
-        )
-        suffix = (
-            "" if not params["use_lon_tz"] else ("E" if params["sign"] > 0 else "W")
-        )
-        tz_digits = 3 if params["use_lon_tz"] else 2
-        tz_num = str(params["tz_num"]).zfill(tz_digits)
-        return prefix + tz_num + suffix
+    def _field_str(value) -> str:
+        """format a field value as the CLI prints it"""
+        return "" if value is None else str(value)
 
     #
     # TimeZoneSolar core class methods
     #
 
-    # check latitude data and initialize special case for polar regions
-    # internal method called by _tz_params()
-    @classmethod
-    def _tz_params_latitude(cls, tz_params):
-        # safety check on latitude
-        const = TZSConst()
-        if not re.fullmatch(r"^[-+]?\d+(\.\d+)?$", str(tz_params["latitude"])):
-            raise ValueError(f"_tz_params: latitude {tz_params['latitude']}")
-        latitude = float(tz_params["latitude"])
-        if abs(latitude) > const.max_latitude_fp + const.precision_fp:
-            raise ValueError("_tz_params: latitude must be in the range -90 to +90")
-
-        # special case: use East00/Lon000E (equal to UTC) within 10° latitude of poles
-        # use UTC at the poles because time zones are too narrow to make sense
-        if abs(tz_params["latitude"]) >= const.limit_latitude - const.precision_fp:
-            use_lon_tz = bool(tz_params["use_lon_tz"])
-            tz_params["short_name"] = "Lon000E" if use_lon_tz else "East00"
-            tz_params["name"] = f"Solar/{tz_params['short_name']}"
-            tz_params["offset_min"] = 0
-            return tz_params
-
-        # no effects on results from latitude between 80° north & south
-        return None
+    # -180° longitude is on the east side of the date line, so a zone named for the west side (West12 or Lon180W)
+    # is looked up from the middle of its half-wide zone instead
+    @staticmethod
+    def _name2lon_west_edge(longitude: float, tz_degree_width: float) -> float:
+        if longitude <= -TZSConst.MAX_LONGITUDE_INT:
+            return longitude + tz_degree_width / 4.0
+        return longitude
 
     # generate time zone parameters from given time zone name
     @classmethod
     def _tz_name2params(cls, tzname: str) -> dict:
         match = re.fullmatch(r"^Lon(\d{3})([EW])$", tzname, flags=re.IGNORECASE)
         if match:
-            is_west = match.group(2) == "W"
+            is_west = match.group(2).upper() == "W"
             longitude = int(match.group(1)) * (-1 if is_west else 1)
             if abs(int(longitude)) > 180:
                 raise ValueError(f"longitude {longitude} is out of bounds ±180")
             use_lon_tz = True
-            return {"longitude": longitude, "use_lon_tz": use_lon_tz}
+            return {"longitude": cls._name2lon_west_edge(longitude, 1), "use_lon_tz": use_lon_tz}
         match = re.fullmatch(r"^(East|West)(\d{2})$", tzname, flags=re.IGNORECASE)
         if match:
-            is_west = match.group(1) == "West"
+            is_west = match.group(1).lower() == "west"
             hour_num = int(match.group(2))
             if hour_num > 12:
                 raise ValueError(f"time zone hour {hour_num} is out of bounds ±12")
@@ -132,79 +165,251 @@ class TimeZoneSolar(tzinfo):
             if abs(int(longitude)) > 180:
                 raise ValueError(f"longitude {longitude} is out of bounds ±180")
             use_lon_tz = False
-            return {"longitude": longitude, "use_lon_tz": use_lon_tz}
+            return {"longitude": cls._name2lon_west_edge(longitude, 15), "use_lon_tz": use_lon_tz}
+        match = re.fullmatch(r"^(East|West)(\d{2})(\d{2})$", tzname, flags=re.IGNORECASE)
+        if match:
+            is_west = match.group(1).lower() == "west"
+            hour_num = int(match.group(2))
+            minute_num = int(match.group(3))
+            if minute_num not in (0, 15, 30, 45):
+                raise ValueError(f"time zone minutes {minute_num} must be 00, 15, 30 or 45")
+            if hour_num * 60 + minute_num > 720:
+                raise ValueError(f"time zone offset {hour_num:02d}{minute_num:02d} is out of bounds ±1200")
+            longitude = (hour_num * 15 + minute_num / 4) * (-1 if is_west else 1)
+            return {"longitude": cls._name2lon_west_edge(longitude, 3.75), "use_narrow": True}
         raise ValueError(f"{tzname}  is not a valid solar/natural time zone name")
 
-    # get timezone parameters (name and minutes offset) - called by __new__()
+    # safety check on a longitude or latitude parameter, returns the number
+    # ints and floats, including float subclasses such as numpy.float64, are checked arithmetically
+    # other types such as strings and bools must look like a decimal number
+    @staticmethod
+    def _check_coord(value, limit: float, label: str) -> float:
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError(f"_tz_params: {label} {value}")
+        elif not isinstance(value, int) or isinstance(value, bool):
+            if not _NUMERIC_RE.fullmatch(str(value)):
+                raise ValueError(f"_tz_params: {label} {value}")
+            value = float(value)
+        if abs(value) > limit + _PRECISION_FP:
+            raise ValueError(f"_tz_params: {label} must be in the range -{limit:g} to +{limit:g}")
+        return value
+
+    # compute zone index from longitude
+    # zone indexes count from the west side of the date line:
+    # 0 for West12/West1200/Lon180W to 24/96/360 for East12/East1200/Lon180E
+    # the zone family's precomputed boundaries include the half-wide zones either side of the date line (180°),
+    # and -180° on the positive side because it is the same meridian as +180°
+    @staticmethod
+    def _lon2index(longitude: float, tz_type: str) -> int:
+        family = ZONE_FAMILIES[tz_type]
+        return family.slot_index[bisect_right(family.bounds, longitude)]
+
+    # get time zone type and index from parameters - called by __new__()
     @classmethod
-    def _tz_params(cls, tz_params: dict) -> dict:
+    def _tz_index(cls, tz_params: dict) -> tuple:
 
-        # rewrite parameters based on time zone if a tzname was provided
-        if "tzname" in tz_params and tz_params["tzname"] is not None:
-            tz_params = cls._tz_name2params(tz_params["tzname"])
+        # look up the time zone in the name index if a tzname was provided
+        # names which aren't in the index go through the name parser, which explains what is wrong with them
+        tzname = tz_params.get("tzname")
+        if tzname is not None:
+            entry = _ZONE_NAMES_GET(tzname.lower()) if tzname.__class__ is str else None
+            if entry is not None:
+                return entry.tz_type, entry.index
+            tz_params = cls._tz_name2params(tzname)
 
         # longitude is required
         if "longitude" not in tz_params:
             raise ValueError("_tz_params: longitude parameter missing")
 
-        # set time zone from longitude and latitude, if latitude was provided
-        if "latitude" in tz_params and tz_params["latitude"] is not None:
-            lat_params = cls._tz_params_latitude(tz_params)
-            if lat_params is not None:
-                return lat_params
-
-        #
-        # set time zone from longitude alone
-        #
-
-        # safety check on longitude
-        const = TZSConst()
-        if not re.fullmatch(r"^[-+]?\d+(\.\d+)?$", str(tz_params["longitude"])):
-            raise ValueError(f"_tz_params: longitude {tz_params['longitude']}")
-        longitude = float(tz_params["longitude"])
-        if abs(longitude) > const.max_longitude_fp + const.precision_fp:
-            raise ValueError("_tz_params: longitude must be in the range -180 to +180")
-
-        # set flag for longitude time zones:
-        # 0 = hourly 1-hour/15-degree zones, 1 = longitude 4-minute/1-degree zones
-        # defaults to hourly time zone ($use_lon_tz=0)
-        use_lon_tz = bool(tz_params["use_lon_tz"])
-        tz_degree_width = 1 if use_lon_tz else 15
-
-        # handle special case of half-wide tz at positive side of solar date line (180° longitude)
-        max_longitude = const.max_longitude_int
-        if (
-            longitude >= max_longitude - tz_degree_width / 2.0 - const.precision_fp
-            or longitude <= -max_longitude + const.precision_fp
-        ):
-            tz_int = int(max_longitude / tz_degree_width)
-            tz_name = cls._tz_name(use_lon_tz=use_lon_tz, sign=1, tz_num=tz_int)
-            tz_params["short_name"] = tz_name
-            tz_params["offset_min"] = 720
-
-        elif longitude <= -max_longitude + tz_degree_width / 2.0 + const.precision_fp:
-            tz_int = int(max_longitude / tz_degree_width)
-            tz_name = cls._tz_name(use_lon_tz=use_lon_tz, sign=-1, tz_num=tz_int)
-            tz_params["short_name"] = tz_name
-            tz_params["offset_min"] = -720
+        # set time zone type from flags for longitude or narrow time zones:
+        # use_lon_tz = longitude 4-minute/1-degree zones, use_narrow = narrow 15-minute/3.75-degree zones
+        # defaults to hourly 1-hour/15-degree zones, or tz_type names any zone family including defined ones
+        tz_type = tz_type_name(
+            tz_params.get("use_lon_tz", False), tz_params.get("use_narrow", False), tz_params.get("tz_type")
+        )
+
+        return tz_type, cls._coord_index(tz_params["longitude"], tz_params.get("latitude"), tz_type)
 
+    # get zone index from longitude and optional latitude, with safety checks
+    # called by _tz_index() and by batch paths which resolve many coordinates with the same rules
+    @classmethod
+    def _coord_index(cls, longitude, latitude, tz_type: str) -> int:
+
+        # special case: use East00/East0000/Lon000E (equal to UTC) within 10° latitude of poles
+        # use UTC at the poles because time zones are too narrow to make sense
+        if latitude is not None:
+            latitude = cls._check_coord(latitude, _MAX_LATITUDE_FP, "latitude")
+            if abs(latitude) >= _LIMIT_LATITUDE - _PRECISION_FP:
+                return ZONE_FAMILIES[tz_type].tz_max
+
+        # set time zone from longitude, as in _lon2index()
+        longitude = cls._check_coord(longitude, _MAX_LONGITUDE_FP, "longitude")
+        family = ZONE_FAMILIES[tz_type]
+        return family.slot_index[bisect_right(family.bounds, longitude)]
+
+    # resolve arrays of coordinates in one vectorized pass - requires optional NumPy dependency
+    @classmethod
+    def resolve_array(
+        cls, lon, lat=None, use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None
+    ) -> dict:
+        """
+        resolve NumPy arrays of longitude and optional latitude to solar time zones
+
+        returns a dictionary of arrays parallel to the input: zone_index, offset_min and short_name
+        """
+        from timezone_solar.tzsarray import resolve_array  # pylint: disable=import-outside-toplevel
+
+        return resolve_array(lon, lat, use_lon_tz, use_narrow, tz_type)
+
+    # resolve buffers of coordinates into caller-supplied output buffers - standard library only
+    @classmethod
+    def resolve_buffer(
+        cls, lon, lat=None, index_out=None, offset_out=None, use_lon_tz: bool = False, use_narrow: bool = False,
+        tz_type: str = None,
+    ) -> int:
+        """
+        resolve buffer-protocol arrays of longitude and optional latitude, such as array("d"), to solar time zones
+
+        writes zone indexes into index_out (format H) and offsets in minutes into offset_out (format h), and returns
+        the number of rows resolved
+        """
+        from timezone_solar.tzsbuffer import resolve_buffer  # pylint: disable=import-outside-toplevel
+
+        return resolve_buffer(lon, lat, index_out, offset_out, use_lon_tz, use_narrow, tz_type)
+
+    # opt-in instrumentation counters
+    @classmethod
+    def enable_stats(cls, enabled: bool = True) -> None:
+        """
+        turn instrumentation counters on or off
+
+        While they're on, constructions, get() calls and validation failures are counted and timed. While they're
+        off, the original methods are used, with no instrumentation overhead.
+        """
+        from timezone_solar import tzsstats  # pylint: disable=import-outside-toplevel
+
+        if enabled:
+            tzsstats.enable()
         else:
-            tz_int = int(abs(longitude) / tz_degree_width + 0.5 + const.precision_fp)
-            sign = 1 if longitude > -tz_degree_width / 2.0 + const.precision_fp else -1
-            offset_min = sign * tz_int * const.minutes_per_degree_lon * tz_degree_width
-            tz_name = cls._tz_name(use_lon_tz=use_lon_tz, sign=sign, tz_num=tz_int)
-            tz_params["short_name"] = tz_name
-            tz_params["offset_min"] = offset_min
-        tz_params["name"] = f"Solar/{tz_params['short_name']}"
-        return tz_params
-
-    # create a new instance
+            tzsstats.disable()
+
+    @classmethod
+    def stats(cls, reset: bool = False) -> dict:
+        """
+        returns a snapshot of the instrumentation counters, optionally setting them to zero
+
+        The snapshot has counts of constructions by path (name, longitude, polar), get() calls by field and
+        validation failures, and cumulative seconds by stage (lookup, instance, get).
+        """
+        from timezone_solar import tzsstats  # pylint: disable=import-outside-toplevel
+
+        return tzsstats.snapshot(reset)
+
+    # look up the shared instance for a time zone, creating it the first time it is used
+    # internal method called by __new__()
+    @classmethod
+    def _tz_instance(cls, tz_type: str, index: int):
+        key = (cls, tz_type, index)
+        obj = _INSTANCES.get(key)
+        if obj is not None:
+            return obj
+
+        # new instance records the time zone from the zone table, not the source coordinates used to find it
+        # longitude of a shared instance is the centerline of the time zone
+        entry = ZONE_TABLE[tz_type][index]
+        obj = super().__new__(cls)
+        object.__setattr__(obj, "name", entry.name)
+        object.__setattr__(obj, "short_name", entry.short_name)
+        object.__setattr__(obj, "offset_min", entry.offset_min)
+        object.__setattr__(obj, "longitude", entry.longitude)
+        object.__setattr__(obj, "use_lon_tz", tz_type == "longitude")
+        object.__setattr__(obj, "use_narrow", tz_type == "narrow")
+        object.__setattr__(obj, "tz_type", tz_type)
+        object.__setattr__(obj, "zone_index", index)
+        object.__setattr__(obj, "_utcoffset", timedelta(minutes=entry.offset_min))
+        object.__setattr__(obj, "_fixed_timezone", timezone(obj._utcoffset, obj.name))
+
+        # field values for get() and field_getter() are computed once, for every user of the shared instance
+        fields = obj._field_values()
+        object.__setattr__(obj, "_fields", fields)
+        object.__setattr__(obj, "_field_text", {key: cls._field_str(value) for key, value in fields.items()})
+
+        # setdefault keeps the first instance saved if another thread made one at the same time
+        return _INSTANCES.setdefault(key, obj)
+
+    # list all time zones of a type
+    @classmethod
+    def zones(cls, use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None) -> tuple:
+        """
+        returns the shared instances of all time zones of a type, in zone index order from west to east
+        """
+        tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+        return tuple(cls._tz_instance(tz_type, index) for index in range(len(ZONE_TABLE[tz_type])))
+
+    # look up many time zones by name
+    @classmethod
+    def resolve_names(cls, names) -> list:
+        """
+        returns the shared instances for an iterable of time zone names, such as West08, Lon122W or Solar/East0815
+
+        Names are case-insensitive. An invalid name raises ValueError, the same as TimeZoneSolar(tzname=...).
+        """
+        found = {}
+        zones = []
+        for name in names:
+            zone = found.get(name)
+            if zone is None:
+                zone = found[name] = cls(tzname=name)
+            zones.append(zone)
+        return zones
+
+    # look up the zone table entry for this time zone
+    def zone_entry(self):
+        """
+        returns the zone table entry of this time zone, with its index, names, offset and longitude boundaries
+        """
+        return ZONE_TABLE[self.tz_type][self.zone_index]
+
+    # get the shared instance for a time zone
     def __new__(cls, **kwargs):
-        return super().__new__(cls, kwargs)
+        return cls._tz_instance(*cls._tz_index(kwargs))
 
-    # initialize instance
+    # shared instances are fully initialized by __new__()
     def __init__(self, **kwargs):
-        self.__dict__.update(self.__class__._tz_params(kwargs))
+        pass
+
+    # shared instances are immutable
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} instances are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} instances are immutable")
+
+    # pickle as a small zone code, which unpickles to the shared instance without validating parameters again
+    def __reduce__(self):
+        code_start = _CODE_START.get(self.tz_type)
+        if code_start is not None:
+            args = (code_start + self.zone_index,)
+            func = _unpickle_zone
+        else:
+            args = (self.tz_type, ZONE_FAMILIES[self.tz_type].step_min, self.zone_index)
+            func = _unpickle_family_zone
+        if self.__class__ is not TimeZoneSolar:
+            args = (*args, self.__class__)
+        return func, args
+
+    # look up a time zone and record the source coordinates which were used to find it
+    @classmethod
+    def locate(cls, **kwargs) -> "SolarLocation":
+        """
+        look up the shared time zone instance for a location, recording the longitude and latitude in a
+        separate SolarLocation object
+        """
+        zone = cls(**kwargs)
+        if kwargs.get("tzname") is not None:
+            return SolarLocation(zone)
+        return SolarLocation(zone, kwargs["longitude"], kwargs.get("latitude"))
 
     #
     # attribute access methods
@@ -226,7 +431,7 @@ class TimeZoneSolar(tzinfo):
 
     def _str_long_name(self) -> str:
         """read accessor for long_name field"""
-        return self.get("name")
+        return self.name
 
     def _str_offset(self) -> str:
         """read accessor for offset field"""
@@ -248,31 +453,128 @@ class TimeZoneSolar(tzinfo):
             return 1
         return 0
 
+    def _field_values(self) -> dict:
+        """compute the values of the fields which get() provides, by name"""
+        fields = {key: getattr(self, key) for key in _ATTR_FIELDS}
+        for attr in dir(self):
+            if attr.startswith("_str_"):
+                fields[attr[5:]] = getattr(self, attr)()
+        return fields
+
     # get timezone values
     # read-accessor for object values, including for LongitudeTZ CLI implementation
     def get(self, key: str) -> str:
         """
         accessor for solar time zone object fields
         """
+        fields = self._fields
+        if key in fields:
+            return fields[key]
         if hasattr(self, "_str_" + key):
             return getattr(self, "_str_" + key)()
         if hasattr(self, key):
             return getattr(self, key, "")
         raise ValueError(f"unknown field {key}")
 
-    # update lat/lon to record source data
-    def update_lon_lat(self, params):
+    # compiled accessor for several fields at once, for output of many records
+    @classmethod
+    def field_getter(cls, *fields: str, text: bool = False):
         """
-        update longitude and optional latitude to record source data for testing/troubleshooting
+        make a function which reads several fields of a time zone or location in one call
+
+        input:
+            fields: field names, as for get()
+            text: true=format values as the CLI prints them, as strings with "" for None
+
+        Field names are checked here, once, so an unknown field raises ValueError before any record is read.
+        The returned function takes a TimeZoneSolar or SolarLocation and returns a tuple of the field values in
+        the same order, as get() returns them. They're read from values precomputed for each shared instance,
+        except longitude and latitude of a SolarLocation, which come from its coordinates.
+
+        output: function returning a tuple of field values
         """
-        for key in ["longitude", "latitude"]:
-            if key in params:
-                setattr(self, key, params[key])
+        probe = cls._tz_instance(tz_type_name(False, False), 0)
+        for key in fields:
+            if key not in probe._fields:
+                probe.get(key)  # raises ValueError for an unknown field
+
+        # fields without a precomputed value, such as other attributes, are read by get() for each record
+        zone_late = tuple((pos, key) for pos, key in enumerate(fields) if key not in probe._fields)
+        location_late = tuple((pos, key) for pos, key in enumerate(fields) if key in _COORD_FIELDS) + zone_late
+
+        # itemgetter() only returns a tuple for two or more keys
+        lookup_keys = [key if key in probe._fields else "name" for key in fields]
+        if len(lookup_keys) > 1:
+            items = itemgetter(*lookup_keys)
+        else:
+            get_one = itemgetter(*lookup_keys) if lookup_keys else None
+
+            def items(values) -> tuple:
+                return () if get_one is None else (get_one(values),)
+
+        values_attr = "_field_text" if text else "_fields"
+        convert = cls._field_str if text else None
+
+        def getter(obj) -> tuple:
+            if isinstance(obj, SolarLocation):
+                values = items(getattr(obj.zone, values_attr))
+                late = location_late
             else:
-                try:
-                    delattr(self, key)
-                except AttributeError:
-                    pass  # no problem if item to be deleted didn't exist
+                values = items(getattr(obj, values_attr))
+                late = zone_late
+            if not late:
+                return values
+            values = list(values)
+            for pos, key in late:
+                value = obj.get(key)
+                values[pos] = value if convert is None else convert(value)
+            return tuple(values)
+
+        return getter
+
+    # record lat/lon source data
+    def update_lon_lat(self, params) -> "SolarLocation":
+        """
+        record longitude and optional latitude as source data for testing/troubleshooting
+
+        Deprecated: shared time zone instances are immutable, so this no longer changes the time zone. It returns a
+        SolarLocation with the coordinates, which callers must use instead. Use TimeZoneSolar.locate() to look up a
+        time zone and record its coordinates in one call.
+        """
+        warnings.warn(
+            "update_lon_lat() no longer changes the time zone, whose longitude and latitude stay at its centerline;"
+            " use the SolarLocation it returns, or TimeZoneSolar.locate()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return SolarLocation(self, params.get("longitude"), params.get("latitude"))
+
+    # C-backed equivalents of this time zone, for datetime operations which don't call back into Python
+    def as_fixed_timezone(self) -> timezone:
+        """
+        returns a datetime.timezone with the same offset and name as this time zone
+        """
+        return self._fixed_timezone
+
+    def as_zoneinfo(self):
+        """
+        returns a zoneinfo.ZoneInfo for this time zone
+
+        It is loaded by name if the Solar time zones are installed in zoneinfo.TZPATH.
+        Otherwise it is loaded from TZif data generated in memory.
+        """
+        zone_info = _ZONEINFO.get(self.name)
+        if zone_info is None:
+            # pylint: disable=import-outside-toplevel
+            from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+            from timezone_solar.tzsdata import tzif_bytes
+
+            try:
+                zone_info = ZoneInfo(self.name)
+            except ZoneInfoNotFoundError:
+                zone_info = ZoneInfo.from_file(io.BytesIO(tzif_bytes(self)), key=self.name)
+            zone_info = _ZONEINFO.setdefault(self.name, zone_info)
+        return zone_info
 
     # get UTC offset
     # implementation of datetime.tzinfo interface
@@ -280,7 +582,7 @@ class TimeZoneSolar(tzinfo):
         """
         returns a timedelta of the offset from UTC
         """
-        return timedelta(minutes=self.get("offset_min"))
+        return self._utcoffset
 
     # get DST adjustment as a timedelta (always 0 for solar time zones)
     # implementation of datetime.tzinfo interface
@@ -288,7 +590,7 @@ class TimeZoneSolar(tzinfo):
         """
         returns Daylight Saving Time adjustment as a timedelta, always 0 because we don't use DST
         """
-        return timedelta(0)
+        return _ZERO
 
     # get time zone name string
     # implementation of datetime.tzinfo interface
@@ -296,4 +598,65 @@ class TimeZoneSolar(tzinfo):
         """
         returns long name of time zone
         """
-        return self.get("name")
+        return self.name
+
+    # convert UTC time to local time
+    # implementation of datetime.tzinfo interface, replacing the generic version which calls utcoffset() and dst()
+    def fromutc(self, dt: datetime) -> datetime:
+        """
+        returns local time from a datetime in UTC with this time zone as its tzinfo, by adding the fixed offset
+        """
+        if not isinstance(dt, datetime):
+            raise TypeError("fromutc() requires a datetime argument")
+        if dt.tzinfo is not self:
+            raise ValueError("fromutc: dt.tzinfo is not self")
+        return dt + self._utcoffset
+
+
+class SolarLocation:
+    """
+    longitude and latitude which were used to look up a solar time zone
+
+    The TimeZoneSolar instance is shared by everything in the same time zone, so per-record coordinates are kept
+    here instead. Other fields are read from the time zone.
+    """
+
+    __slots__ = ("zone", "longitude", "latitude")
+
+    def __init__(self, zone: TimeZoneSolar, longitude=None, latitude=None):
+        self.zone = zone
+        self.longitude = zone.longitude if longitude is None else longitude
+        self.latitude = latitude
+
+    # fields not recorded in the location are read from the time zone
+    def __getattr__(self, name):
+        return getattr(self.zone, name)
+
+    # pickle the shared time zone by its zone code, with the coordinates only if they were recorded
+    def __reduce__(self):
+        if self.latitude is not None:
+            return SolarLocation, (self.zone, self.longitude, self.latitude)
+        if self.longitude != self.zone.longitude:
+            return SolarLocation, (self.zone, self.longitude)
+        return SolarLocation, (self.zone,)
+
+    def get(self, key: str) -> str:
+        """
+        accessor for solar time zone fields, with longitude and latitude from the source data
+        """
+        if key == "longitude":
+            return TimeZoneSolar._float_cleanup(self.longitude)
+        if key == "latitude":
+            return "" if self.latitude is None else TimeZoneSolar._float_cleanup(self.latitude)
+        return self.zone.get(key)
+
+
+def _unpickle_zone(code: int, cls=TimeZoneSolar) -> TimeZoneSolar:
+    """get the shared instance of a pickled time zone of a built-in time zone type, from its zone code"""
+    return cls._tz_instance(*_CODE_ZONES[code])  # pylint: disable=protected-access
+
+
+def _unpickle_family_zone(tz_type: str, step_min: int, index: int, cls=TimeZoneSolar) -> TimeZoneSolar:
+    """get the shared instance of a pickled time zone of a defined zone family, defining it if it isn't yet"""
+    define_family(tz_type, step_min)
+    return cls._tz_instance(tz_type, index)  # pylint: disable=protected-access
@@ -0,0 +1,341 @@
+"""
+NumPy batch operations for timezone_solar
+
+These functions apply the same rules as TimeZoneSolar._tz_index() to whole arrays of coordinates in one
+vectorized pass, instead of constructing a TimeZoneSolar object per point.
+NumPy is an optional dependency of timezone_solar. This module is only imported when batch operations are used.
+
+Zone indexes count from the west side of the Date Line within a time zone type. For hour-based time zones,
+West12 is index 0, East00 is index 12 and East12 is index 24. For narrow time zones, West1200 is index 0,
+East0000 is index 48 and East1200 is index 96. For longitude-based time zones, Lon180W is index 0,
+Lon000E is index 180 and Lon180E is index 360. Offsets and names are read from the zone table in tzstable.
+Zone families added with tzstable.define_family() are selected by their tz_type name.
+
+Epoch times are converted to local solar wall-clock times by adding each zone's offset, as datetime64 arrays and
+date/time component arrays, without a datetime object per element.
+
+For conversions between zones of different types, a zone set numbers the zones of several time zone types in one
+sequence of zone ids: by default hour-based zones are ids 0 to 24, narrow zones 25 to 121 and longitude-based zones
+122 to 482, each in zone index order. A matrix of the offset differences between every pair of zones in the set is
+computed the first time the set is used, so converting wall-clock times between zones is one lookup and one add.
+"""
+
+import numpy as np
+from timezone_solar.tzsconst import TZSConst
+from timezone_solar.tzstable import TZ_TYPE_NAMES, ZONE_FAMILIES, ZONE_NAMES, ZONE_TABLE, tz_type_name
+
+# dtypes of result arrays
+OFFSET_DTYPE = np.int16
+INDEX_DTYPE = np.uint16
+
+# datetime64 units accepted for epoch times, with the number of units per second
+EPOCH_UNITS = {"s": 1, "ms": 1000, "us": 1000000, "ns": 1000000000}
+
+# time zone types of the default zone set, in zone id order
+ZONE_SET_TYPES = TZ_TYPE_NAMES
+
+# dtype of zone ids and of the offset difference matrix of zone sets, which holds up to +/-1440 minutes
+ZONE_ID_DTYPE = np.intp
+DELTA_DTYPE = np.int16
+
+# arrays from the zone family of each time zone type, made the first time the type is used:
+# short names and offsets in zone index order, lookup boundaries and the zone index of each lookup slot
+_FAMILY_ARRAYS = {}
+
+# zone sets, keyed by their tuple of time zone types, made the first time the set is used:
+# the first zone id of each type, and the matrix of offset differences from each zone (rows) to each zone (columns)
+_ZONE_SETS = {}
+
+
+def _family_arrays(tz_type: str) -> tuple:
+    """get the short name, offset, boundary and slot index arrays of a zone family"""
+    arrays = _FAMILY_ARRAYS.get(tz_type)
+    if arrays is None:
+        family = ZONE_FAMILIES[tz_type]
+        arrays = _FAMILY_ARRAYS.setdefault(tz_type, (
+            np.array([entry.short_name for entry in family.zones]),
+            np.array([entry.offset_min for entry in family.zones], dtype=OFFSET_DTYPE),
+            np.array(family.bounds, dtype=np.float64),
+            np.array(family.slot_index, dtype=INDEX_DTYPE),
+        ))
+    return arrays
+
+
+def short_names(use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None) -> np.ndarray:
+    """array of time zone short names for a time zone type, indexed by zone index"""
+    return _family_arrays(tz_type_name(use_lon_tz, use_narrow, tz_type))[0]
+
+
+def check_range(values: np.ndarray, limit: float, label: str, func: str) -> None:
+    """
+    raise ValueError if any value is not finite or is out of range, like the scalar safety checks
+
+    input:
+        values: float64 array of coordinates
+        limit: largest magnitude allowed, such as TZSConst.MAX_LONGITUDE_FP, with the same precision margin as the
+            scalar checks
+        label: name of the coordinate for the error message, such as longitude or latitude
+        func: name of the public function which was called, for the error message
+    """
+    bad = ~np.isfinite(values) | (np.abs(values) > limit + TZSConst.PRECISION_FP)
+    if bad.any():
+        bad_value = values[np.argmax(bad)]
+        raise ValueError(f"{func}: {label} {bad_value} must be in the range -{limit:g} to +{limit:g}")
+
+
+def lon2index(lon: np.ndarray, use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None) -> np.ndarray:
+    """
+    compute zone indexes from an array of longitudes, without latitude or range checks
+
+    This is the vectorized equivalent of TimeZoneSolar._lon2index(). It finds the same lookup slot in the zone
+    family's boundaries as np.searchsorted(bounds, lon, side="right"), but since the boundaries are evenly spaced
+    apart from the precision margins, the slot is estimated from the zone width and then moved across at most one
+    boundary, which is faster than a binary search of every longitude.
+    """
+    tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+    _, _, bounds, slot_index = _family_arrays(tz_type)
+    width = ZONE_FAMILIES[tz_type].width
+
+    # slot n holds longitudes from bounds[n - 1] up to bounds[n]
+    lon = np.asarray(lon, dtype=np.float64)
+    slot = np.clip(np.floor((lon + TZSConst.MAX_LONGITUDE_INT) / width + 0.5).astype(np.intp) + 1, 1, len(bounds) - 1)
+    slot = slot - (lon < bounds[slot - 1])
+    slot = slot + (lon >= bounds[slot])
+    return slot_index[slot]
+
+
+def index2offset(index: np.ndarray, use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None):
+    """look up offsets from UTC in minutes from an array of zone indexes"""
+    return _family_arrays(tz_type_name(use_lon_tz, use_narrow, tz_type))[1][index]
+
+
+def resolve_index(
+    lon, lat=None, use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None,
+    func: str = "resolve_index",
+) -> np.ndarray:
+    """
+    resolve arrays of longitude and optional latitude to zone indexes, with the same checks as resolve_array()
+
+    Range errors are reported as errors of func, the name of the calling function.
+
+    output: uint16 array of zone indexes (see module documentation), parallel to the input
+    """
+    lon = np.asarray(lon, dtype=np.float64)
+    tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+    tz_max = ZONE_FAMILIES[tz_type].tz_max
+
+    # polar regions use East00/East0000/Lon000E (equal to UTC) within 10° latitude of poles
+    polar = None
+    if lat is not None:
+        lat = np.asarray(lat, dtype=np.float64)
+        check_range(lat, TZSConst.MAX_LATITUDE_FP, "latitude", func)
+        polar = np.abs(lat) >= TZSConst.LIMIT_LATITUDE - TZSConst.PRECISION_FP
+        lon, polar = np.broadcast_arrays(lon, polar)
+
+    # safety check on longitude, skipping polar points as the scalar path does
+    check_range(lon if polar is None else lon[~polar], TZSConst.MAX_LONGITUDE_FP, "longitude", func)
+
+    # compute zone indexes
+    with np.errstate(invalid="ignore"):
+        index = lon2index(lon, tz_type=tz_type)
+    if polar is not None:
+        index = np.where(polar, tz_max, index).astype(INDEX_DTYPE)
+    return index
+
+
+def resolve_array(lon, lat=None, use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None) -> dict:
+    """
+    resolve arrays of longitude and optional latitude to solar time zones
+
+    input:
+        lon: array-like of longitudes in degrees, -180 to +180
+        lat: optional array-like of latitudes in degrees, -90 to +90, broadcast against lon
+        use_lon_tz: true=use longitude-based time zones
+        use_narrow: true=use narrow time zones (default is hour-based time zones)
+        tz_type: time zone type name, instead of use_lon_tz or use_narrow, such as a family from define_family()
+
+    output: dictionary of arrays parallel to the input
+        zone_index: uint16 zone indexes (see module documentation)
+        offset_min: int16 offsets from UTC in minutes
+        short_name: time zone short names, such as West08, West0815 or Lon123W
+    """
+    tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+    index = resolve_index(lon, lat, tz_type=tz_type, func="resolve_array")
+    return {
+        "zone_index": index,
+        "offset_min": index2offset(index, tz_type=tz_type),
+        "short_name": short_names(tz_type=tz_type)[index],
+    }
+
+
+def epoch_to_local(
+    epoch,
+    lon=None,
+    lat=None,
+    zone_index=None,
+    use_lon_tz: bool = False,
+    use_narrow: bool = False,
+    unit: str = "s",
+    tz_type: str = None,
+):
+    """
+    convert UTC epoch times to local solar wall-clock times, using offset arithmetic on whole arrays
+
+    input:
+        epoch: array-like of integer times since 1970-01-01 UTC, in the given unit, with float times rounded by
+            the caller
+        lon: array-like of longitudes in degrees, broadcast against epoch (exclusive with zone_index)
+        lat: optional array-like of latitudes in degrees, used with lon
+        zone_index: array-like of zone indexes from resolve_array() (exclusive with lon)
+        use_lon_tz: true=use longitude-based time zones
+        use_narrow: true=use narrow time zones (default is hour-based time zones)
+        unit: unit of the epoch times: s, ms, us or ns
+        tz_type: time zone type name, instead of use_lon_tz or use_narrow, such as a family from define_family()
+
+    output: datetime64 array of local wall-clock times, in the same unit as the epoch times
+    """
+    if unit not in EPOCH_UNITS:
+        raise ValueError(f"epoch_to_local: unit must be one of {', '.join(EPOCH_UNITS)}, got {unit}")
+    if (lon is None) == (zone_index is None):
+        raise ValueError("epoch_to_local: requires either lon or zone_index")
+    epoch = np.asarray(epoch)
+    if epoch.dtype.kind not in "iu":
+        raise ValueError(f"epoch_to_local: epoch times must be integers, got {epoch.dtype}; round them first")
+    tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+    if zone_index is None:
+        zone_index = resolve_index(lon, lat, tz_type=tz_type, func="epoch_to_local")
+    else:
+        zone_index = np.asarray(zone_index)
+        max_index = len(ZONE_TABLE[tz_type]) - 1
+        if zone_index.size > 0 and (zone_index.min() < 0 or zone_index.max() > max_index):
+            raise ValueError(f"epoch_to_local: zone_index must be in the range 0 to {max_index}")
+    offset = index2offset(zone_index, tz_type=tz_type).astype(np.int64) * (60 * EPOCH_UNITS[unit])
+    return (epoch.astype(np.int64) + offset).astype(f"datetime64[{unit}]")
+
+
+def local_fields(local: np.ndarray) -> dict:
+    """
+    split datetime64 wall-clock times into date and time component arrays
+
+    output: dictionary of arrays parallel to the input
+        date: datetime64[D] dates
+        year, month, day, hour, minute, second: int64 components, with month and day starting at 1
+    """
+    local = np.asarray(local)
+    unit, _ = np.datetime_data(local.dtype)
+    if unit not in EPOCH_UNITS:
+        raise ValueError(f"local_fields: unit must be one of {', '.join(EPOCH_UNITS)}, got {unit}")
+    date = local.astype("datetime64[D]")
+    month_start = local.astype("datetime64[M]")
+    seconds = (local - date).astype(np.int64) // EPOCH_UNITS[unit]
+    return {
+        "date": date,
+        "year": local.astype("datetime64[Y]").astype(np.int64) + 1970,
+        "month": month_start.astype(np.int64) % 12 + 1,
+        "day": (date - month_start.astype("datetime64[D]")).astype(np.int64) + 1,
+        "hour": seconds // 3600,
+        "minute": seconds // 60 % 60,
+        "second": seconds % 60,
+    }
+
+
+def _zone_set(tz_types: tuple) -> tuple:
+    """get the first zone id of each time zone type, and the offset difference matrix, of a zone set"""
+    zone_set = _ZONE_SETS.get(tz_types)
+    if zone_set is None:
+        first_id = {}
+        offsets = []
+        for tz_type in tz_types:
+            if tz_type not in ZONE_FAMILIES or tz_type in first_id:
+                raise ValueError(f"zone set: unknown or repeated time zone type {tz_type}")
+            first_id[tz_type] = len(offsets)
+            offsets.extend(entry.offset_min for entry in ZONE_TABLE[tz_type])
+        offsets = np.array(offsets, dtype=DELTA_DTYPE)
+        delta = offsets[np.newaxis, :] - offsets[:, np.newaxis]
+        delta.flags.writeable = False
+        zone_set = _ZONE_SETS.setdefault(tz_types, (first_id, delta))
+    return zone_set
+
+
+def offset_delta_matrix(tz_types: tuple = ZONE_SET_TYPES) -> np.ndarray:
+    """
+    read-only matrix of offset differences in minutes between every pair of zones in a zone set
+
+    Row i and column j hold the minutes to add to a wall-clock time in zone id i to get the time in zone id j.
+    """
+    return _zone_set(tuple(tz_types))[1]
+
+
+def zone_set_ids(zones, tz_type: str = None, tz_types: tuple = ZONE_SET_TYPES) -> np.ndarray:
+    """
+    get zone ids in a zone set from time zone names, or from zone indexes of one time zone type
+
+    input:
+        zones: array-like of time zone names (such as West08, Lon122W or Solar/East0815, case-insensitive),
+            or of zone indexes of tz_type, or of zone ids if tz_type is None
+        tz_type: time zone type of integer zone indexes, which must be in the zone set
+        tz_types: time zone types of the zone set, in zone id order
+
+    Names are looked up in the name index, so they are zones of the hour, narrow and longitude-based types.
+
+    output: array of zone ids, with the same shape as zones
+    """
+    first_id, delta = _zone_set(tuple(tz_types))
+    zones = np.asarray(zones)
+    if zones.dtype.kind in "USO":
+        names, inverse = np.unique(zones, return_inverse=True)
+        ids = np.empty(len(names), dtype=ZONE_ID_DTYPE)
+        for num, name in enumerate(names.tolist()):
+            entry = ZONE_NAMES.get(name.lower()) if isinstance(name, str) else None
+            if entry is None:
+                raise ValueError(f"zone_set_ids: unknown time zone name {name}")
+            if entry.tz_type not in first_id:
+                raise ValueError(f"zone_set_ids: time zone type {entry.tz_type} of {name} is not in the zone set")
+            ids[num] = first_id[entry.tz_type] + entry.index
+        return ids[inverse].reshape(zones.shape)
+    if zones.dtype.kind not in "iu":
+        raise ValueError("zone_set_ids: zones must be time zone names or integer zone indexes")
+
+    # integer zone indexes of one type, or zone ids
+    start, count = 0, len(delta)
+    if tz_type is not None:
+        if tz_type not in first_id:
+            raise ValueError(f"zone_set_ids: time zone type {tz_type} is not in the zone set")
+        start, count = first_id[tz_type], len(ZONE_TABLE[tz_type])
+    if zones.size > 0 and (zones.min() < 0 or zones.max() >= count):
+        raise ValueError(f"zone_set_ids: zone indexes must be in the range 0 to {count - 1}")
+    return zones.astype(ZONE_ID_DTYPE) + start
+
+
+def convert(times, from_zones, to_zones, tz_types: tuple = ZONE_SET_TYPES, unit: str = "s") -> np.ndarray:
+    """
+    convert local wall-clock times from one solar time zone to another, using the zone set's offset differences
+
+    input:
+        times: array-like of datetime64 wall-clock times in minutes or finer units, or of integer wall-clock times
+            since 1970-01-01 in unit
+        from_zones: zones of the times, as names or zone ids (see zone_set_ids()), broadcast against times
+        to_zones: zones to convert the times to, as names or zone ids, broadcast against times
+        tz_types: time zone types of the zone set, in zone id order
+        unit: unit of integer times: s, ms, us or ns
+
+    output: array of wall-clock times in to_zones, with the same dtype as datetime64 times, or int64
+    """
+    times = np.asarray(times)
+    if times.dtype.kind == "M":
+        time_unit, _ = np.datetime_data(times.dtype)
+        if time_unit != "m" and time_unit not in EPOCH_UNITS:
+            raise ValueError(f"convert: datetime64 times must be in minutes or finer units, got {time_unit}")
+    elif times.dtype.kind not in "iu":
+        raise ValueError("convert: times must be datetime64 or integer arrays")
+    elif unit not in EPOCH_UNITS:
+        raise ValueError(f"convert: unit must be one of {', '.join(EPOCH_UNITS)}, got {unit}")
+    tz_types = tuple(tz_types)
+    from_ids = zone_set_ids(from_zones, tz_types=tz_types)
+    to_ids = zone_set_ids(to_zones, tz_types=tz_types)
+
+    # one gather from the matrix and one add
+    delta = offset_delta_matrix(tz_types)[from_ids, to_ids].astype(np.int64)
+    if times.dtype.kind == "M":
+        return times + delta.astype("timedelta64[m]")
+    return times.astype(np.int64) + delta * (60 * EPOCH_UNITS[unit])
@@ -0,0 +1,128 @@
+"""
+Apache Arrow and Parquet column annotation for timezone_solar
+
+These functions append solar time zone columns to Arrow record batches with longitude and optional latitude
+columns: short_name (string), offset_min (int16) and is_utc (bool). The zones are resolved with the vectorized
+rules of tzsarray. Tables, streams of record batches and Parquet files are processed one record batch at a time,
+so memory use depends on the batch size, not the size of the data.
+
+Rows with a null longitude get null time zone columns. A null latitude is treated as no latitude, the same as
+omitting it from TimeZoneSolar parameters.
+PyArrow and NumPy are optional dependencies of timezone_solar. This module is only imported when Arrow operations
+are used.
+"""
+
+from collections.abc import Iterable, Iterator
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from timezone_solar.tzsarray import resolve_array
+
+# names and types of the appended columns
+ANNOTATION_FIELDS = (
+    pa.field("short_name", pa.string()),
+    pa.field("offset_min", pa.int16()),
+    pa.field("is_utc", pa.bool_()),
+)
+
+# default number of rows per record batch when reading Parquet files
+DEFAULT_BATCH_SIZE = 1 << 16
+
+
+def annotated_schema(schema: pa.Schema) -> pa.Schema:
+    """schema of record batches after annotation, with the time zone columns appended"""
+    for field in ANNOTATION_FIELDS:
+        if schema.get_field_index(field.name) >= 0:
+            raise ValueError(f"annotate: column {field.name} already exists")
+        schema = schema.append(field)
+    return schema
+
+
+def annotate_batch(
+    batch: pa.RecordBatch,
+    lon_column: str = "longitude",
+    lat_column: str = "latitude",
+    use_lon_tz: bool = False,
+    use_narrow: bool = False,
+    tz_type: str = None,
+) -> pa.RecordBatch:
+    """
+    append solar time zone columns to a record batch
+
+    input:
+        batch: Arrow record batch with a longitude column and optional latitude column
+        lon_column: name of the longitude column
+        lat_column: name of the latitude column, which is used if the batch has it
+        use_lon_tz: true=use longitude-based time zones
+        use_narrow: true=use narrow time zones (default is hour-based time zones)
+        tz_type: time zone type name, instead of use_lon_tz or use_narrow, such as a family from define_family()
+
+    output: record batch with short_name, offset_min and is_utc columns appended
+    """
+    schema = annotated_schema(batch.schema)
+    if batch.schema.get_field_index(lon_column) < 0:
+        raise ValueError(f"annotate: longitude column {lon_column} not found")
+    lon_array = batch.column(lon_column)
+    valid = lon_array.is_valid().to_numpy(zero_copy_only=False)
+    lon = lon_array.cast(pa.float64()).fill_null(0.0).to_numpy(zero_copy_only=False)
+    lat = None
+    if batch.schema.get_field_index(lat_column) >= 0:
+        lat = batch.column(lat_column).cast(pa.float64()).fill_null(0.0).to_numpy(zero_copy_only=False)
+
+    # resolve rows with a longitude, leaving nulls in the others
+    if valid.all():
+        result = resolve_array(lon, lat, use_lon_tz, use_narrow, tz_type)
+        mask = None
+    else:
+        result = resolve_array(lon[valid], None if lat is None else lat[valid], use_lon_tz, use_narrow, tz_type)
+        mask = ~valid
+    offset_min = _expand(result["offset_min"], valid, mask)
+    short_name = _expand(result["short_name"], valid, mask)
+    columns = [
+        pa.array(short_name, type=pa.string(), mask=mask),
+        pa.array(offset_min, type=pa.int16(), mask=mask),
+        pa.array(offset_min == 0, type=pa.bool_(), mask=mask),
+    ]
+    return pa.RecordBatch.from_arrays(batch.columns + columns, schema=schema)
+
+
+def _expand(values: np.ndarray, valid: np.ndarray, mask) -> np.ndarray:
+    """place results for the valid rows into an array for all rows"""
+    if mask is None:
+        return values
+    full = np.zeros(len(valid), dtype=values.dtype)
+    full[valid] = values
+    return full
+
+
+def annotate_batches(batches: Iterable[pa.RecordBatch], **kwargs) -> Iterator[pa.RecordBatch]:
+    """append solar time zone columns to each record batch of a stream, with the options of annotate_batch()"""
+    for batch in batches:
+        yield annotate_batch(batch, **kwargs)
+
+
+def annotate_table(table: pa.Table, **kwargs) -> pa.Table:
+    """append solar time zone columns to a table, one record batch at a time"""
+    schema = annotated_schema(table.schema)
+    return pa.Table.from_batches(annotate_batches(table.to_batches(), **kwargs), schema=schema)
+
+
+def annotate_parquet(in_path, out_path, batch_size: int = DEFAULT_BATCH_SIZE, **kwargs) -> int:
+    """
+    read a Parquet file and write a copy with solar time zone columns appended, one record batch at a time
+
+    input:
+        in_path: input Parquet file
+        out_path: output Parquet file
+        batch_size: number of rows per record batch
+        other keyword arguments are options of annotate_batch()
+
+    output: number of rows
+    """
+    in_file = pq.ParquetFile(in_path)
+    rows = 0
+    with pq.ParquetWriter(out_path, annotated_schema(in_file.schema_arrow)) as writer:
+        for batch in annotate_batches(in_file.iter_batches(batch_size=batch_size), **kwargs):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
@@ -0,0 +1,193 @@
+"""
+streaming batch lookups of solar time zones from text input
+
+Each input line describes one location, either as comma-separated text "longitude[,latitude[,type]]"
+or as a JSON object with "longitude", "latitude", "type" or "tzname" keys (NDJSON).
+Blank lines are skipped, and a first line starting with "longitude" is skipped as a CSV header.
+Each output row has the requested fields, in the same string format as the CLI --get option, as tab-separated text,
+comma-separated text or a JSON object per line.
+
+Rows which can't be resolved produce empty fields (or an "error" key in NDJSON) so output rows stay aligned
+with the input, and their errors are reported with input line numbers.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator
+from timezone_solar.timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import DEFAULT_TZ_TYPE, TZ_TYPE_PARAMS
+
+# output formats
+BATCH_FORMATS = ("tsv", "csv", "ndjson")
+
+# TimeZoneSolar parameters for time zone types by name, as in the CLI --type option
+TZ_TYPES = TZ_TYPE_PARAMS
+
+# size of output buffer for streaming
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+# default size of input chunks in bytes, for parallel lookups in tzsparallel
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+
+def _coord(value: str):
+    """convert a coordinate from text, leaving invalid text for TimeZoneSolar to report"""
+    value = value.strip()
+    if value == "":
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _tz_type(type_name, tz_type: str) -> dict:
+    """look up TimeZoneSolar parameters from a time zone type name, or the default type if none was given"""
+    if type_name is None or type_name == "":
+        type_name = tz_type
+    try:
+        return TZ_TYPES[str(type_name).strip()]
+    except KeyError as exc:
+        raise ValueError(f"unknown time zone type {type_name}") from exc
+
+
+def parse_row(line: str, tz_type: str = DEFAULT_TZ_TYPE) -> dict:
+    """
+    parse one input line into parameters for TimeZoneSolar.locate()
+
+    input:
+        line: text line of longitude[,latitude[,type]] or a JSON object
+        tz_type: default time zone type name (hour, narrow or longitude) when the line doesn't specify one
+
+    output: dictionary of TimeZoneSolar parameters
+    """
+    if line.lstrip().startswith("{"):
+        obj = json.loads(line)
+        if not isinstance(obj, dict):
+            raise ValueError("JSON input line must be an object")
+        if obj.get("tzname") is not None:
+            if not isinstance(obj["tzname"], str):
+                raise ValueError("tzname must be a string")
+            return {"tzname": obj["tzname"]}
+        if "longitude" not in obj:
+            raise ValueError("longitude parameter missing")
+        return {
+            "longitude": obj["longitude"],
+            "latitude": obj.get("latitude"),
+            **_tz_type(obj.get("type"), tz_type),
+        }
+    cols = line.split(",")
+    if len(cols) > 3:
+        raise ValueError(f"expected at most 3 columns, found {len(cols)}")
+    longitude = _coord(cols[0])
+    if longitude is None:
+        raise ValueError("longitude parameter missing")
+    return {
+        "longitude": longitude,
+        "latitude": _coord(cols[1]) if len(cols) > 1 else None,
+        **_tz_type(cols[2] if len(cols) > 2 else None, tz_type),
+    }
+
+
+def row_formatter(fields: list, fmt: str = "tsv") -> Callable:
+    """
+    make a function which formats a row of field values (or None for an error) as an output line
+
+    The returned function takes a sequence of field value strings, or None and an error message.
+    The CSV formatter reuses one buffer, so a formatter shouldn't be shared by threads.
+    """
+    if fmt == "tsv":
+        empty = "\t" * (len(fields) - 1) + "\n"
+        return lambda values, err=None: empty if values is None else "\t".join(values) + "\n"
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        empty = "," * (len(fields) - 1) + "\n"
+
+        def format_csv(values, err=None):
+            if values is None:
+                return empty
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(values)
+            return buffer.getvalue()
+
+        return format_csv
+    if fmt == "ndjson":
+        return lambda values, err=None: (
+            json.dumps({"error": err}) if values is None else json.dumps(dict(zip(fields, values)))
+        ) + "\n"
+    raise ValueError(f"unknown batch output format {fmt}")
+
+
+def resolve_rows(
+    lines: Iterable[str],
+    fields: list,
+    fmt: str = "tsv",
+    tz_type: str = DEFAULT_TZ_TYPE,
+    on_error: Callable = None,
+    first_lineno: int = 1,
+    header: bool = True,
+) -> Iterator[str]:
+    """
+    resolve input lines to formatted output lines
+
+    input:
+        lines: iterable of input text lines
+        fields: list of field names to output, as in the CLI --get option
+        fmt: output format: tsv, csv or ndjson
+        tz_type: default time zone type name for lines which don't specify one
+        on_error: optional function called with input line number and error message for each failed line
+        first_lineno: line number of the first input line, for error reports
+        header: whether the first input line is skipped if it's a CSV header, false for lines after the start of input
+
+    output: iterator of output lines, one for each non-blank input line
+    """
+    # check field names and default time zone type once, before any input is read
+    _tz_type(None, tz_type)
+    get_fields = TimeZoneSolar.field_getter(*fields, text=True)
+
+    format_row = row_formatter(fields, fmt)
+    for lineno, line in enumerate(lines, start=first_lineno):
+        if line.strip() == "":
+            continue
+        if header and lineno == first_lineno and line.lstrip().lower().startswith("longitude"):
+            continue  # CSV header
+        try:
+            values = get_fields(TimeZoneSolar.locate(**parse_row(line, tz_type)))
+        except ValueError as exc:
+            if on_error is not None:
+                on_error(lineno, str(exc))
+            yield format_row(None, str(exc))
+            continue
+        yield format_row(values)
+
+
+def stream_batch(
+    infile, outfile, fields: list, fmt: str = "tsv", tz_type: str = DEFAULT_TZ_TYPE, errfile=None
+) -> int:
+    """
+    resolve a stream of input lines, writing formatted rows to an output stream
+
+    input:
+        infile: text input stream
+        outfile: text output stream
+        fields: list of field names to output
+        fmt: output format: tsv, csv or ndjson
+        tz_type: default time zone type name for lines which don't specify one
+        errfile: optional text stream for error reports
+
+    output: number of input lines which could not be resolved
+    """
+    errors = 0
+
+    def on_error(lineno, mesg):
+        nonlocal errors
+        errors += 1
+        if errfile is not None:
+            print(f"line {lineno}: {mesg}", file=errfile)
+
+    outfile.writelines(resolve_rows(infile, fields, fmt, tz_type, on_error))
+    outfile.flush()
+    return errors
@@ -0,0 +1,107 @@
+"""
+batch resolution of buffer-protocol arrays for timezone_solar, using only the standard library
+
+This is for hosts without NumPy. Coordinates are read from any object which supports the buffer protocol, such
+as array("d"), array("f"), a memoryview, or bytes or bytearray of packed native-order doubles. Zone indexes and
+offsets from UTC in minutes are written into output buffers which the caller allocates once and can reuse for
+every batch, such as array("H") for zone indexes and array("h") for offsets, so nothing is allocated per element
+for the results.
+
+Each point is resolved with the same rules and safety checks as the longitude and latitude parameters of
+TimeZoneSolar, by TimeZoneSolar._coord_index(). Zone indexes count from the west side of the Date Line within a
+time zone type, as in the zone table in tzstable.
+"""
+
+from itertools import repeat
+from timezone_solar.timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import ZONE_TABLE, tz_type_name
+
+# buffer formats of coordinates which are read as they are, and of raw bytes which are read as packed doubles
+COORD_FORMATS = frozenset(("d", "f", "@d", "@f", "=d", "=f"))
+BYTE_FORMATS = frozenset(("B", "b", "c"))
+
+# buffer formats of output zone indexes (uint16) and offsets (int16)
+INDEX_FORMAT = "H"
+OFFSET_FORMAT = "h"
+
+
+def _coord_view(buf, label: str) -> memoryview:
+    """get a 1-dimensional view of floating point coordinates from a buffer"""
+    view = memoryview(buf)
+    if view.format in BYTE_FORMATS:
+        if view.nbytes % 8 != 0:
+            raise ValueError(f"resolve_buffer: {label} size {view.nbytes} is not a multiple of 8 bytes")
+        view = view.cast("B").cast("d")
+    if view.format not in COORD_FORMATS or view.ndim != 1:
+        raise ValueError(f"resolve_buffer: {label} must be a 1-dimensional buffer of doubles or floats")
+    return view
+
+
+def _out_view(buf, out_format: str, rows: int, label: str) -> memoryview:
+    """get a writable 1-dimensional view of an output buffer with room for the results"""
+    view = memoryview(buf)
+    if view.readonly:
+        raise ValueError(f"resolve_buffer: {label} must be writable")
+    if view.format in BYTE_FORMATS and view.nbytes % 2 == 0:
+        view = view.cast("B").cast(out_format)
+    if view.format.lstrip("@=") != out_format or view.ndim != 1:
+        raise ValueError(f"resolve_buffer: {label} must be a 1-dimensional buffer of format {out_format}")
+    if len(view) < rows:
+        raise ValueError(f"resolve_buffer: {label} has room for {len(view)} rows, needs {rows}")
+    return view
+
+
+def resolve_buffer(
+    lon,
+    lat=None,
+    index_out=None,
+    offset_out=None,
+    use_lon_tz: bool = False,
+    use_narrow: bool = False,
+    tz_type: str = None,
+) -> int:
+    """
+    resolve buffers of longitude and optional latitude, writing zone indexes and offsets into output buffers
+
+    input:
+        lon: buffer of longitudes in degrees, -180 to +180
+        lat: optional buffer of latitudes in degrees, -90 to +90, with the same number of rows as lon
+        index_out: optional writable buffer of uint16 (format H) for zone indexes
+        offset_out: optional writable buffer of int16 (format h) for offsets from UTC in minutes
+        use_lon_tz: true=use longitude-based time zones
+        use_narrow: true=use narrow time zones (default is hour-based time zones)
+        tz_type: time zone type name, instead of use_lon_tz or use_narrow, such as a family from define_family()
+
+    The output buffers may be longer than the input. Only the first rows are written.
+    An invalid coordinate raises ValueError with its row number, after the rows before it have been written.
+
+    output: number of rows resolved
+    """
+    tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+    lon_view = _coord_view(lon, "lon")
+    rows = len(lon_view)
+    lat_view = None
+    if lat is not None:
+        lat_view = _coord_view(lat, "lat")
+        if len(lat_view) != rows:
+            raise ValueError(f"resolve_buffer: lat has {len(lat_view)} rows, lon has {rows}")
+    if index_out is None and offset_out is None:
+        raise ValueError("resolve_buffer: requires index_out or offset_out")
+    index_view = None if index_out is None else _out_view(index_out, INDEX_FORMAT, rows, "index_out")
+    offset_view = None if offset_out is None else _out_view(offset_out, OFFSET_FORMAT, rows, "offset_out")
+
+    # offsets of each zone, looked up by zone index
+    offsets = [entry.offset_min for entry in ZONE_TABLE[tz_type]]
+    coord_index = TimeZoneSolar._coord_index  # pylint: disable=protected-access
+    points = zip(lon_view, repeat(None) if lat_view is None else lat_view)
+    row = 0
+    try:
+        for row, (longitude, latitude) in enumerate(points):
+            index = coord_index(longitude, latitude, tz_type)
+            if index_view is not None:
+                index_view[row] = index
+            if offset_view is not None:
+                offset_view[row] = offsets[index]
+    except ValueError as exc:
+        raise ValueError(f"resolve_buffer: row {row}: {exc}") from exc
+    return rows
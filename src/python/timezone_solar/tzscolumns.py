@@ -0,0 +1,129 @@
+"""
+memory-mapped binary column I/O for timezone_solar
+
+Input columns are raw little-endian float64 files, or NumPy .npy files, of longitude and optional latitude.
+Output columns are offsets from UTC in minutes (int16) and zone indexes (uint16), written as raw little-endian
+files or as .npy files when the file name ends in ".npy".
+All files are accessed through memory maps, and rows are resolved by tzsarray in fixed-size blocks. So memory use
+depends on the block size, not the number of rows.
+NumPy is an optional dependency of timezone_solar. This module is only imported when column operations are used.
+"""
+
+import os
+import numpy as np
+from timezone_solar.tzsarray import OFFSET_DTYPE, INDEX_DTYPE, resolve_index, index2offset
+from timezone_solar.tzstable import tz_type_name
+
+# dtype of raw input columns
+COORD_DTYPE = np.dtype("<f8")
+
+# default number of rows resolved at a time
+DEFAULT_BLOCK_ROWS = 1 << 20
+
+
+def _is_npy(path) -> bool:
+    """check if a path names a .npy file"""
+    return str(path).lower().endswith(".npy")
+
+
+def open_column(path) -> np.ndarray:
+    """
+    open a read-only memory map of a coordinate column
+
+    input:
+        path: .npy file of a 1-dimensional numeric array, or a raw file of little-endian float64 values
+
+    output: read-only 1-dimensional array backed by the file
+    """
+    if _is_npy(path):
+        column = np.load(path, mmap_mode="r")
+        if column.ndim != 1 or column.dtype.kind not in "fiu":
+            raise ValueError(f"{path}: expected a 1-dimensional numeric array, found {column.ndim}-d {column.dtype}")
+        return column
+    size = os.path.getsize(path)
+    if size % COORD_DTYPE.itemsize != 0:
+        raise ValueError(f"{path}: size {size} is not a multiple of {COORD_DTYPE.itemsize} bytes")
+    if size == 0:
+        return np.empty(0, dtype=COORD_DTYPE)
+    return np.memmap(path, dtype=COORD_DTYPE, mode="r")
+
+
+def create_column(path, dtype, rows: int) -> np.ndarray:
+    """
+    create a writable memory map of an output column
+
+    input:
+        path: output file, written in .npy format if the name ends in ".npy", otherwise as raw little-endian values
+        dtype: NumPy dtype of the column
+        rows: number of rows
+
+    output: writable 1-dimensional array backed by the file
+    """
+    dtype = np.dtype(dtype).newbyteorder("<")
+    if _is_npy(path):
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(rows,))
+    if rows == 0:
+        with open(path, "wb"):
+            pass
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="w+", shape=(rows,))
+
+
+def resolve_columns(
+    lon_path,
+    lat_path=None,
+    offset_path=None,
+    index_path=None,
+    use_lon_tz: bool = False,
+    use_narrow: bool = False,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    tz_type: str = None,
+) -> int:
+    """
+    resolve longitude and optional latitude column files to offset and zone index column files
+
+    input:
+        lon_path: longitude column file (raw float64 or .npy)
+        lat_path: optional latitude column file with the same number of rows
+        offset_path: optional output file for int16 offsets from UTC in minutes
+        index_path: optional output file for uint16 zone indexes
+        use_lon_tz: true=use longitude-based time zones
+        use_narrow: true=use narrow time zones (default is hour-based time zones)
+        block_rows: number of rows resolved at a time
+        tz_type: time zone type name, instead of use_lon_tz or use_narrow, such as a family from define_family()
+
+    output: number of rows
+    """
+    if offset_path is None and index_path is None:
+        raise ValueError("resolve_columns: no output column file")
+    if block_rows < 1:
+        raise ValueError(f"resolve_columns: block size must be positive, got {block_rows}")
+    tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+    lon = open_column(lon_path)
+    lat = None
+    if lat_path is not None:
+        lat = open_column(lat_path)
+        if len(lat) != len(lon):
+            raise ValueError(f"resolve_columns: {len(lon)} longitude rows but {len(lat)} latitude rows")
+    rows = len(lon)
+    offset_out = None if offset_path is None else create_column(offset_path, OFFSET_DTYPE, rows)
+    index_out = None if index_path is None else create_column(index_path, INDEX_DTYPE, rows)
+
+    # resolve one block at a time, so only one block of the input is paged in as arrays
+    for start in range(0, rows, block_rows):
+        end = min(start + block_rows, rows)
+        try:
+            index = resolve_index(
+                lon[start:end], None if lat is None else lat[start:end], tz_type=tz_type, func="resolve_columns"
+            )
+        except ValueError as exc:
+            raise ValueError(f"{exc} (rows {start}-{end - 1})") from exc
+        if index_out is not None:
+            index_out[start:end] = index
+        if offset_out is not None:
+            offset_out[start:end] = index2offset(index, tz_type=tz_type)
+
+    for column in (offset_out, index_out):
+        if isinstance(column, np.memmap):
+            column.flush()
+    return rows
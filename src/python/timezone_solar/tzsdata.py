@@ -0,0 +1,69 @@
+"""
+binary tzdata generation for timezone_solar
+
+This writes binary TZif files (see RFC 8536 and the tzfile(5) Unix manual page) for the solar time zones
+directly, without running the zic time zone compiler on the tzdata text from "lon_tz.py --tzfile".
+The output is the same as zic produces from that text.
+
+Solar time zones have a fixed offset from UTC with no transitions, so each file has one local time type.
+A directory tree written by write_tzif_tree() can be used by the zoneinfo module by adding it to zoneinfo.TZPATH,
+for example with the PYTHONTZPATH environment variable.
+"""
+
+import struct
+from pathlib import Path
+from timezone_solar.timezone_solar import TimeZoneSolar
+from timezone_solar.tzstable import TZ_TYPE_PARAMS
+
+# TZif header: magic, version, 15 reserved bytes, counts of isut, isstd, leap, time, type and abbreviation chars
+TZIF_MAGIC = b"TZif"
+TZIF_VERSION = b"2"
+TZIF_HEADER = struct.Struct(">4s1s15x6l")
+TZIF_TTINFO = struct.Struct(">lBB")
+
+
+def posix_tz(zone: TimeZoneSolar) -> str:
+    """
+    POSIX TZ string for a solar time zone, used in the TZif footer for times after the last transition
+
+    POSIX offsets are positive west of the Prime Meridian, opposite to offsets from UTC.
+    """
+    offset_min = -zone.offset_min
+    sign = "-" if offset_min < 0 else ""
+    hours, minutes = divmod(abs(offset_min), 60)
+    offset_str = f"{sign}{hours}" + (f":{minutes:02d}" if minutes else "")
+    return f"<{zone.short_name}>{offset_str}"
+
+
+def tzif_bytes(zone: TimeZoneSolar) -> bytes:
+    """
+    binary TZif version 2 data for a solar time zone
+
+    The version 1 and version 2 data blocks are the same because there are no transition times.
+    """
+    abbrev = zone.short_name.encode("ascii") + b"\0"
+    data_block = (
+        TZIF_HEADER.pack(TZIF_MAGIC, TZIF_VERSION, 0, 0, 0, 0, 1, len(abbrev))
+        + TZIF_TTINFO.pack(zone.offset_min * 60, 0, 0)
+        + abbrev
+    )
+    footer = b"\n" + posix_tz(zone).encode("ascii") + b"\n"
+    return data_block + data_block + footer
+
+
+def write_tzif_tree(directory) -> int:
+    """
+    write binary TZif files for all solar time zones into a directory tree, as Solar/<short name>
+
+    input: path of top-level directory, which is created if it doesn't exist
+
+    output: number of files written
+    """
+    tz_dir = Path(directory) / "Solar"
+    tz_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for tz_params in TZ_TYPE_PARAMS.values():
+        for zone in TimeZoneSolar.zones(**tz_params):
+            (tz_dir / zone.short_name).write_bytes(tzif_bytes(zone))
+            count += 1
+    return count
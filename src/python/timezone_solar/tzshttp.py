@@ -0,0 +1,537 @@
+"""
+asyncio HTTP/1.1 lookup server for solar time zones
+
+Programs which aren't written in Python can look up solar time zone fields over HTTP, with JSON requests and
+responses. The server uses only the Python standard library. Connections are kept alive for more requests unless
+the client asks to close them, and pipelined requests are answered in order.
+
+Endpoints:
+    GET /lookup?longitude=...&latitude=...&type=...&get=...   look up one time zone by location
+    GET /lookup?tzname=...&get=...                             look up one time zone by name
+    POST /lookup                                               the same, with a JSON object request body
+    POST /batch                                                a JSON array of lookup objects, or an object with a
+                                                               "requests" array, answered with an array of results
+    GET /metrics                                               request counts, latency histograms and batch sizes
+    GET /health                                                {"status": "ok"}
+
+A lookup has the keys of a lon_tz.py --serve JSON request: tzname, or longitude with optional latitude and type,
+and get with a comma-separated string or list of field names. The result is a JSON object of field names and the
+values lon_tz.py would print for them. Lookups which fail get a 400 response, or an {"error": message} item in a
+batch result.
+
+Single lookups which arrive at about the same time, from different connections, are coalesced into one batch,
+which is resolved after the requests that were ready at the same time have all been read. Repeats of the same
+lookup in a batch are resolved once. Lookups by longitude are grouped by time zone type, and each group is resolved
+in one pass by tzsbuffer.resolve_buffer() into zone indexes of the shared time zones, whose fields are precomputed.
+Lookups by name, and groups with an invalid coordinate, are resolved one at a time, which reports their errors.
+"""
+
+import asyncio
+import bisect
+import json
+import time
+from array import array
+from collections import Counter
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+from timezone_solar.timezone_solar import TimeZoneSolar, SolarLocation
+from timezone_solar.tzsbatch import TZ_TYPES
+from timezone_solar.tzsbuffer import INDEX_FORMAT, resolve_buffer
+from timezone_solar.tzsserve import json_fields, json_string, text_field_getter, tz_fields
+from timezone_solar.tzstable import DEFAULT_TZ_TYPE
+
+# default address of the server, which only accepts local connections
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# request limits
+MAX_BODY_SIZE = 1 << 23
+MAX_HEADERS = 100
+MAX_BATCH_LOOKUPS = 100_000
+
+# default limit on the number of coalesced lookups resolved at once
+DEFAULT_MAX_BATCH = 1024
+
+# seconds to wait for the next request on an idle connection
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+# upper bounds of latency histogram buckets in milliseconds, with a last bucket for anything slower
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+# endpoints reported in metrics, and the methods they accept
+ENDPOINTS = {
+    "/lookup": ("GET", "POST"),
+    "/batch": ("POST",),
+    "/metrics": ("GET",),
+    "/health": ("GET",),
+}
+
+
+class HTTPError(Exception):
+    """error which is answered with an HTTP error status and a JSON error message"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+#
+# lookups
+#
+
+
+def _number(obj: dict, key: str):
+    """get an optional coordinate from a lookup as a float, so it's reported the same as on the command line"""
+    value = obj.get(key)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{key} must be a number")
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise ValueError(f"{key} must be a number, got {value}") from exc
+
+
+def lookup_args(obj) -> dict:
+    """
+    check and normalize one lookup from a JSON object or query string
+
+    output: dictionary of tzname, longitude, latitude, type and get (tuple of field names) for tz_fields()
+    """
+    if not isinstance(obj, dict):
+        raise ValueError("lookup must be a JSON object")
+    if obj.get("get") in (None, "", []):
+        raise ValueError("get is required to specify output field(s)")
+    get = json_fields(obj)
+    return {
+        "tzname": json_string(obj, "tzname"),
+        "longitude": _number(obj, "longitude"),
+        "latitude": _number(obj, "latitude"),
+        "type": json_string(obj, "type"),
+        "get": tuple(",".join(get).split(",")),
+    }
+
+
+def resolve_lookup(args: dict) -> tuple:
+    """
+    resolve one normalized lookup
+
+    output: tuple of success flag, and a dictionary of field values or of the error message
+    """
+    try:
+        values, err = tz_fields(args)
+    except ValueError as exc:
+        return False, {"error": str(exc)}
+    if err is not None:
+        return False, {"error": err}
+    return True, dict(zip(args["get"], values))
+
+
+def _resolve_group(lookups: list, tz_type: str) -> list:
+    """
+    resolve lookups by longitude of one time zone type, which all have a latitude or all don't, in one pass
+
+    output: list of resolve_lookup() results, in the same order
+    """
+    lon = array("d", [args["longitude"] for args in lookups])
+    lat = None if lookups[0]["latitude"] is None else array("d", [args["latitude"] for args in lookups])
+    index = array(INDEX_FORMAT, bytes(2 * len(lookups)))
+    try:
+        resolve_buffer(lon, lat, index_out=index, tz_type=tz_type)
+    except ValueError:
+        # an invalid coordinate: resolve each lookup, which reports the errors the same as a single lookup
+        return [resolve_lookup(args) for args in lookups]
+
+    # fields of each location, from the shared time zone of its zone index
+    tz_instance = TimeZoneSolar._tz_instance  # pylint: disable=protected-access
+    results = []
+    for args, zone_index in zip(lookups, index):
+        location = SolarLocation(tz_instance(tz_type, zone_index), args["longitude"], args["latitude"])
+        try:
+            results.append((True, dict(zip(args["get"], text_field_getter(args["get"])(location)))))
+        except ValueError:
+            results.append(resolve_lookup(args))
+    return results
+
+
+def resolve_lookups(lookups: list) -> list:
+    """
+    resolve normalized lookups together, resolving repeats of the same lookup once
+
+    Lookups by longitude are grouped by time zone type and by whether they have a latitude, and each group is
+    resolved with one resolve_buffer() call. Lookups by name or of an unknown type are resolved one at a time.
+
+    output: list of resolve_lookup() results, in the same order
+    """
+    # distinct lookups, and the groups of lookups by longitude
+    keys = []
+    found = {}
+    groups = {}
+    for args in lookups:
+        key = (args["tzname"], args["longitude"], args["latitude"], args["type"], args["get"])
+        keys.append(key)
+        if key in found:
+            continue
+        tz_type = DEFAULT_TZ_TYPE if args["type"] is None else args["type"]
+        if args["tzname"] is None and args["longitude"] is not None and tz_type in TZ_TYPES:
+            found[key] = None
+            groups.setdefault((tz_type, args["latitude"] is None), []).append((key, args))
+        else:
+            found[key] = resolve_lookup(args)
+
+    # resolve each group in one pass
+    for (tz_type, _), group in groups.items():
+        for (key, _), result in zip(group, _resolve_group([args for _, args in group], tz_type)):
+            found[key] = result
+    return [found[key] for key in keys]
+
+
+#
+# metrics
+#
+
+
+class LatencyHistogram:
+    """histogram of request latencies in milliseconds"""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, latency_ms: float) -> None:
+        """count one latency"""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, fraction: float) -> float | None:
+        """upper bound of the bucket which holds a percentile, such as 0.99, or None if it's the last bucket"""
+        if self.count == 0:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return None
+
+    def as_dict(self) -> dict:
+        """histogram as JSON-compatible data, with cumulative bucket counts keyed by upper bound"""
+        buckets = {}
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            buckets[f"{bound:g}"] = seen
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum_ms": self.total_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "buckets_ms": buckets,
+        }
+
+
+class ServerMetrics:
+    """request, connection and batch counters of a lookup server"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.responses = Counter()
+        self.latency = {endpoint: LatencyHistogram() for endpoint in ENDPOINTS}
+        self.connections_open = 0
+        self.connections_total = 0
+        self.lookups = 0
+        self.batches = 0
+        self.batch_lookups = 0
+        self.max_batch = 0
+
+    def add_batch(self, size: int) -> None:
+        """count one batch of coalesced lookups"""
+        self.batches += 1
+        self.batch_lookups += size
+        self.max_batch = max(self.max_batch, size)
+
+    def add_response(self, endpoint: str, status: int, latency_ms: float) -> None:
+        """count one response and its latency"""
+        self.responses[(endpoint, status)] += 1
+        if endpoint in self.latency:
+            self.latency[endpoint].add(latency_ms)
+
+    def as_dict(self) -> dict:
+        """metrics as JSON-compatible data"""
+        return {
+            "uptime_sec": time.monotonic() - self.started,
+            "connections": {"open": self.connections_open, "total": self.connections_total},
+            "responses": [
+                {"endpoint": endpoint, "status": status, "count": count}
+                for (endpoint, status), count in sorted(self.responses.items())
+            ],
+            "latency": {endpoint: histogram.as_dict() for endpoint, histogram in self.latency.items()},
+            "coalescing": {
+                "lookups": self.lookups,
+                "batches": self.batches,
+                "mean_batch": self.batch_lookups / self.batches if self.batches else 0.0,
+                "max_batch": self.max_batch,
+            },
+        }
+
+
+#
+# server
+#
+
+
+class _Coalescer:
+    """queue of single lookups, which are resolved together once the lookups that were ready have been queued"""
+
+    def __init__(self, metrics: ServerMetrics, max_batch: int):
+        self.metrics = metrics
+        self.max_batch = max_batch
+        self.pending = []
+        self.scheduled = False
+
+    def submit(self, args: dict) -> asyncio.Future:
+        """queue a lookup, returning a future of its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((args, future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif not self.scheduled:
+            # the flush runs after the other tasks which are ready now, so their lookups join this batch
+            self.scheduled = True
+            loop.call_soon(self.flush)
+        return future
+
+    def flush(self) -> None:
+        """resolve the queued lookups"""
+        self.scheduled = False
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        self.metrics.add_batch(len(batch))
+        for (_, future), result in zip(batch, resolve_lookups([args for args, _ in batch])):
+            if not future.done():
+                future.set_result(result)
+
+
+class LookupServer:
+    """
+    asyncio HTTP/1.1 server for solar time zone lookups
+
+    input:
+        coalesce: true=resolve single lookups from concurrent requests together, false=resolve each one as it's read
+        max_batch: maximum number of coalesced lookups resolved at once
+        idle_timeout: seconds to wait for the next request on a connection before closing it
+    """
+
+    def __init__(
+        self, coalesce: bool = True, max_batch: int = DEFAULT_MAX_BATCH, idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ):
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be positive, got {max_batch}")
+        self.metrics = ServerMetrics()
+        self.coalescer = _Coalescer(self.metrics, max_batch) if coalesce else None
+        self.idle_timeout = idle_timeout
+        self.writers = set()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """start listening, returning the asyncio server (port 0 picks a free port)"""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close_connections(self) -> None:
+        """close open connections, so their handlers finish, such as when the server is stopping"""
+        for writer in self.writers:
+            writer.close()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """answer requests on one connection until it's closed"""
+        self.writers.add(writer)
+        self.metrics.connections_open += 1
+        self.metrics.connections_total += 1
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                except HTTPError as exc:
+                    # the rest of a request which couldn't be read can't be skipped, so the connection is closed
+                    writer.write(_response(exc.status, {"error": str(exc)}, keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, keep_alive, body = request
+                start = time.perf_counter()
+                path = urlsplit(target).path
+                try:
+                    status, result = await self.dispatch(method, target, body)
+                except HTTPError as exc:
+                    status, result = exc.status, {"error": str(exc)}
+                writer.write(_response(status, result, keep_alive))
+                await writer.drain()
+                self.metrics.add_response(
+                    path if path in ENDPOINTS else "other", int(status), (time.perf_counter() - start) * 1000.0
+                )
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.writers.discard(writer)
+            self.metrics.connections_open -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> tuple:
+        """route one request, returning the response status and JSON-compatible result"""
+        parts = urlsplit(target)
+        if parts.path not in ENDPOINTS:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"no endpoint {parts.path}")
+        if method not in ENDPOINTS[parts.path]:
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{parts.path} doesn't accept {method}")
+        if parts.path == "/health":
+            return HTTPStatus.OK, {"status": "ok"}
+        if parts.path == "/metrics":
+            return HTTPStatus.OK, self.metrics.as_dict()
+        if parts.path == "/batch":
+            return HTTPStatus.OK, self._batch(_json_body(body))
+
+        # single lookup
+        obj = _query_lookup(parts.query) if method == "GET" else _json_body(body)
+        try:
+            args = lookup_args(obj)
+        except ValueError as exc:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(exc)) from exc
+        self.metrics.lookups += 1
+        if self.coalescer is None:
+            ok, result = resolve_lookup(args)
+        else:
+            ok, result = await self.coalescer.submit(args)
+        return (HTTPStatus.OK if ok else HTTPStatus.BAD_REQUEST), result
+
+    def _batch(self, obj) -> list:
+        """resolve a batch request, with a result or error for each lookup"""
+        if isinstance(obj, dict):
+            obj = obj.get("requests")
+        if not isinstance(obj, list):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "batch must be a JSON array or an object with a requests array")
+        if len(obj) > MAX_BATCH_LOOKUPS:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"batch is limited to {MAX_BATCH_LOOKUPS} lookups")
+        results = [None] * len(obj)
+        lookups = []
+        positions = []
+        for pos, item in enumerate(obj):
+            try:
+                lookups.append(lookup_args(item))
+                positions.append(pos)
+            except ValueError as exc:
+                results[pos] = {"error": str(exc)}
+        for pos, (_, result) in zip(positions, resolve_lookups(lookups)):
+            results[pos] = result
+        self.metrics.lookups += len(obj)
+        self.metrics.add_batch(len(obj))
+        return results
+
+
+def _query_lookup(query: str) -> dict:
+    """get a lookup from a query string, in which get may be repeated like the lon_tz.py --get option"""
+    obj = {}
+    for key, value in parse_qsl(query):
+        if key == "get":
+            obj.setdefault("get", []).append(value)
+        else:
+            obj[key] = value
+    return obj
+
+
+def _json_body(body: bytes):
+    """decode a JSON request body"""
+    try:
+        return json.loads(body)
+    except ValueError as exc:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"invalid JSON: {exc}") from exc
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple | None:
+    """
+    read one HTTP/1.1 request
+
+    output: tuple of method, target, keep-alive flag and body, or None at end of input between requests
+    """
+    try:
+        line = await reader.readline()
+        if not line:
+            return None
+        parts = line.decode("latin-1").split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid request line")
+        method, target, version = parts
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise asyncio.IncompleteReadError(line, None)
+            if len(headers) >= MAX_HEADERS:
+                raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "too many headers")
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+    except ValueError as exc:
+        # StreamReader.readline() raises ValueError for lines longer than its limit
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "request line or header too long") from exc
+
+    if "transfer-encoding" in headers:
+        raise HTTPError(HTTPStatus.NOT_IMPLEMENTED, "transfer encodings are not supported")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError as exc:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from exc
+    if length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"body is limited to {MAX_BODY_SIZE} bytes")
+    body = await reader.readexactly(length) if length else b""
+
+    # HTTP/1.1 connections stay open unless closed by either side, HTTP/1.0 connections only if requested
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version != "HTTP/1.0" else connection == "keep-alive"
+    return method, target, keep_alive, body
+
+
+def _response(status: HTTPStatus, result, keep_alive: bool) -> bytes:
+    """format an HTTP response with a JSON body"""
+    status = HTTPStatus(status)
+    body = json.dumps(result, separators=(",", ":")).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def serve_http(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, **kwargs) -> None:
+    """run a lookup server until it's cancelled, with the options of LookupServer"""
+    lookup_server = LookupServer(**kwargs)
+    server = await lookup_server.start(host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        lookup_server.close_connections()
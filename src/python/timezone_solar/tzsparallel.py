@@ -0,0 +1,120 @@
+"""
+parallel batch lookups of solar time zones from large input files
+
+The input file is split into byte-range chunks which end on line boundaries. Worker processes in a
+ProcessPoolExecutor resolve each chunk with the same rules and output formats as tzsbatch, and the results are
+written in input order. Only a limited number of chunks are in progress at once, so memory use depends on the
+chunk size and worker count, not the size of the input file.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from timezone_solar.tzsbatch import DEFAULT_CHUNK_SIZE, resolve_rows, stream_batch
+from timezone_solar.tzstable import DEFAULT_TZ_TYPE
+
+# number of chunks queued per worker process
+CHUNKS_PER_WORKER = 2
+
+
+def chunk_ranges(path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+    """
+    split a file into byte ranges of about chunk_size bytes, each ending at the end of a line
+
+    output: list of (start, end) byte offsets
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk size must be positive, got {chunk_size}")
+    ranges = []
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as infile:
+        start = 0
+        while start < file_size:
+            infile.seek(min(start + chunk_size, file_size) - 1)
+            infile.readline()
+            end = infile.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def resolve_chunk(
+    path, start: int, end: int, fields: list, fmt: str = "tsv", tz_type: str = DEFAULT_TZ_TYPE
+) -> tuple:
+    """
+    resolve the lines in one byte range of a file, in a worker process
+
+    output: tuple of output text, number of input lines, and list of (line number in chunk, error message)
+    """
+    with open(path, "rb") as infile:
+        infile.seek(start)
+        text = infile.read(end - start).decode("utf-8")
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+
+    # line numbers count from 1 in each chunk, and only the first chunk of the file may have a CSV header
+    errors = []
+    rows = resolve_rows(
+        lines, fields, fmt, tz_type,
+        on_error=lambda lineno, mesg: errors.append((lineno, mesg)),
+        header=start == 0,
+    )
+    return "".join(rows), len(lines), errors
+
+
+def parallel_batch(
+    path,
+    outfile,
+    fields: list,
+    fmt: str = "tsv",
+    tz_type: str = DEFAULT_TZ_TYPE,
+    errfile=None,
+    workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    resolve the lines of an input file in parallel worker processes, writing formatted rows in input order
+
+    input:
+        path: input file path, with the same line formats as tzsbatch
+        outfile: text output stream
+        fields: list of field names to output
+        fmt: output format: tsv, csv or ndjson
+        tz_type: default time zone type name for lines which don't specify one
+        errfile: optional text stream for error reports
+        workers: number of worker processes (default: number of CPUs), or 1 to resolve in this process
+        chunk_size: approximate size of input chunks in bytes
+
+    output: number of input lines which could not be resolved
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"number of workers must be positive, got {workers}")
+    if workers == 1:
+        with open(path, encoding="utf-8") as infile:
+            return stream_batch(infile, outfile, fields, fmt, tz_type, errfile)
+
+    # check field names and format before starting worker processes
+    list(resolve_rows([], fields, fmt, tz_type))
+
+    errors = 0
+    lines_done = 0
+    ranges = deque(chunk_ranges(path, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while ranges or pending:
+            # keep a limited number of chunks queued, then write the oldest one's results
+            while ranges and len(pending) < workers * CHUNKS_PER_WORKER:
+                start, end = ranges.popleft()
+                pending.append(executor.submit(resolve_chunk, path, start, end, fields, fmt, tz_type))
+            output, line_count, chunk_errors = pending.popleft().result()
+            outfile.write(output)
+            errors += len(chunk_errors)
+            if errfile is not None:
+                for lineno, mesg in chunk_errors:
+                    print(f"line {lines_done + lineno}: {mesg}", file=errfile)
+            lines_done += line_count
+    outfile.flush()
+    return errors
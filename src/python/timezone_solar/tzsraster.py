@@ -0,0 +1,160 @@
+"""
+memory-mapped latitude/longitude raster of zone indexes for timezone_solar
+
+A raster covers the whole globe in square cells, with a whole number of cells per degree. Row 0 is at the North
+Pole and column 0 is at -180° longitude, as in a map image. Each cell holds the zone index of the point at its
+center, with the polar override applied, for one time zone type, so a map renderer can find the zone of a pixel
+with integer arithmetic instead of constructing a TimeZoneSolar per pixel.
+
+A raster file is a 64-byte header followed by the cells, as little-endian uint16 values in row-major order. The
+header has a magic number, the zone family's clock-minute step, the cells per degree, the number of rows and
+columns, and the time zone type name. Files are written under a temporary name and renamed when complete, so other
+processes never open a partial raster. Opening a raster maps the file read-only without reading the cells.
+NumPy is an optional dependency of timezone_solar. This module is only imported when rasters are used.
+"""
+
+import os
+import struct
+import numpy as np
+from timezone_solar.tzsarray import INDEX_DTYPE, resolve_index, short_names
+from timezone_solar.tzsconst import TZSConst
+from timezone_solar.tzstable import ZONE_FAMILIES, define_family, tz_type_name
+
+# raster file header: magic, step in minutes, cells per degree, rows, columns, time zone type name, padding
+RASTER_MAGIC = b"TZSRAST1"
+HEADER_FORMAT = "<8sHHII32s12x"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# dtype of raster cells in files
+CELL_DTYPE = np.dtype(INDEX_DTYPE).newbyteorder("<")
+
+# default and maximum number of cells per degree
+DEFAULT_PER_DEGREE = 4
+MAX_PER_DEGREE = 3600
+
+# number of cells resolved at a time while writing a raster
+BLOCK_CELLS = 1 << 20
+
+
+class ZoneRaster:
+    """raster of zone indexes, usually backed by a read-only memory map of a raster file"""
+
+    def __init__(self, cells: np.ndarray, tz_type: str, per_degree: int):
+        self.cells = cells  # 2-dimensional array of zone indexes, rows from north to south
+        self.tz_type = tz_type  # time zone type name of the zone indexes
+        self.per_degree = per_degree  # cells per degree of latitude and longitude
+
+    def cell_of(self, lon, lat) -> tuple:
+        """
+        row and column indexes of the cells which contain arrays of longitude and latitude, without range checks
+
+        Points on a cell edge are in the cell to the east or south, except at +180° and -90° which are in the last
+        column and row.
+        """
+        rows, cols = self.cells.shape
+        col = np.floor((np.asarray(lon, dtype=np.float64) + TZSConst.MAX_LONGITUDE_INT) * self.per_degree)
+        row = np.floor((TZSConst.MAX_LATITUDE_FP - np.asarray(lat, dtype=np.float64)) * self.per_degree)
+        return np.clip(row, 0, rows - 1).astype(np.intp), np.clip(col, 0, cols - 1).astype(np.intp)
+
+    def index_at(self, lon, lat) -> np.ndarray:
+        """zone indexes from the raster cells which contain arrays of longitude and latitude"""
+        return self.cells[self.cell_of(lon, lat)]
+
+    def centers(self) -> tuple:
+        """arrays of the longitude of each column's center and the latitude of each row's center"""
+        rows, cols = self.cells.shape
+        lon = (np.arange(cols) + 0.5) / self.per_degree - TZSConst.MAX_LONGITUDE_INT
+        lat = TZSConst.MAX_LATITUDE_FP - (np.arange(rows) + 0.5) / self.per_degree
+        return lon, lat
+
+    def short_names(self) -> np.ndarray:
+        """array of the time zone short names of the raster's time zone type, indexed by zone index"""
+        return short_names(tz_type=self.tz_type)
+
+
+def _shape(per_degree) -> tuple:
+    """rows and columns of a raster with a number of cells per degree, which must be a whole number in range"""
+    if per_degree.__class__ is not int or not 1 <= per_degree <= MAX_PER_DEGREE:
+        raise ValueError(f"raster: cells per degree must be a whole number from 1 to {MAX_PER_DEGREE}")
+    return int(TZSConst.MAX_LATITUDE_FP) * 2 * per_degree, int(TZSConst.MAX_LONGITUDE_INT) * 2 * per_degree
+
+
+def _fill(raster: ZoneRaster) -> None:
+    """compute the zone index of every cell center, in blocks of rows"""
+    lon, lat = raster.centers()
+    block_rows = max(1, BLOCK_CELLS // len(lon))
+    for start in range(0, len(lat), block_rows):
+        end = min(start + block_rows, len(lat))
+        raster.cells[start:end] = resolve_index(
+            lon[np.newaxis, :], lat[start:end, np.newaxis], tz_type=raster.tz_type, func="write_raster"
+        )
+
+
+def write_raster(
+    path,
+    per_degree: int = DEFAULT_PER_DEGREE,
+    use_lon_tz: bool = False,
+    use_narrow: bool = False,
+    tz_type: str = None,
+) -> ZoneRaster:
+    """
+    compute a raster of zone indexes and write it to a file
+
+    input:
+        path: output raster file
+        per_degree: cells per degree of latitude and longitude, so the raster has 180 * per_degree rows and
+            360 * per_degree columns
+        use_lon_tz: true=use longitude-based time zones
+        use_narrow: true=use narrow time zones (default is hour-based time zones)
+        tz_type: time zone type name, instead of use_lon_tz or use_narrow, such as a family from define_family()
+
+    output: the raster, opened read-only from the new file
+    """
+    tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+    rows, cols = _shape(per_degree)
+    name = tz_type.encode("utf-8")
+    if len(name) > 32:
+        raise ValueError(f"raster: time zone type name {tz_type} is longer than 32 bytes")
+
+    # write the header and size the file, then fill the cells through a memory map
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as outfile:
+            outfile.write(struct.pack(
+                HEADER_FORMAT, RASTER_MAGIC, ZONE_FAMILIES[tz_type].step_min, per_degree, rows, cols, name
+            ))
+            outfile.truncate(HEADER_SIZE + rows * cols * CELL_DTYPE.itemsize)
+        cells = np.memmap(tmp_path, dtype=CELL_DTYPE, mode="r+", offset=HEADER_SIZE, shape=(rows, cols))
+        _fill(ZoneRaster(cells, tz_type, per_degree))
+        cells.flush()
+        del cells
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return open_raster(path)
+
+
+def open_raster(path) -> ZoneRaster:
+    """
+    open a raster file as a read-only memory map
+
+    A raster of a zone family which isn't defined in this process defines it with the step from the file.
+    """
+    with open(path, "rb") as infile:
+        header = infile.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE or header[:len(RASTER_MAGIC)] != RASTER_MAGIC:
+        raise ValueError(f"{path}: not a timezone_solar raster file")
+    _, step_min, per_degree, rows, cols, name = struct.unpack(HEADER_FORMAT, header)
+    tz_type = name.rstrip(b"\0").decode("utf-8")
+    if not 1 <= per_degree <= MAX_PER_DEGREE or (rows, cols) != _shape(per_degree):
+        raise ValueError(f"{path}: {rows} by {cols} cells don't match {per_degree} cells per degree")
+    size = os.path.getsize(path)
+    if size != HEADER_SIZE + rows * cols * CELL_DTYPE.itemsize:
+        raise ValueError(f"{path}: size {size} doesn't match {rows} by {cols} cells")
+    family = ZONE_FAMILIES.get(tz_type) or define_family(tz_type, step_min)
+    if family.step_min != step_min:
+        raise ValueError(f"{path}: time zone type {tz_type} has a {family.step_min} minute step, not {step_min}")
+    cells = np.memmap(path, dtype=CELL_DTYPE, mode="r", offset=HEADER_SIZE, shape=(rows, cols))
+    return ZoneRaster(cells, tz_type, per_degree)
@@ -0,0 +1,177 @@
+"""
+persistent co-process protocol for solar time zone lookups
+
+A client starts "lon_tz.py --serve" once and writes one request per line to its standard input, instead of
+starting a new lon_tz.py process for each lookup. A request uses the same options as a lon_tz.py command line,
+such as "--longitude=-122.597 --latitude=45.589 --get=short_name,offset", or a JSON object with tzname, longitude,
+latitude, type and get keys.
+
+Each response starts with a header line, and is flushed as soon as it's written:
+    ok N              followed by N lines of field values
+    error N MESSAGE   followed by N lines of field values which were output before the error
+The field values and error messages are the same as a separate lon_tz.py process would print for the request.
+Blank lines are ignored. The server stops at end of input or a "quit" line.
+"""
+
+import argparse
+from functools import lru_cache
+import json
+import shlex
+from timezone_solar.timezone_solar import TimeZoneSolar
+from timezone_solar.tzsbatch import TZ_TYPES
+from timezone_solar.tzstable import DEFAULT_TZ_TYPE
+
+# request line which stops the server
+QUIT_REQUEST = "quit"
+
+# number of distinct --get field lists whose compiled accessors are kept
+FIELD_GETTER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=FIELD_GETTER_CACHE_SIZE)
+def _compiled_getter(make_getter, get_keys: tuple):
+    """accessor of CLI-formatted field values from a field_getter() method"""
+    return make_getter(*get_keys, text=True)
+
+
+def text_field_getter(get_keys: tuple):
+    """
+    compiled accessor of CLI-formatted field values, shared by requests for the same field list
+
+    Accessors are cached by the current TimeZoneSolar.field_getter() method too, so the instrumented accessors made
+    while instrumentation is enabled aren't used once it's disabled, and the other way around.
+    """
+    return _compiled_getter(TimeZoneSolar.field_getter, get_keys)
+
+
+def tz_fields(args: dict) -> tuple[list, str | None]:
+    """
+    look up a time zone by name or location and collect the requested field(s), as the CLI prints them
+
+    input:
+        args: dictionary of tzname or longitude, latitude and type, and get (list of comma-separated field names)
+
+    output: tuple of the list of field value strings, and an error message or None
+        Field values are collected up to the first unknown field name, which sets the error message.
+        Invalid time zone parameters raise ValueError.
+    """
+    if args.get("tzname") is not None:
+        tzs = TimeZoneSolar(tzname=args["tzname"])
+    else:
+        if args.get("longitude") is None:
+            raise ValueError("longitude parameter missing")
+        tz_type = args.get("type")
+        if tz_type is not None and tz_type not in TZ_TYPES:
+            raise ValueError(f"unknown time zone type {tz_type}")
+        tzs = TimeZoneSolar.locate(
+            longitude=args["longitude"],
+            latitude=args.get("latitude"),
+            **TZ_TYPES[DEFAULT_TZ_TYPE if tz_type is None else tz_type],
+        )
+
+    # collect requested field(s)
+    if args.get("get") is None:
+        return [], "--get is required to specify output field(s)"
+    get_keys = tuple((','.join(args["get"])).split(sep=','))
+    try:
+        return list(text_field_getter(get_keys)(tzs)), None
+    except ValueError:
+        pass
+
+    # an unknown field name: collect the values before it, one at a time, and report it
+    values = []
+    try:
+        for get_key in get_keys:
+            value = tzs.get(get_key)
+            values.append("" if value is None else str(value))
+    except ValueError as tz_exc:
+        return values, str(tz_exc)
+    return values, None
+
+
+class _RequestParser(argparse.ArgumentParser):
+    """argument parser for request lines, which raises ValueError instead of exiting"""
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+def request_parser() -> argparse.ArgumentParser:
+    """generate parser for request lines, with the lookup options of the lon_tz.py command line"""
+    parser = _RequestParser(prog="request", add_help=False)
+    excl_group = parser.add_mutually_exclusive_group(required=True)
+    excl_group.add_argument("--tzname", type=str)
+    excl_group.add_argument("--longitude", type=float)
+    parser.add_argument("--latitude", type=float)
+    parser.add_argument("--type", choices=list(TZ_TYPES))
+    parser.add_argument("--get", action='append')
+    return parser
+
+
+def json_string(obj: dict, key: str):
+    """get an optional string parameter from a JSON request"""
+    value = obj.get(key)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{key} must be a string")
+    return value
+
+
+def json_fields(obj: dict) -> list | None:
+    """get the optional list of field names from a JSON request, which may be a string or a list of strings"""
+    get = obj.get("get")
+    if get is None:
+        return None
+    if isinstance(get, str):
+        get = [get]
+    if not isinstance(get, list) or not all(isinstance(field, str) for field in get):
+        raise ValueError("get must be a string or a list of strings")
+    return get
+
+
+def parse_request(line: str, parser: argparse.ArgumentParser = None) -> dict:
+    """parse one request line into a dictionary of lookup parameters for tz_fields()"""
+    if line.lstrip().startswith("{"):
+        obj = json.loads(line)
+        if not isinstance(obj, dict):
+            raise ValueError("JSON request must be an object")
+        for key in ("tzname", "type"):
+            json_string(obj, key)
+        obj["get"] = json_fields(obj)
+        return obj
+    if parser is None:
+        parser = request_parser()
+    return vars(parser.parse_args(shlex.split(line)))
+
+
+def handle_request(line: str, parser: argparse.ArgumentParser = None) -> str:
+    """process one request line, returning the framed response text"""
+    try:
+        values, err = tz_fields(parse_request(line, parser))
+    except ValueError as exc:
+        values, err = [], str(exc)
+    header = f"ok {len(values)}" if err is None else f"error {len(values)} {err}"
+    return "\n".join([header] + values) + "\n"
+
+
+def serve(infile, outfile) -> int:
+    """
+    answer request lines from an input stream until end of input or a quit request
+
+    input:
+        infile: text input stream of requests
+        outfile: text output stream for responses, flushed after each one
+
+    output: number of requests answered
+    """
+    parser = request_parser()
+    count = 0
+    for line in infile:
+        line = line.strip()
+        if line == "":
+            continue
+        if line == QUIT_REQUEST:
+            break
+        outfile.write(handle_request(line, parser))
+        outfile.flush()
+        count += 1
+    return count
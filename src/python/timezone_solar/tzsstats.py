@@ -0,0 +1,198 @@
+"""
+opt-in instrumentation counters for timezone_solar
+
+When enabled, TimeZoneSolar and SolarLocation methods are replaced by instrumented wrappers which count
+constructions by path (name, longitude or polar latitude override), get() calls per field and validation
+failures, and add up the time spent in each stage: zone lookup from parameters, shared instance lookup and get().
+Accessors made by TimeZoneSolar.field_getter() while instrumentation is enabled read each field with get(), so the
+CLI, batch, co-process and HTTP outputs which use them are counted in the get stage too.
+Disabling restores the original methods, so instrumentation costs nothing when it isn't enabled.
+
+Counters are updated under a lock, so they stay exact when several threads use time zones at once.
+These functions are used through TimeZoneSolar.enable_stats() and TimeZoneSolar.stats().
+"""
+
+import threading
+import time
+from collections import Counter
+from timezone_solar.timezone_solar import TimeZoneSolar, SolarLocation
+from timezone_solar.tzsconst import TZSConst
+
+# construction paths and timed stages, in the order they're reported
+CONSTRUCT_PATHS = ("name", "longitude", "polar")
+STAGES = ("lookup", "instance", "get")
+
+# latitude at which the polar override to UTC starts
+_POLAR_LATITUDE = TZSConst.LIMIT_LATITUDE - TZSConst.PRECISION_FP
+
+# counters and cumulative stage times in nanoseconds
+_LOCK = threading.Lock()
+_CONSTRUCT = Counter()
+_GET = Counter()
+_FAILURES = Counter()
+_TIME_NS = Counter()
+
+# original methods, saved while instrumentation is enabled
+_ORIGINALS = {}
+
+
+def _construct_path(tz_params: dict) -> str:
+    """classify a successful zone lookup by the path it took"""
+    if tz_params.get("tzname") is not None:
+        return "name"
+    latitude = tz_params.get("latitude")
+    if latitude is not None and abs(float(latitude)) >= _POLAR_LATITUDE:
+        return "polar"
+    return "longitude"
+
+
+def _make_tz_index(orig):
+    """instrumented wrapper of TimeZoneSolar._tz_index()"""
+
+    def _tz_index(cls, tz_params: dict) -> tuple:
+        start = time.perf_counter_ns()
+        try:
+            result = orig(cls, tz_params)
+        except ValueError:
+            path = "name" if tz_params.get("tzname") is not None else "longitude"
+            with _LOCK:
+                _FAILURES[path] += 1
+                _TIME_NS["lookup"] += time.perf_counter_ns() - start
+            raise
+        elapsed = time.perf_counter_ns() - start
+        path = _construct_path(tz_params)
+        with _LOCK:
+            _CONSTRUCT[path] += 1
+            _TIME_NS["lookup"] += elapsed
+        return result
+
+    return classmethod(_tz_index)
+
+
+def _make_tz_instance(orig):
+    """instrumented wrapper of TimeZoneSolar._tz_instance()"""
+
+    def _tz_instance(cls, tz_type: str, index: int):
+        start = time.perf_counter_ns()
+        obj = orig(cls, tz_type, index)
+        elapsed = time.perf_counter_ns() - start
+        with _LOCK:
+            _TIME_NS["instance"] += elapsed
+        return obj
+
+    return classmethod(_tz_instance)
+
+
+def _timed_get(orig, obj, key: str):
+    """call an original get() method, counting the field and the time taken"""
+    start = time.perf_counter_ns()
+    try:
+        value = orig(obj, key)
+    except ValueError:
+        with _LOCK:
+            _FAILURES["get"] += 1
+            _TIME_NS["get"] += time.perf_counter_ns() - start
+        raise
+    elapsed = time.perf_counter_ns() - start
+    with _LOCK:
+        _GET[key] += 1
+        _TIME_NS["get"] += elapsed
+    return value
+
+
+def _make_zone_get(orig):
+    """instrumented wrapper of TimeZoneSolar.get()"""
+
+    def get(self, key: str) -> str:
+        return _timed_get(orig, self, key)
+
+    return get
+
+
+def _make_location_get(orig):
+    """instrumented wrapper of SolarLocation.get(), which counts fields it doesn't pass on to TimeZoneSolar.get()"""
+
+    def get(self, key: str) -> str:
+        if key not in ("longitude", "latitude"):
+            return orig(self, key)
+        return _timed_get(orig, self, key)
+
+    return get
+
+
+def _make_field_getter(orig):
+    """instrumented wrapper of TimeZoneSolar.field_getter(), whose accessors read each field with get()"""
+
+    def field_getter(cls, *fields: str, text: bool = False):
+        orig(cls, *fields, text=text)  # raises ValueError for an unknown field
+        convert = cls._field_str if text else None  # pylint: disable=protected-access
+
+        def getter(obj) -> tuple:
+            values = tuple(obj.get(key) for key in fields)
+            return values if convert is None else tuple(convert(value) for value in values)
+
+        return getter
+
+    return classmethod(field_getter)
+
+
+# instrumented methods: (class, method name, wrapper factory)
+_WRAPPERS = (
+    (TimeZoneSolar, "_tz_index", _make_tz_index),
+    (TimeZoneSolar, "_tz_instance", _make_tz_instance),
+    (TimeZoneSolar, "get", _make_zone_get),
+    (TimeZoneSolar, "field_getter", _make_field_getter),
+    (SolarLocation, "get", _make_location_get),
+)
+
+
+def enable() -> None:
+    """replace methods with instrumented wrappers, if they aren't already"""
+    with _LOCK:
+        if _ORIGINALS:
+            return
+        for cls, name, factory in _WRAPPERS:
+            orig = cls.__dict__[name]
+            _ORIGINALS[(cls, name)] = orig
+            setattr(cls, name, factory(orig.__func__ if isinstance(orig, classmethod) else orig))
+
+
+def disable() -> None:
+    """restore the original methods, keeping the counters"""
+    with _LOCK:
+        for (cls, name), orig in _ORIGINALS.items():
+            setattr(cls, name, orig)
+        _ORIGINALS.clear()
+
+
+def is_enabled() -> bool:
+    """check if instrumentation is enabled"""
+    return bool(_ORIGINALS)
+
+
+def snapshot(reset: bool = False) -> dict:
+    """
+    get a copy of the counters
+
+    input:
+        reset: true=set the counters to zero after copying them
+
+    output: dictionary with keys
+        enabled: whether instrumentation is enabled
+        constructions: counts of successful constructions by path: name, longitude and polar
+        get: counts of get() calls by field name
+        failures: counts of validation failures by path: name, longitude and get
+        time: cumulative seconds by stage: lookup (validation and zone lookup), instance (shared instance) and get
+    """
+    with _LOCK:
+        stats = {
+            "enabled": bool(_ORIGINALS),
+            "constructions": {path: _CONSTRUCT[path] for path in CONSTRUCT_PATHS},
+            "get": dict(_GET),
+            "failures": {path: _FAILURES[path] for path in (*CONSTRUCT_PATHS[:2], "get")},
+            "time": {stage: _TIME_NS[stage] / 1e9 for stage in STAGES},
+        }
+        if reset:
+            for counter in (_CONSTRUCT, _GET, _FAILURES, _TIME_NS):
+                counter.clear()
+    return stats
@@ -0,0 +1,128 @@
+"""
+vectorized tables of apparent solar noon, sunrise and sunset for timezone_solar
+
+Longitude-based time zones are meant for planning events around available daylight, centered on local solar noon.
+sun_table() computes daily tables of solar noon, sunrise and sunset for arrays of locations and dates in one
+vectorized pass, as local wall-clock times in each location's solar time zone.
+
+Solar noon is apparent (sundial) noon, which differs from mean solar noon on the zone's clock by the equation of
+time, up to about 16 minutes, and by the location's distance from its zone's center meridian. Sunrise and sunset
+are when the top of the Sun's disc is on the horizon, with the standard correction for atmospheric refraction.
+The Sun's declination and the equation of time use the NOAA general solar position series, evaluated for each
+location at its approximate solar noon. Times are accurate to about a minute between the polar circles, and less
+accurate near polar day and night, when the Sun moves almost parallel to the horizon.
+NumPy is an optional dependency of timezone_solar. This module is only imported when these tables are used.
+"""
+
+import numpy as np
+from timezone_solar.tzsarray import check_range, index2offset, resolve_index
+from timezone_solar.tzsconst import TZSConst
+from timezone_solar.tzstable import tz_type_name
+
+# zenith angle of the Sun's center at sunrise and sunset: 90° plus refraction and the Sun's apparent radius
+SUNRISE_ZENITH_DEG = 90.833
+
+# minutes of clock time per degree of longitude
+MINUTES_PER_DEGREE = 4.0
+
+# local solar noon, in minutes after midnight, before the equation of time and longitude corrections
+NOON_MINUTES = 720.0
+
+
+def _solar_position(dates: np.ndarray, lon: np.ndarray) -> tuple:
+    """
+    equation of time in minutes and declination in radians, for each location (rows) and date (columns)
+
+    The NOAA series uses the fractional year in radians, here at each location's approximate solar noon in UTC,
+    which is earlier than noon UTC by 1/360 of a day per degree of east longitude.
+    """
+    year_start = dates.astype("datetime64[Y]")
+    day_of_year = (dates - year_start.astype("datetime64[D]")).astype(np.float64)
+    days_in_year = ((year_start + 1).astype("datetime64[D]") - year_start.astype("datetime64[D]")).astype(np.float64)
+    gamma = 2.0 * np.pi / days_in_year * (day_of_year - lon[:, np.newaxis] / 360.0)
+
+    cos1, sin1 = np.cos(gamma), np.sin(gamma)
+    cos2, sin2 = np.cos(2.0 * gamma), np.sin(2.0 * gamma)
+    eqtime = 229.18 * (0.000075 + 0.001868 * cos1 - 0.032077 * sin1 - 0.014615 * cos2 - 0.040849 * sin2)
+    decl = (
+        0.006918 - 0.399912 * cos1 + 0.070257 * sin1 - 0.006758 * cos2 + 0.000907 * sin2
+        - 0.002697 * np.cos(3.0 * gamma) + 0.00148 * np.sin(3.0 * gamma)
+    )
+    return eqtime, decl
+
+
+def _wall_clock(dates: np.ndarray, minutes: np.ndarray) -> np.ndarray:
+    """local wall-clock datetime64[s] times from dates (columns) and minutes after local midnight"""
+    seconds = np.rint(minutes * 60.0).astype(np.int64).astype("timedelta64[s]")
+    return dates.astype("datetime64[s]") + seconds
+
+
+def sun_table(
+    lon, lat, dates, use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None
+) -> dict:
+    """
+    compute daily solar noon, sunrise and sunset for arrays of locations and dates
+
+    input:
+        lon: array-like of longitudes in degrees, -180 to +180
+        lat: array-like of latitudes in degrees, -90 to +90, broadcast against lon
+        dates: array-like of dates, as datetime64, datetime.date or ISO strings, such as a year of days from
+            np.arange(np.datetime64("2025-01-01"), np.datetime64("2026-01-01"))
+        use_lon_tz: true=use longitude-based time zones
+        use_narrow: true=use narrow time zones (default is hour-based time zones)
+        tz_type: time zone type name, instead of use_lon_tz or use_narrow, such as a family from define_family()
+
+    Locations are rows and dates are columns of the tables. Times are local wall-clock times in each location's
+    solar time zone, with the polar override to UTC applied. Sunrise or sunset may fall on the day before or after
+    the date in far-off zones, such as those overridden to UTC near the poles.
+
+    output: dictionary of arrays
+        date: datetime64[D] dates, one per column
+        zone_index: uint16 zone index of each location, one per row
+        offset_min: int16 offset of each location's time zone from UTC in minutes, one per row
+        noon: datetime64[s] apparent solar noon
+        sunrise, sunset: datetime64[s] sunrise and sunset, NaT on days of polar day or polar night
+        daylight: timedelta64[s] time between sunrise and sunset, 0 in polar night and 24 hours in polar day
+        equation_of_time: float64 minutes by which apparent solar time is ahead of mean solar time
+    """
+    tz_type = tz_type_name(use_lon_tz, use_narrow, tz_type)
+    lon, lat = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(lon, dtype=np.float64)), np.atleast_1d(np.asarray(lat, dtype=np.float64))
+    )
+    dates = np.atleast_1d(np.asarray(dates, dtype="datetime64[D]"))
+    if lon.ndim != 1 or dates.ndim != 1:
+        raise ValueError("sun_table: locations and dates must be 1-dimensional")
+    if np.isnat(dates).any():
+        raise ValueError("sun_table: dates must not be NaT")
+    check_range(lon, TZSConst.MAX_LONGITUDE_FP, "longitude", "sun_table")
+    check_range(lat, TZSConst.MAX_LATITUDE_FP, "latitude", "sun_table")
+
+    index = resolve_index(lon, lat, tz_type=tz_type)
+    offset_min = index2offset(index, tz_type=tz_type)
+    eqtime, decl = _solar_position(dates, lon)
+
+    # apparent solar noon in minutes after local midnight, from the location's clock-time distance east of the
+    # zone's center meridian, taken the short way around so -180° is next to a zone at +180°
+    east_min = (MINUTES_PER_DEGREE * lon - offset_min + NOON_MINUTES) % (2 * NOON_MINUTES) - NOON_MINUTES
+    noon = NOON_MINUTES - east_min[:, np.newaxis] - eqtime
+
+    # hour angle of sunrise and sunset, where cosines beyond +/-1 are polar night and polar day
+    lat_rad = np.radians(lat)[:, np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_ha = (np.cos(np.radians(SUNRISE_ZENITH_DEG)) - np.sin(lat_rad) * np.sin(decl)) / (
+            np.cos(lat_rad) * np.cos(decl)
+        )
+    no_sunrise = ~(np.abs(cos_ha) <= 1.0)
+    half_day = MINUTES_PER_DEGREE * np.degrees(np.arccos(np.clip(cos_ha, -1.0, 1.0)))
+
+    not_a_time = np.datetime64("NaT", "s")
+    return {
+        "date": dates,
+        "zone_index": index,
+        "offset_min": offset_min,
+        "noon": _wall_clock(dates, noon),
+        "sunrise": np.where(no_sunrise, not_a_time, _wall_clock(dates, noon - half_day)),
+        "sunset": np.where(no_sunrise, not_a_time, _wall_clock(dates, noon + half_day)),
+        "daylight": np.rint(2.0 * half_day * 60.0).astype(np.int64).astype("timedelta64[s]"),
+        "equation_of_time": eqtime,
+    }
@@ -0,0 +1,243 @@
+"""
+precomputed table of all solar time zones
+
+The table has an entry for every time zone of each type, computed once when the module is loaded:
+* hour: 1-hour-wide (15 degrees longitude) time zones West12 to East12
+* narrow: 15-minute-wide (3.75 degrees longitude) time zones West1200 to East1200
+* longitude: 4-minute-wide (1 degree longitude) time zones Lon180W to Lon180E
+
+Zone indexes count from the west side of the Date Line within a time zone type, so the zone at index i is
+tz_max - i zones west of the Prime Meridian. tz_max is 12 for hour, 48 for narrow and 180 for longitude time zones.
+The zones either side of the Date Line (index 0 and 2 * tz_max) are half as wide as the others.
+
+The name index maps every valid time zone name to its table entry. Names are case-insensitive, so the index is
+keyed by lower-case names. It includes names with the "Solar/" prefix and the aliases West00, West0000 and Lon000W
+of the zones at the Prime Meridian.
+
+Each time zone type is a zone family: equal-width zones at a fixed step of clock minutes, with the half-wide zones
+at the Date Line. The boundaries of a family are precomputed into a sorted tuple, so finding the zone for a
+longitude is one bisect for any family. More families, such as 30-minute or 5-minute zones, can be added with
+define_family(). Their zones are found by longitude with the tz_type parameter of TimeZoneSolar. They aren't in the
+name index, because their names in hours and minutes can be the same as the names of narrow time zones.
+"""
+
+import math
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import NamedTuple
+from timezone_solar.tzsconst import TZSConst
+
+# width of each time zone type in degrees of longitude
+TZ_TYPE_WIDTHS = MappingProxyType({"hour": 15, "narrow": 3.75, "longitude": 1})
+
+# time zone type names, and the default type
+TZ_TYPE_NAMES = tuple(TZ_TYPE_WIDTHS)
+DEFAULT_TZ_TYPE = "hour"
+
+# TimeZoneSolar parameters for each time zone type name, as used by the CLI --type option
+TZ_TYPE_PARAMS = MappingProxyType({
+    "hour": MappingProxyType({"use_lon_tz": False, "use_narrow": False}),
+    "narrow": MappingProxyType({"use_lon_tz": False, "use_narrow": True}),
+    "longitude": MappingProxyType({"use_lon_tz": True, "use_narrow": False}),
+})
+
+
+class ZoneEntry(NamedTuple):
+    """one solar time zone in the zone table"""
+
+    tz_type: str  # time zone type name: hour, narrow or longitude
+    index: int  # zone index within the time zone type, from the west side of the Date Line
+    name: str  # full name, such as Solar/West08
+    short_name: str  # name without prefix, such as West08
+    offset_min: int  # offset from UTC in minutes
+    longitude: float  # centerline of the time zone in degrees
+    west_lon: float  # west boundary in degrees
+    east_lon: float  # east boundary in degrees
+
+
+class ZoneFamily(NamedTuple):
+    """a time zone type: equal-width time zones, with boundaries precomputed for lookup by longitude"""
+
+    tz_type: str  # time zone type name, such as hour, narrow or longitude
+    step_min: int  # clock minutes between adjacent zones
+    width: float  # width of each zone in degrees of longitude
+    tz_max: int  # number of zones either side of the Prime Meridian
+    name_style: str  # short name format: hours (East08), hhmm (East0815) or degrees (Lon123E)
+    zones: tuple  # ZoneEntry for each zone, in zone index order
+    bounds: tuple  # sorted west boundaries of lookup slots, which include their boundary
+    slot_index: tuple  # zone index of each lookup slot, starting with longitudes west of bounds[0]
+
+    def lon2index(self, longitude: float) -> int:
+        """zone index of a longitude, without range checks"""
+        return self.slot_index[bisect_right(self.bounds, longitude)]
+
+
+# zone families, keyed by time zone type name
+_FAMILIES = {}
+ZONE_FAMILIES = MappingProxyType(_FAMILIES)
+
+# table of all time zones: tuples of ZoneEntry in zone index order, keyed by time zone type name
+_ZONE_TABLE = {}
+ZONE_TABLE = MappingProxyType(_ZONE_TABLE)
+
+
+def tz_type_name(use_lon_tz: bool = False, use_narrow: bool = False, tz_type: str = None) -> str:
+    """get time zone type name from TimeZoneSolar use_lon_tz and use_narrow flags, or a tz_type name"""
+    if tz_type is not None:
+        if use_lon_tz or use_narrow:
+            raise ValueError("_tz_params: tz_type can't be combined with use_lon_tz or use_narrow")
+        if tz_type not in _FAMILIES:
+            raise ValueError(f"_tz_params: unknown time zone type {tz_type}")
+        return tz_type
+    if use_lon_tz and use_narrow:
+        raise ValueError("_tz_params: use_lon_tz and use_narrow can't both be set")
+    if use_lon_tz:
+        return "longitude"
+    return "narrow" if use_narrow else "hour"
+
+
+def tz_max(tz_type: str) -> int:
+    """number of time zones of a type either side of the Prime Meridian"""
+    return _FAMILIES[tz_type].tz_max
+
+
+def _short_name(name_style: str, step_min: int, tz_num: int) -> str:
+    """generate a time zone short name in a name style"""
+    if name_style == "degrees":
+        return f"Lon{abs(tz_num):03d}{'E' if tz_num >= 0 else 'W'}"
+    prefix = "East" if tz_num >= 0 else "West"
+    if name_style == "hhmm":
+        minutes = abs(tz_num) * step_min
+        return f"{prefix}{minutes // 60:02d}{minutes % 60:02d}"
+    return f"{prefix}{abs(tz_num):02d}"
+
+
+def zone_short_name(tz_type: str, tz_num: int) -> str:
+    """
+    generate a time zone short name
+
+    input:
+        tz_type: time zone type name
+        tz_num: signed number of zones east (positive) or west (negative) of the Prime Meridian
+    """
+    family = _FAMILIES[tz_type]
+    return _short_name(family.name_style, family.step_min, tz_num)
+
+
+def _build_zones(tz_type: str, name_style: str, step_min: int, width: float, num_zones: int) -> tuple:
+    """compute table entries for all time zones of a type, in zone index order"""
+    max_longitude = TZSConst.MAX_LONGITUDE_INT
+    zones = []
+    for index in range(2 * num_zones + 1):
+        tz_num = index - num_zones
+        short_name = _short_name(name_style, step_min, tz_num)
+        centerline = tz_num * width
+        zones.append(ZoneEntry(
+            tz_type=tz_type,
+            index=index,
+            name=f"Solar/{short_name}",
+            short_name=short_name,
+            offset_min=tz_num * step_min,
+            longitude=centerline,
+            west_lon=max(centerline - width / 2.0, -max_longitude),
+            east_lon=min(centerline + width / 2.0, max_longitude),
+        ))
+    return tuple(zones)
+
+
+def _build_bounds(width: float, num_zones: int) -> tuple:
+    """
+    compute the sorted lookup boundaries of a zone family, and the zone index of each slot between them
+
+    A longitude within the floating point precision margin of a boundary belongs to the zone farther from the
+    Prime Meridian, as rounding to the nearest zone centerline did. The margin is the precision in units of zone
+    widths, or in degrees for zones narrower than a degree. -180° is the same meridian as +180°, so longitudes up to
+    the precision east of -180° are in the half-wide zone on the east side of the Date Line, like the last slot.
+    """
+    precision = TZSConst.PRECISION_FP
+    margin = precision * max(width, 1)
+    last = 2 * num_zones
+    bounds = [math.nextafter(-TZSConst.MAX_LONGITUDE_INT + precision, math.inf)]
+    for index in range(1, last + 1):
+        edge = (index - num_zones - 0.5) * width
+        if index <= num_zones:
+            # west of the Prime Meridian, the boundary and the margin east of it are in the zone to the west
+            bounds.append(math.nextafter(edge + margin, math.inf))
+        else:
+            bounds.append(edge - margin)
+    return tuple(bounds), (last,) + tuple(range(last + 1))
+
+
+def _make_family(tz_type: str, step_min: int, name_style: str) -> ZoneFamily:
+    """compute a zone family with its zone table and lookup boundaries"""
+    # widths of whole degrees are kept as int, as in TZ_TYPE_WIDTHS
+    width = step_min / TZSConst.MINUTES_PER_DEGREE_LON
+    if width.is_integer():
+        width = int(width)
+    num_zones = int(TZSConst.MAX_LONGITUDE_INT) * TZSConst.MINUTES_PER_DEGREE_LON // step_min
+    bounds, slot_index = _build_bounds(width, num_zones)
+    return ZoneFamily(
+        tz_type=tz_type,
+        step_min=step_min,
+        width=width,
+        tz_max=num_zones,
+        name_style=name_style,
+        zones=_build_zones(tz_type, name_style, step_min, width, num_zones),
+        bounds=bounds,
+        slot_index=slot_index,
+    )
+
+
+def _add_family(family: ZoneFamily) -> ZoneFamily:
+    """
+    register a zone family, returning the one already registered under its name if it's the same
+
+    The zones go into the zone table before the family is published, so a family found in ZONE_FAMILIES by another
+    thread always has its zones in ZONE_TABLE. The family which wins the race is built on the zones which won.
+    """
+    zones = _ZONE_TABLE.setdefault(family.tz_type, family.zones)
+    if zones != family.zones:
+        step_min = zones[1].offset_min - zones[0].offset_min
+        raise ValueError(f"time zone type {family.tz_type} is already defined with a {step_min} minute step")
+    return _FAMILIES.setdefault(family.tz_type, family._replace(zones=zones))
+
+
+def define_family(tz_type: str, step_min: int) -> ZoneFamily:
+    """
+    define a family of time zones at a step of clock minutes, such as 30 or 5, named in hours and minutes
+
+    The step must divide the 720 minutes from the Prime Meridian to the Date Line. Defining a family again with the
+    same step returns the existing one.
+    """
+    if not isinstance(tz_type, str) or not tz_type:
+        raise ValueError("time zone type name must be a non-empty string")
+    if step_min.__class__ is not int or step_min <= 0 or 720 % step_min != 0:
+        raise ValueError(f"time zone step {step_min} must be a whole number of minutes which divides 720")
+    return _add_family(_make_family(tz_type, step_min, "hhmm"))
+
+
+# built-in zone families
+_add_family(_make_family("hour", 60, "hours"))
+_add_family(_make_family("narrow", 15, "hhmm"))
+_add_family(_make_family("longitude", 4, "degrees"))
+
+
+# aliases of the zones centered on the Prime Meridian, which are named for their east side in the table
+NAME_ALIASES = MappingProxyType({"West00": "East00", "West0000": "East0000", "Lon000W": "Lon000E"})
+
+
+def _build_names() -> dict:
+    """compute the name index from the zone table, with aliases and Solar/ prefixed names"""
+    names = {}
+    for tz_type in TZ_TYPE_NAMES:
+        for entry in ZONE_TABLE[tz_type]:
+            names[entry.short_name.lower()] = entry
+    for alias, short_name in NAME_ALIASES.items():
+        names[alias.lower()] = names[short_name.lower()]
+    for short_name, entry in list(names.items()):
+        names["solar/" + short_name] = entry
+    return names
+
+
+# index of time zone names: ZoneEntry keyed by lower-case short name or full name
+ZONE_NAMES = MappingProxyType(_build_names())